@@ -0,0 +1,64 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare AccessMessage build throughput with opcodes given as enum names, lower-case names and integers.
+
+Usage: python -m benchmarks.access_build [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages import AccessMessage
+
+from .corpus import load_corpus
+
+
+def measure(messages, number):
+    # build() replaces opcode names with enums, so each pass works on fresh copies
+    timer = timeit.Timer(lambda: [AccessMessage.build(dict(message)) for message in messages])
+    return number * len(messages) / min(timer.repeat(repeat=5, number=number))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    messages = [AccessMessage.parse(payload) for payloads in load_corpus().values() for payload in payloads]
+
+    variants = dict(
+        int=[dict(message, opcode=int(message.opcode)) for message in messages],
+        name=[dict(message, opcode=message.opcode.name) for message in messages],
+        lower=[dict(message, opcode=message.opcode.name.lower()) for message in messages],
+    )
+
+    print(f"{len(messages)} messages")
+
+    for variant, variant_messages in variants.items():
+        print(f"{variant:<8} {measure(variant_messages, args.number):>10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
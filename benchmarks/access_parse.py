@@ -0,0 +1,106 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare AccessMessage parsing against the previous two-pass approach, which decoded the opcode, rewound the
+stream and let the compiled model message decode the opcode again.
+
+Fast paths (see bluetooth_mesh.messages.fastpath) are disabled, so that only the single opcode decode is
+measured.
+
+Usage: python -m benchmarks.access_parse [--number N]
+"""
+
+import argparse
+import timeit
+
+from construct import Construct, Container, stream_read_entire
+
+from bluetooth_mesh.messages import AccessMessage, _AccessMessage
+from bluetooth_mesh.messages.util import Opcode
+
+from .corpus import load_corpus
+
+
+class _TwoPassAccessMessage(Construct):
+    OPCODE = Opcode()
+
+    def __init__(self):
+        super().__init__()
+        self._opcodes = {}
+        for opcode_class, message in AccessMessage.OPCODES.items():
+            compiled = message.compile()
+            for opcode in opcode_class:
+                self._opcodes[opcode] = opcode, compiled
+
+    def _parse(self, stream, context, path):
+        opcode = self.OPCODE._parse(stream, context, path)
+
+        try:
+            opcode, message = self._opcodes[opcode]
+        except KeyError:
+            return Container(opcode=opcode, params=stream_read_entire(stream))
+
+        stream.seek(0)
+        parsed = message._parse(stream, context, path)
+        parsed.opcode = opcode
+        return parsed
+
+
+def measure(construct, payloads, number):
+    timer = timeit.Timer(lambda: [construct.parse(payload) for payload in payloads])
+    return min(timer.repeat(repeat=5, number=number)) / (number * len(payloads))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=200, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    two_pass = _TwoPassAccessMessage()
+    one_pass = _AccessMessage(fastpaths={})
+    one_pass.warmup()
+    corpus = load_corpus()
+
+    print(f"{'model':<40} {'payloads':>8} {'two pass':>10} {'one pass':>10} {'saving':>8}")
+
+    for opcode_class in AccessMessage.OPCODES:
+        payloads = corpus.get(opcode_class)
+        if not payloads:
+            print(f"{opcode_class.__name__:<40} {'-':>8}")
+            continue
+
+        for payload in payloads:
+            assert two_pass.parse(payload) == one_pass.parse(payload), payload.hex()
+
+        before = measure(two_pass, payloads, args.number)
+        after = measure(one_pass, payloads, args.number)
+
+        print(
+            f"{opcode_class.__name__:<40} {len(payloads):>8} "
+            f"{before * 1e6:>8.2f}us {after * 1e6:>8.2f}us {(before - after) / before:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
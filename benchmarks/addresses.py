@@ -0,0 +1,97 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare classifying and partitioning subscription addresses with config.ADDRESS_TYPES table against
+the previous chain of comparisons, and parsing address lists into lists and AddressSets against the
+previous GreedyRange.
+
+Usage: python -m benchmarks.addresses [--number N]
+"""
+
+import argparse
+import random
+import timeit
+
+from construct import GreedyRange, Int16ul, Struct
+
+from bluetooth_mesh.messages.config import (
+    AddressSet,
+    AddressType,
+    ConfigSIGModelSubscriptionList,
+    _address_type_arithmetic,
+    get_address_type,
+)
+
+LEGACY = Struct(*ConfigSIGModelSubscriptionList.subcons[:-1], "addresses" / GreedyRange(Int16ul))
+
+
+def legacy_partition(addresses):
+    partition = {}
+    for address in addresses:
+        partition.setdefault(_address_type_arithmetic(address), []).append(address)
+    return partition
+
+
+def variants(addresses, data):
+    address_set = AddressSet(addresses)
+
+    return dict(
+        classify=dict(
+            legacy=lambda: [_address_type_arithmetic(address) for address in addresses],
+            table=lambda: [get_address_type(address) for address in addresses],
+        ),
+        partition=dict(
+            legacy=lambda: legacy_partition(addresses),
+            address_set=address_set.partition,
+            groups=lambda: address_set.select(AddressType.GROUP, AddressType.VIRTUAL),
+        ),
+        parse=dict(
+            legacy=lambda: LEGACY.parse(data),
+            list=lambda: ConfigSIGModelSubscriptionList.parse(data),
+            address_set=lambda: ConfigSIGModelSubscriptionList.parse(data, address_set=True),
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="repetitions of each operation")
+    args = parser.parse_args()
+
+    print(f"{'count':>6} {'operation':<10} {'variant':<12} {'time':>12}")
+
+    for count in (10, 100, 1000):
+        addresses = random.Random(count).choices(range(0x10000), k=count)
+        data = ConfigSIGModelSubscriptionList.build(
+            dict(status=0, element_address=1, model=dict(model_id=0x1000), addresses=addresses)
+        )
+
+        for operation, funcs in variants(addresses, data).items():
+            for variant, func in funcs.items():
+                elapsed = min(timeit.repeat(func, repeat=5, number=args.number))
+                print(f"{count:>6} {operation:<10} {variant:<12} {elapsed / args.number * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare AccessMessage against generated struct based codecs from bluetooth_mesh.messages.aot, on messages from
+the test corpus that have a generated codec.
+
+Usage: python -m benchmarks.aot [--number N]
+"""
+
+import argparse
+import timeit
+from itertools import chain
+
+from bluetooth_mesh.messages import AccessMessage, aot
+from bluetooth_mesh.messages.util import Opcode
+
+from .corpus import load_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    payloads = [
+        payload for payload in chain(*load_corpus().values()) if Opcode.unpack(payload)[0] in aot.CODECS.PARSE
+    ]
+    messages = [AccessMessage.parse(payload) for payload in payloads]
+
+    variants = dict(
+        parse=lambda: [AccessMessage.parse(payload) for payload in payloads],
+        aot_parse=lambda: [aot.parse(payload) for payload in payloads],
+        build=lambda: [AccessMessage.build(message) for message in messages],
+        aot_build=lambda: [aot.build(message) for message in messages],
+    )
+
+    print(f"{len(payloads)} messages")
+    for variant, func in variants.items():
+        elapsed = min(timeit.repeat(func, repeat=5, number=args.number))
+        print(f"{variant:<10} {args.number * len(payloads) / elapsed:>12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare assembling corpus messages into one preallocated buffer by copying results of AccessMessage.build()
+against building them in place with BufferWriter, separately for messages with and without a fast path.
+
+Usage: python -m benchmarks.build_into [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages import AccessMessage, BufferWriter
+
+from .corpus import load_corpus
+
+
+def copy_built(messages, buffer):
+    offset = 0
+    for message in messages:
+        data = AccessMessage.build(message)
+        buffer[offset : offset + len(data)] = data
+        offset += len(data)
+
+
+def write_in_place(messages, writer):
+    writer.reset()
+    for message in messages:
+        writer.write(message)
+
+
+def measure(func, messages, target, number):
+    elapsed = min(timeit.repeat(lambda: func(messages, target), repeat=5, number=number))
+    return number * len(messages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    messages = [AccessMessage.parse(payload) for payloads in load_corpus().values() for payload in payloads]
+    groups = dict(
+        fastpath=[message for message in messages if message.opcode in AccessMessage._fastpaths],
+        construct=[message for message in messages if message.opcode not in AccessMessage._fastpaths],
+    )
+
+    buffer = bytearray(sum(len(AccessMessage.build(message)) for message in messages))
+
+    print(f"{'messages':<10} {'count':>6} {'build':>14} {'build_into':>14}")
+
+    with BufferWriter(buffer) as writer:
+        for group, group_messages in groups.items():
+            built = measure(copy_built, group_messages, buffer, args.number)
+            written = measure(write_in_place, group_messages, writer, args.number)
+            print(f"{group:<10} {len(group_messages):>6} {built:>8.0f} msg/s {written:>8.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
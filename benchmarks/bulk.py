@@ -0,0 +1,76 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure throughput of bluetooth_mesh.messages.bulk.decode() with a growing number of worker processes, in both
+list and columnar output modes, against AccessMessage.parse_list() in a single process.
+
+Worker pools are started and warmed up before measurement, so process startup and compilation of parsers are
+not included.
+
+Usage: python -m benchmarks.bulk [--count N] [--workers N ...]
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, cycle, islice
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.bulk import decode
+
+from .corpus import load_corpus
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--count", type=int, default=200000, help="number of messages to decode")
+    parser.add_argument("--workers", type=int, action="append", help="worker counts, default: 1 2 4 8 16")
+    args = parser.parse_args()
+
+    corpus = list(chain(*load_corpus().values()))
+    payloads = list(islice(cycle(corpus), args.count))
+
+    AccessMessage.warmup()
+    elapsed = measure(lambda: AccessMessage.parse_list(payloads))
+    print(f"{'parse_list':<16} {args.count / elapsed:>12.0f} msg/s")
+
+    for workers in args.workers or [1, 2, 4, 8, 16]:
+        with ProcessPoolExecutor(workers) as executor:
+            decode(corpus * workers, shard_size=len(corpus), executor=executor)
+
+            for columnar in (False, True):
+                elapsed = measure(partial(decode, payloads, columnar=columnar, executor=executor))
+                variant = f"{workers} {'columnar' if columnar else 'list'}"
+                print(f"{variant:<16} {args.count / elapsed:>12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
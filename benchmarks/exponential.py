@@ -0,0 +1,82 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare table based encoding and decoding of logarithmic fields (heartbeat count and period, sensing
+duration) against arithmetic, on all their valid encodings.
+
+Usage: python -m benchmarks.exponential [--number N]
+"""
+
+import argparse
+import timeit
+
+from construct import Int8ul
+
+from bluetooth_mesh.messages.properties import TimeExponential8Validator
+from bluetooth_mesh.messages.util import LogAdapter
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=200, help="passes over encodings per repetition")
+    args = parser.parse_args()
+
+    log = LogAdapter(Int8ul, max_value=0x11, infinity=True)
+    log_encoded = [obj for obj in range(0x12)] + [0xFF]
+    log_decoded = [log._decode(obj, None, None) for obj in log_encoded]
+
+    exponential = TimeExponential8Validator(Int8ul)
+    exponential_encoded = list(range(0x100))
+    exponential_decoded = [exponential._decode(obj, None, None) for obj in exponential_encoded]
+
+    variants = dict(
+        log_decode=(log_encoded, lambda: [log._decode(obj, None, None) for obj in log_encoded]),
+        log_decode_arithmetic=(log_encoded, lambda: [log._decode_arithmetic(obj) for obj in log_encoded]),
+        log_encode=(log_decoded, lambda: [log._encode(obj, None, None) for obj in log_decoded]),
+        log_encode_arithmetic=(log_decoded, lambda: [log._encode_arithmetic(obj) for obj in log_decoded]),
+        exp_decode=(
+            exponential_encoded,
+            lambda: [exponential._decode(obj, None, None) for obj in exponential_encoded],
+        ),
+        exp_decode_arithmetic=(
+            exponential_encoded,
+            lambda: [round(pow(1.1, obj - 64), 4) if obj else 0 for obj in exponential_encoded],
+        ),
+        exp_encode=(
+            exponential_decoded,
+            lambda: [exponential._encode(obj, None, None) for obj in exponential_decoded],
+        ),
+        exp_encode_arithmetic=(
+            exponential_decoded,
+            lambda: [exponential._encode_arithmetic(obj) for obj in exponential_decoded],
+        ),
+    )
+
+    for variant, (values, func) in variants.items():
+        elapsed = min(timeit.repeat(func, repeat=5, number=args.number))
+        print(f"{variant:<22} {elapsed / args.number / len(values) * 1e9:>8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare parsing and building messages with and without hand written fast paths, per opcode, on messages from
+the test corpus that have a fast path.
+
+Usage: python -m benchmarks.fastpath [--number N]
+"""
+
+import argparse
+import timeit
+from collections import defaultdict
+from itertools import chain
+
+from bluetooth_mesh.messages import AccessMessage, _AccessMessage
+from bluetooth_mesh.messages.fastpath import FASTPATHS
+from bluetooth_mesh.messages.util import Opcode
+
+from .corpus import load_corpus
+
+
+def rate(func, count, number):
+    return number * count / min(timeit.repeat(func, repeat=5, number=number))
+
+
+def measure(construct, payloads, number):
+    messages = [construct.parse(payload) for payload in payloads]
+
+    return (
+        rate(lambda: [construct.parse(payload) for payload in payloads], len(payloads), number),
+        rate(lambda: [AccessMessage.parse(payload) for payload in payloads], len(payloads), number),
+        rate(lambda: [construct.build(message) for message in messages], len(payloads), number),
+        rate(lambda: [AccessMessage.build(message) for message in messages], len(payloads), number),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=200, help="passes over messages per repetition")
+    args = parser.parse_args()
+
+    construct = _AccessMessage(fastpaths={})
+
+    payloads = defaultdict(list)
+    for payload in chain(*load_corpus().values()):
+        opcode, _offset = Opcode.unpack(payload)
+        if opcode in FASTPATHS:
+            payloads[opcode].append(payload)
+
+    print(f"{'opcode':<44} {'parse':>10} {'fast':>10} {'':>6} {'build':>10} {'fast':>10} {'':>6}")
+
+    for opcode in FASTPATHS:
+        if opcode not in payloads:
+            continue
+
+        parse, fast_parse, build, fast_build = measure(construct, payloads[opcode], args.number)
+
+        print(
+            f"{opcode.name:<44} {parse:>10.0f} {fast_parse:>10.0f} {fast_parse / parse:>5.1f}x "
+            f"{build:>10.0f} {fast_build:>10.0f} {fast_build / build:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure time it takes a fresh interpreter to import bluetooth_mesh.messages, with parsers compiled on first
+use (the default) and with all of them compiled during import by AccessMessage.warmup(), both with and without
+the compiled parser cache.
+
+First parse uses a message without a hand written fast path, so it includes compiling (or loading from
+cache) parsers of its model.
+
+Usage: python -m benchmarks.import_time [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+from bluetooth_mesh.messages import AccessMessage
+{warmup}
+imported = time.perf_counter()
+AccessMessage.parse(bytes.fromhex("{payload}"))
+print(imported - start, time.perf_counter() - imported)
+"""
+
+# Sensor Get
+PAYLOAD = "82310200"
+
+VARIANTS = dict(
+    lazy="",
+    warmup="AccessMessage.warmup()",
+)
+
+
+def measure(warmup, env):
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT.format(warmup=warmup, payload=PAYLOAD)], text=True, env=env
+    )
+    return [float(i) for i in output.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="number of interpreters started per variant")
+    args = parser.parse_args()
+
+    from bluetooth_mesh.messages import AccessMessage
+
+    payload = bytes.fromhex(PAYLOAD)
+    if payload[0] << 8 | payload[1] in AccessMessage._fastpaths:
+        parser.error("%s has a fast path, first parse wouldn't compile anything" % PAYLOAD)
+
+    print(f"{'variant':<8} {'cache':<8} {'import':>10} {'first parse':>12}")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        caches = dict(
+            off=dict(os.environ, BLUETOOTH_MESH_MESSAGES_NO_CACHE="1"),
+            on=dict(os.environ, BLUETOOTH_MESH_MESSAGES_CACHE_DIR=cache_dir),
+        )
+
+        for variant, warmup in VARIANTS.items():
+            for cache, env in caches.items():
+                imported, first_parse = map(
+                    min, zip(*(measure(warmup, env) for _ in range(args.repeat)), strict=True)
+                )
+                print(f"{variant:<8} {cache:<8} {imported * 1e3:>8.1f}ms {first_parse * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure cost of per-opcode instrumentation: parse and build the test corpus without any instrumentation check
+(calling the inner functions directly), with instrumentation disabled (the default) and enabled.
+
+Usage: python -m benchmarks.instrumentation [--number N]
+"""
+
+import argparse
+import timeit
+from itertools import chain
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.instrumentation import Instrumentation
+
+from .corpus import load_corpus
+
+
+def rate(func, items, number):
+    def run_all():
+        for item in items:
+            func(item)
+
+    return number * len(items) / min(timeit.repeat(run_all, repeat=5, number=number))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=10, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    payloads = list(chain(*load_corpus().values()))
+    messages = AccessMessage.parse_list(payloads)
+    AccessMessage.warmup()
+
+    operations = dict(
+        parse=(payloads, AccessMessage.parse, lambda payload: AccessMessage._parse_data(payload, {})),
+        build=(messages, AccessMessage.build, lambda message: AccessMessage._build_data(message, {})),
+    )
+
+    print(f"{'operation':<12} {'unchecked':>16} {'disabled':>16} {'enabled':>16} {'disabled cost':>14}")
+
+    for operation, (items, func, unchecked) in operations.items():
+        AccessMessage.instrumentation = None
+        baseline = rate(unchecked, items, args.number)
+        disabled = rate(func, items, args.number)
+
+        AccessMessage.instrumentation = Instrumentation()
+        enabled = rate(func, items, args.number)
+        AccessMessage.instrumentation = None
+
+        print(
+            f"{operation:<12} {baseline:>10.0f} msg/s {disabled:>10.0f} msg/s {enabled:>10.0f} msg/s"
+            f" {(baseline / disabled - 1) * 100:>13.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure parsing and building Config messages carrying key indices, as sent in bulk while configuring nodes.
+
+Usage: python -m benchmarks.key_index [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.config import ConfigOpcode, StatusCode
+
+KEY = bytes(range(16))
+
+MESSAGES = [
+    dict(opcode=ConfigOpcode.CONFIG_NETKEY_ADD, params=dict(net_key_index=0x123, net_key=KEY)),
+    dict(
+        opcode=ConfigOpcode.CONFIG_NETKEY_STATUS, params=dict(status=StatusCode.SUCCESS, net_key_index=0x123)
+    ),
+    dict(
+        opcode=ConfigOpcode.CONFIG_APPKEY_ADD,
+        params=dict(net_key_index=0x123, app_key_index=0x456, app_key=KEY),
+    ),
+    dict(
+        opcode=ConfigOpcode.CONFIG_APPKEY_STATUS,
+        params=dict(status=StatusCode.SUCCESS, net_key_index=0x123, app_key_index=0x456),
+    ),
+    dict(
+        opcode=ConfigOpcode.CONFIG_MODEL_APP_BIND,
+        params=dict(element_address=0x0001, app_key_index=0x456, model=dict(model_id=0x1000)),
+    ),
+    dict(
+        opcode=ConfigOpcode.CONFIG_MODEL_APP_STATUS,
+        params=dict(
+            status=StatusCode.SUCCESS,
+            element_address=0x0001,
+            app_key_index=0x456,
+            model=dict(model_id=0x1000),
+        ),
+    ),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=2000, help="passes over messages per repetition")
+    args = parser.parse_args()
+
+    payloads = [AccessMessage.build(message) for message in MESSAGES]
+
+    variants = dict(
+        parse=lambda: [AccessMessage.parse(payload) for payload in payloads],
+        build=lambda: [AccessMessage.build(message) for message in MESSAGES],
+    )
+
+    for variant, func in variants.items():
+        elapsed = min(timeit.repeat(func, repeat=5, number=args.number))
+        print(f"{variant:<8} {args.number * len(payloads) / elapsed:>12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare packing and unpacking lists of 10, 100 and 1000 key indices with config.KeyIndices against the
+previous GreedyRange based construct.
+
+Usage: python -m benchmarks.key_indices [--number N]
+"""
+
+import argparse
+import timeit
+
+from construct import BitsInteger, BitStruct, GreedyRange, Padding, Select
+
+from bluetooth_mesh.messages.config import KeyIndices
+from bluetooth_mesh.messages.util import Reversed
+
+LEGACY = GreedyRange(
+    Select(
+        Reversed(BitStruct("first" / BitsInteger(12), "second" / BitsInteger(12))),
+        Reversed(BitStruct(Padding(4), "last" / BitsInteger(12))),
+    )
+)
+
+
+def legacy_parse(data):
+    indices = []
+    for item in LEGACY.parse(data):
+        indices += [item["last"]] if "last" in item else [item["first"], item["second"]]
+    return sorted(indices)
+
+
+def legacy_build(indices):
+    indices = sorted(indices)
+    items = []
+    while len(indices) > 1:
+        items += [dict(first=indices.pop(0), second=indices.pop(0))]
+    if indices:
+        items += [dict(last=indices.pop())]
+    return LEGACY.build(items)
+
+
+def variants(data, indices):
+    return dict(
+        legacy=(lambda: legacy_parse(data), lambda: legacy_build(indices)),
+        packed=(lambda: KeyIndices.parse(data), lambda: KeyIndices.build(indices)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="repetitions of each operation")
+    args = parser.parse_args()
+
+    print(f"{'count':>6} {'variant':<8} {'parse':>12} {'build':>12}")
+
+    for count in (10, 100, 1000):
+        indices = list(range(0, count * 3, 3))
+        data = KeyIndices.build(indices)
+
+        for variant, (parse, build) in variants(data, indices).items():
+            parse_time, build_time = (
+                min(timeit.repeat(func, repeat=5, number=args.number)) for func in (parse, build)
+            )
+            print(
+                f"{count:>6} {variant:<8} {parse_time / args.number * 1e6:>10.1f}us "
+                f"{build_time / args.number * 1e6:>10.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
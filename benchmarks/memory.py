@@ -0,0 +1,223 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure memory footprint of parsed messages, per opcode (and sub-opcode of vendor models) in the test corpus.
+
+Payloads are parsed with tracemalloc running and the garbage collector stopped, and the results are kept
+alive: total is the growth of traced memory per message, once garbage is collected. Objects reachable from
+each message, but not from another message parsed from the same payload, are then sized with sys.getsizeof()
+and split into:
+
+    containers  Container dicts, with their key order lists (or typed records, see below)
+    enums       enum members; these are shared singletons, so they only count when parsing creates new ones
+    floats      float values
+    leftovers   whatever hangs off keys starting with an underscore, e.g. _io streams and parent contexts
+    other       everything else: ints, strings, bytes, lists...
+
+Parse contexts refer to each other, so they are not freed right away, but stay around as garbage until the
+next collection. This is reported separately, as garbage.
+
+Results are written as JSON. A baseline for the current version is kept in benchmarks/memory.json, so that
+memory-reduction work can be compared against it. With --records, messages are parsed into typed records
+(see bluetooth_mesh.messages.records) instead of Containers, to compare them with that baseline.
+
+Usage: python -m benchmarks.memory [--copies N] [--records] [--output FILE] [--baseline FILE] [--model NAME] ...
+"""
+
+import argparse
+import enum
+import gc
+import json
+import sys
+import tracemalloc
+import types
+from pathlib import Path
+
+from construct import Construct, Container
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.records import Record
+
+from .suite import opcode_corpus
+
+BASELINE = Path(__file__).parent / "memory.json"
+
+CATEGORIES = ("containers", "enums", "floats", "leftovers", "other")
+COLUMNS = ("total", *CATEGORIES, "garbage")
+
+
+# not looked into: shared by all messages anyway, and lead to the rest of the interpreter
+OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, Construct)
+
+
+def category(obj):
+    if isinstance(obj, dict | Record):
+        return "containers"
+
+    if isinstance(obj, enum.Enum):
+        return "enums"
+
+    if isinstance(obj, float):
+        return "floats"
+
+    return "other"
+
+
+def reachable(message):
+    """
+    Objects reachable from a parsed message, as {id: (object, category)}.
+    """
+    found = {}
+    stack = [(message, None)]
+
+    while stack:
+        obj, forced = stack.pop()
+        if id(obj) in found or isinstance(obj, OPAQUE):
+            continue
+
+        found[id(obj)] = obj, forced or category(obj)
+        if isinstance(obj, enum.Enum):
+            continue
+
+        if isinstance(obj, dict):
+            for key, value in dict.items(obj):
+                stack.append((key, forced))
+                stack.append((value, "leftovers" if isinstance(key, str) and key.startswith("_") else forced))
+
+            if isinstance(obj, Container):
+                # key order is kept in a separate list
+                stack.append((obj.__keys_order__, forced or "containers"))
+        else:
+            stack.extend((referent, forced) for referent in gc.get_referents(obj))
+
+    return found
+
+
+def breakdown(message, copy):
+    """
+    Sizes of objects owned by a message, by category. Objects also reachable from a copy parsed from the same
+    payload (e.g. enum members, field names, small integers) are shared, so they don't count.
+    """
+    sizes = dict.fromkeys(CATEGORIES, 0)
+    shared = reachable(copy)
+
+    for key, (obj, name) in reachable(message).items():
+        if key not in shared:
+            sizes[name] += sys.getsizeof(obj)
+
+    return sizes
+
+
+def measure(payloads, copies, **contextkw):
+    # first parse may create long lived objects, e.g. record classes
+    for payload in payloads:
+        AccessMessage.parse(payload, **contextkw)
+
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        messages = [AccessMessage.parse(payload, **contextkw) for payload in payloads * copies]
+        collected, _ = tracemalloc.get_traced_memory()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    sizes = dict.fromkeys(CATEGORIES, 0)
+    for message, copy in zip(messages, messages[len(payloads) :], strict=False):
+        for name, size in breakdown(message, copy).items():
+            sizes[name] += size
+
+    count = len(messages)
+    pairs = count - len(payloads)
+    return dict(
+        total=round((after - before) / count, 1),
+        **{name: round(size / pairs, 1) for name, size in sizes.items()},
+        garbage=round((collected - after) / count, 1),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--copies", type=int, default=10, help="copies of each payload parsed")
+    parser.add_argument("--records", action="store_true", help="parse into typed records")
+    parser.add_argument(
+        "--output", help="JSON file to write, e.g. benchmarks/memory.json to update the baseline"
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="JSON file to compare totals with")
+    parser.add_argument("--model", action="append", help="opcode class name, e.g. ConfigOpcode")
+    args = parser.parse_args()
+
+    if args.copies < 2:
+        parser.error("at least 2 copies are needed to tell shared objects apart")
+
+    corpus = opcode_corpus(args.model)
+    AccessMessage.warmup()
+
+    try:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    except FileNotFoundError:
+        baseline = dict(mean=None, opcodes={})
+
+    print(f"{'opcode':<56}" + "".join(f"{column:>11}" for column in COLUMNS) + f"{'vs baseline':>12}")
+
+    def report(name, result, reference):
+        print(
+            f"{name:<56}"
+            + "".join(f"{result[column]:>11.0f}" for column in COLUMNS)
+            + (f"{result['total'] / reference['total'] - 1:>+12.1%}" if reference else f"{'-':>12}")
+        )
+
+    results = {}
+    for name, (_model, payloads, _messages) in sorted(corpus.items()):
+        results[name] = measure(payloads, args.copies, records=args.records)
+        report(name, results[name], baseline["opcodes"].get(name))
+
+    summary = {
+        column: sum(result[column] for result in results.values()) / len(results) for column in COLUMNS
+    }
+    report("mean", summary, baseline["mean"] if not args.model else None)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(
+                dict(
+                    python=sys.version.split()[0],
+                    copies=args.copies,
+                    records=args.records,
+                    mean=summary,
+                    opcodes=results,
+                ),
+                output,
+                indent=2,
+            )
+            output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare parsing GENERIC_ONOFF_SET parameters with NamedSelect, which skips variants that do not fit in the
+remaining data, against trying each variant in turn with a plain Select.
+
+Usage: python -m benchmarks.named_select [--number N]
+"""
+
+import argparse
+import functools
+import timeit
+
+from construct import Select
+
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffSet
+
+PAYLOADS = dict(
+    minimal=bytes.fromhex("0122"),
+    optional=bytes.fromhex("0031323c"),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=100000, help="parses per repetition")
+    args = parser.parse_args()
+
+    variants = dict(
+        select=Select(*GenericOnOffSet.subcon.subcons),
+        named=GenericOnOffSet,
+    )
+
+    print(f"{'payload':<10} {'variant':<8} {'parse':>10}")
+
+    for payload, data in PAYLOADS.items():
+        for variant, construct in variants.items():
+            elapsed = min(
+                timeit.repeat(functools.partial(construct.parse, data), repeat=5, number=args.number)
+            )
+            print(f"{payload:<10} {variant:<8} {elapsed / args.number * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare parsing a batch of access payloads one by one against AccessMessage.parse_list().
+
+Usage: python -m benchmarks.parse_many [--size N]
+"""
+
+import argparse
+import timeit
+from itertools import chain, cycle, islice
+
+from bluetooth_mesh.messages import AccessMessage
+
+from .corpus import load_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=10000, help="number of payloads in a batch")
+    args = parser.parse_args()
+
+    batch = list(islice(cycle(chain(*load_corpus().values())), args.size))
+
+    variants = dict(
+        parse=lambda: [AccessMessage.parse(payload) for payload in batch],
+        parse_list=lambda: AccessMessage.parse_list(batch),
+    )
+
+    for variant, func in variants.items():
+        elapsed = min(timeit.repeat(func, repeat=3, number=1))
+        print(f"{variant:<12} {args.size / elapsed:>10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Replay the test corpus through AccessMessage.parse() until a given number of messages has been parsed, then
+report parse throughput and peak resident memory of the process.
+
+Usage: python -m benchmarks.replay [--count N] [--model NAME ...]
+"""
+
+import argparse
+import resource
+import time
+from itertools import chain, cycle, islice
+
+from bluetooth_mesh.messages import AccessMessage
+
+from .corpus import load_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--count", type=int, default=1000000, help="number of messages to parse")
+    parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        help="replay only messages of given opcode class, e.g. SensorOpcode",
+    )
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    payloads = list(
+        chain(
+            *(
+                payloads
+                for model, payloads in corpus.items()
+                if not args.model or model.__name__ in args.model
+            )
+        )
+    )
+
+    AccessMessage.warmup(model for model in corpus if not args.model or model.__name__ in args.model)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    for payload in islice(cycle(payloads), args.count):
+        AccessMessage.parse(payload)
+    elapsed = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"messages      {args.count:>12}")
+    print(f"throughput    {args.count / elapsed:>12.0f} msg/s")
+    print(f"peak rss      {peak / 1024:>10.1f}MB")
+    print(f"replay growth {(peak - baseline) / 1024:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
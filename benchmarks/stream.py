@@ -0,0 +1,88 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Measure throughput of PayloadReader over an in-memory stream carrying the test corpus as length-prefixed
+frames, decoding inline and in thread and process executors, against plain AccessMessage.parse_list().
+
+Usage: python -m benchmarks.stream [--number N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.stream import PayloadReader
+
+from .corpus import load_corpus
+
+
+async def consume(data, **kwargs):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+
+    async with PayloadReader(reader, **kwargs) as payload_reader:
+        async for _frame in payload_reader:
+            pass
+
+
+def rate(data, count, **kwargs):
+    start = time.perf_counter()
+    asyncio.run(consume(data, **kwargs))
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=20, help="copies of the corpus in the stream")
+    parser.add_argument("--workers", type=int, default=2, help="executor workers")
+    args = parser.parse_args()
+
+    payloads = list(chain(*load_corpus().values())) * args.number
+    data = b"".join(struct.pack("<H", len(payload)) + payload for payload in payloads)
+    AccessMessage.warmup()
+
+    start = time.perf_counter()
+    AccessMessage.parse_list(payloads)
+    print(f"{'parse_list':<24} {len(payloads) / (time.perf_counter() - start):>8.0f} msg/s")
+
+    print(f"{'inline':<24} {rate(data, len(payloads), offload_threshold=len(payloads)):>8.0f} msg/s")
+
+    with ThreadPoolExecutor(args.workers) as executor:
+        print(
+            f"{'threads':<24} {rate(data, len(payloads), executor=executor, offload_threshold=0):>8.0f} msg/s"
+        )
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        print(
+            f"{'processes':<24} {rate(data, len(payloads), executor=executor, offload_threshold=0):>8.0f} msg/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Benchmark suite covering every opcode found in the test corpus (see corpus module).
+
+For each opcode (and sub-opcode of vendor models) it measures parse and build rates (messages and payload
+bytes per second) and memory retained per message: number of allocated blocks (sys.getallocatedblocks()) and
+bytes (tracemalloc) still alive while the results are kept. Results are written as JSON, so that runs on
+different versions of the library (or of its dependencies) can be compared:
+
+    python -m benchmarks.suite run --output before.json
+    ... upgrade ...
+    python -m benchmarks.suite run --output after.json
+    python -m benchmarks.suite compare before.json after.json
+
+Compare exits with status 1 if any opcode got slower (or allocates more) than given threshold.
+
+Usage: python -m benchmarks.suite run [--number N] [--output FILE] [--model NAME] ...
+       python -m benchmarks.suite compare BEFORE AFTER [--threshold FRACTION]
+"""
+
+import argparse
+import enum
+import gc
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from importlib.metadata import version
+
+from bluetooth_mesh.messages import AccessMessage
+
+from .corpus import load_corpus
+
+# metrics compared between runs, and whether higher values are better
+METRICS = {
+    "parse_ops": True,
+    "build_ops": True,
+    "parse_blocks": False,
+    "build_blocks": False,
+}
+
+
+def label(message):
+    """
+    Opcode name of a parsed message, followed by sub-opcode name for vendor models that have them, e.g.
+    SILVAIR_DEBUG.UPTIME_STATUS
+
+    Only looks at the parsed Container, so that the suite runs on older versions of the library too.
+    """
+    opcode = message["opcode"]
+    params = message.get(opcode.name.lower())
+    subopcode = params.get("subopcode") if isinstance(params, dict) else None
+    if isinstance(subopcode, enum.Enum):
+        return f"{opcode.name}.{subopcode.name}"
+
+    return opcode.name
+
+
+def opcode_corpus(models=None):
+    """
+    Group corpus payloads by opcode (and vendor sub-opcode), returning {label: (model, payloads, messages)}.
+    """
+    corpus = {}
+
+    for opcode_class, payloads in load_corpus().items():
+        if models and opcode_class.__name__ not in models:
+            continue
+
+        for payload in payloads:
+            message = AccessMessage.parse(payload)
+            _model, opcode_payloads, messages = corpus.setdefault(label(message), (opcode_class, [], []))
+            opcode_payloads.append(payload)
+            messages.append(message)
+
+    return corpus
+
+
+def rate(func, items, number):
+    def run_all():
+        for item in items:
+            func(item)
+
+    return number * len(items) / min(timeit.repeat(run_all, repeat=3, number=number))
+
+
+def retained(func, items, copies=20):
+    """
+    Memory blocks and bytes per message retained by results of func.
+    """
+    items = items * copies
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        blocks = sys.getallocatedblocks()
+        before, _ = tracemalloc.get_traced_memory()
+        results = [func(item) for item in items]
+        after, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    del results
+    # tracemalloc keeps its own bookkeeping in allocated blocks, so it is only an approximation
+    return blocks / len(items), (after - before) / len(items)
+
+
+def measure(payloads, messages, number):
+    parse_blocks, parse_bytes = retained(AccessMessage.parse, payloads)
+    build_blocks, build_bytes = retained(AccessMessage.build, messages)
+    parse_ops = rate(AccessMessage.parse, payloads, number)
+    build_ops = rate(AccessMessage.build, messages, number)
+    size = sum(map(len, payloads)) / len(payloads)
+
+    return dict(
+        payloads=len(payloads),
+        payload_size=size,
+        parse_ops=parse_ops,
+        parse_bytes_per_second=parse_ops * size,
+        parse_blocks=parse_blocks,
+        parse_memory=parse_bytes,
+        build_ops=build_ops,
+        build_bytes_per_second=build_ops * size,
+        build_blocks=build_blocks,
+        build_memory=build_bytes,
+    )
+
+
+def run(args):
+    corpus = opcode_corpus(args.model)
+
+    # older versions compile all parsers at import
+    warmup = getattr(AccessMessage, "warmup", None)
+    if warmup is not None:
+        warmup()
+
+    results = {}
+    for name, (model, payloads, messages) in sorted(corpus.items()):
+        results[name] = dict(model=model.__name__, **measure(payloads, messages, args.number))
+        parse_ops, build_ops = results[name]["parse_ops"], results[name]["build_ops"]
+        print(f"{name:<56} {parse_ops:>8.0f} parse/s {build_ops:>8.0f} build/s", file=sys.stderr)
+
+    measured = {name.split(".")[0] for name in corpus}
+    report = dict(
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        construct=version("construct"),
+        bluetooth_mesh_messages=version("bluetooth-mesh-messages"),
+        number=args.number,
+        missing=sorted(
+            opcode.name
+            for opcode_class in AccessMessage.OPCODES
+            if not args.model or opcode_class.__name__ in args.model
+            for opcode in opcode_class
+            if opcode.name not in measured
+        ),
+        opcodes=results,
+    )
+
+    with open(args.output, "w") if args.output != "-" else sys.stdout as output:
+        json.dump(report, output, indent=2)
+        output.write("\n")
+
+
+def compare(args):
+    with open(args.before) as before_file, open(args.after) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+
+    print(f"{'opcode':<56}" + "".join(f"{metric:>14}" for metric in METRICS))
+
+    regressions = 0
+    for name in sorted(before["opcodes"].keys() & after["opcodes"].keys()):
+        regressed = []
+        line = f"{name:<56}"
+
+        for metric, higher_is_better in METRICS.items():
+            old, new = before["opcodes"][name][metric], after["opcodes"][name][metric]
+            relative = new / old - 1 if old else 0.0
+            line += f"{relative:>+14.1%}"
+
+            if (-relative if higher_is_better else relative) > args.threshold:
+                regressed.append(metric)
+
+        regressions += bool(regressed)
+        print(line + ("  <-- " + ", ".join(regressed) if regressed else ""))
+
+    for side, names in (
+        ("before", before["opcodes"].keys() - after["opcodes"].keys()),
+        ("after", after["opcodes"].keys() - before["opcodes"].keys()),
+    ):
+        if names:
+            print(f"{len(names)} opcodes measured only {side}")
+
+    print(f"{regressions} opcodes regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark every opcode in the corpus")
+    run_parser.add_argument("--number", type=int, default=20, help="passes over payloads per repetition")
+    run_parser.add_argument("--output", default="-", help="JSON file to write, stdout by default")
+    run_parser.add_argument("--model", action="append", help="opcode class name, e.g. ConfigOpcode")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON results")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change reported as regression"
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
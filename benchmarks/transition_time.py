@@ -0,0 +1,60 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare table based transition time encoding and decoding against arithmetic, on all representable durations.
+
+Usage: python -m benchmarks.transition_time [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages.generics import TransitionTime, TransitionTimeAdapter
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=200, help="passes over durations per repetition")
+    args = parser.parse_args()
+
+    adapter = TransitionTimeAdapter(TransitionTime, allow_unknown=True)
+    durations = adapter.durations
+    encoded = [adapter._encode(duration, None, None) for duration in durations]
+
+    variants = dict(
+        decode=lambda: [adapter._decode(obj, None, None) for obj in encoded],
+        decode_arithmetic=lambda: [obj["steps"] * adapter.RESOLUTION[obj["resolution"]] for obj in encoded],
+        encode=lambda: [adapter._encode(duration, None, None) for duration in durations],
+        encode_arithmetic=lambda: [
+            adapter._encode_arithmetic(duration, adapter.max_steps) for duration in durations
+        ],
+    )
+
+    for variant, func in variants.items():
+        elapsed = min(timeit.repeat(func, repeat=5, number=args.number))
+        print(f"{variant:<18} {elapsed / args.number / len(durations) * 1e9:>8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
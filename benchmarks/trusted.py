@@ -0,0 +1,70 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare parsing Config and Network Diagnostic payloads from the test corpus with validation (the default) and
+in trusted mode, which skips validators.
+
+Usage: python -m benchmarks.trusted [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.config import ConfigOpcode
+from bluetooth_mesh.messages.silvair.network_diagnostic_server import (
+    NetworkDiagnosticServerOpcode,
+    NetworkDiagnosticSetupServerOpcode,
+)
+
+from .corpus import load_corpus
+
+MODELS = [ConfigOpcode, NetworkDiagnosticServerOpcode, NetworkDiagnosticSetupServerOpcode]
+
+
+def rate(payloads, trusted, number):
+    def parse_all():
+        return [AccessMessage.parse(payload, trusted=trusted) for payload in payloads]
+
+    return number * len(payloads) / min(timeit.repeat(parse_all, repeat=5, number=number))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=50, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    AccessMessage.warmup(MODELS)
+    AccessMessage.warmup(MODELS, trusted=True)
+
+    print(f"{'model':<36} {'strict':>12} {'trusted':>12}")
+
+    for model in MODELS:
+        rates = [rate(corpus[model], trusted, args.number) for trusted in (False, True)]
+        print(f"{model.__name__:<36} {rates[0]:>8.0f} msg/s {rates[1]:>8.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
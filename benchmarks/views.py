@@ -0,0 +1,83 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Compare parsing payloads from the test corpus packed into a single receive buffer: copying each one out as
+bytes first, parsing in place by offset and length, and in place with memoryview=True, which also leaves byte
+string fields (keys, labels) in the buffer.
+
+Usage: python -m benchmarks.views [--number N]
+"""
+
+import argparse
+import timeit
+
+from bluetooth_mesh.messages import AccessMessage
+
+from .corpus import load_corpus
+
+
+def pack(payloads):
+    buffer = bytearray()
+    spans = []
+
+    for payload in payloads:
+        spans.append((len(buffer), len(payload)))
+        buffer += payload
+
+    return buffer, spans
+
+
+def rate(buffer, spans, mode, number):
+    def copied():
+        return [AccessMessage.parse(bytes(buffer[offset : offset + length])) for offset, length in spans]
+
+    def in_place():
+        return [AccessMessage.parse(buffer, offset, length) for offset, length in spans]
+
+    def views():
+        return [AccessMessage.parse(buffer, offset, length, memoryview=True) for offset, length in spans]
+
+    parse_all = dict(copied=copied, in_place=in_place, views=views)[mode]
+    return number * len(spans) / min(timeit.repeat(parse_all, repeat=5, number=number))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=10, help="passes over the corpus per repetition")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    AccessMessage.warmup()
+
+    modes = ("copied", "in_place", "views")
+    print(f"{'model':<36}" + "".join(f"{mode:>16}" for mode in modes))
+
+    for model, payloads in corpus.items():
+        buffer, spans = pack(payloads)
+        rates = [rate(buffer, spans, mode, args.number) for mode in modes]
+        print(f"{model.__name__:<36}" + "".join(f"{rate:>10.0f} msg/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
-from construct import Construct, Container, SizeofError, stream_read_entire, stream_write
+import enum
+import struct
+from collections import namedtuple
+from time import perf_counter_ns
 
+from construct import (
+    Construct,
+    Container,
+    SizeofError,
+    StopFieldError,
+    Struct,
+    ValidationError,
+    stream_write,
+)
+
+from .cache import compile_cached
 from .config import ConfigMessage, ConfigOpcode
+from .fastpath import FASTPATHS
 from .generic.battery import GenericBatteryMessage, GenericBatteryOpcode
 from .generic.level import GenericLevelMessage, GenericLevelOpcode
 from .generic.onoff import GenericOnOffMessage, GenericOnOffOpcode
 from .generic.property import GenericPropertyMessage, GenericPropertyOpcode
 from .health import HealthMessage, HealthOpcode
+from .instrumentation import BUILD, PARSE
 from .light.ctl import LightCTLMessage, LightCTLOpcode, LightCTLSetupMessage, LightCTLSetupOpcode
 from .light.lightness import (
     LightLightnessMessage,
@@ -13,6 +29,7 @@ from .light.lightness import (
     LightLightnessSetupMessage,
     LightLightnessSetupOpcode,
 )
+from .records import record
 from .scene import SceneMessage, SceneOpcode
 from .sensor import SensorMessage, SensorOpcode, SensorSetupMessage, SensorSetupOpcode
 from .silvair.debug import DebugMessage, DebugOpcode
@@ -29,7 +46,21 @@ from .silvair.network_diagnostic_server import (
 )
 from .silvair.rrule_scheduler import RRuleSchedulerMessage, RRuleSchedulerOpcode
 from .time import TimeMessage, TimeOpcode
-from .util import Opcode
+from .util import BufferStream, GreedyBytesView, Opcode, SwitchStruct, strip_validators
+
+
+class ParseErrorPolicy(enum.Enum):
+    RAISE = "raise"
+    SKIP = "skip"
+    RECORD = "record"
+
+
+ParseFailure = namedtuple("ParseFailure", ["index", "data", "error"])
+
+AccessHeader = namedtuple("AccessHeader", ["opcode", "model", "subopcode", "offset"])
+
+# opcodes of fast path messages always take two bytes
+FAST_OPCODE = struct.Struct(">H")
 
 
 class _AccessMessage(Construct):
@@ -61,38 +92,406 @@ class _AccessMessage(Construct):
 
     OPCODE = Opcode()
 
-    def __init__(self):
+    def __init__(self, fastpaths=FASTPATHS, trusted=False, instrumentation=None):
+        """
+        Fast paths map opcodes to hand written (parse, build) codecs, tried before construct. See fastpath
+        module for details.
+
+        Trusted instances parse without validating field values by default, see parse().
+
+        Instrumentation, if given (or assigned later), collects per-opcode counters of parsed and built
+        messages, see instrumentation module.
+        """
         super().__init__()
+        self.trusted = trusted
+        self.instrumentation = instrumentation
+        self._trusted = {}
         self._opcodes = {}
-        for opcode_class, message in self.OPCODES.items():
-            for opcode in opcode_class._value2member_map_.keys():
-                self._opcodes[opcode] = opcode_class(opcode), message.compile()
+        self._names = {}
+        self._subopcodes = {}
+        self._fastpaths = {}
+        for opcode, (parse, build) in fastpaths.items():
+            # parse looks payloads up by their first two bytes, which never match a one or three byte opcode
+            assert 0x8000 <= opcode <= 0xBFFF, "Fast paths are limited to two byte opcodes"
+            self._fastpaths[opcode] = opcode, opcode.name.lower(), parse, build, self.OPCODE.build(opcode)
+
+        for opcode_class in self.OPCODES:
+            self._register(opcode_class, params=None)
+
+            for opcode, params in self.OPCODES[opcode_class].switch.cases.items():
+                subopcode_class = self._subopcode_class(params)
+                if subopcode_class is not None:
+                    self._subopcodes[opcode] = subopcode_class
+
+    def _register(self, opcode_class, params):
+        message = self.OPCODES[opcode_class]
+
+        for opcode in opcode_class._value2member_map_.values():
+            self._opcodes[opcode] = opcode, message, params
+            self._names[opcode.name] = self._names[opcode.name.lower()] = self._opcodes[opcode]
+
+    def _compile(self, opcode_class):
+        params = compile_cached(self.OPCODES[opcode_class].switch)
+        self._register(opcode_class, params)
+        return params
+
+    def _compile_trusted(self, opcode_class):
+        params = self._trusted[opcode_class] = compile_cached(
+            strip_validators(self.OPCODES[opcode_class].switch)
+        )
+        return params
+
+    @staticmethod
+    def _subopcode_class(params):
+        """
+        Vendor model params start with a sub-opcode, find its enum.
+        """
+        if isinstance(params, SwitchStruct):
+            field = params.key
+        elif isinstance(params, Struct) and params.subcons:
+            field = params.subcons[0]
+        else:
+            return None
+
+        return getattr(field.subcon, "type", None) if field.name == "subopcode" else None
+
+    def peek(self, data):
+        """
+        Classify a payload by its opcode without parsing params.
+
+        Returns AccessHeader with opcode (an enum member if the opcode is known), model (opcode class), vendor
+        sub-opcode (for models that have one and payloads long enough to carry it) and offset at which params
+        start.
+        """
+        opcode, offset = Opcode.unpack(data)
+
+        try:
+            opcode, _message, _params = self._opcodes[opcode]
+        except KeyError:
+            return AccessHeader(opcode, None, None, offset)
+
+        subopcode_class = self._subopcodes.get(opcode)
+
+        if subopcode_class is None or len(data) <= offset:
+            return AccessHeader(opcode, type(opcode), None, offset)
+
+        subopcode = subopcode_class._value2member_map_.get(data[offset], data[offset])
+        return AccessHeader(opcode, type(opcode), subopcode, offset)
+
+    def warmup(self, models=None, trusted=None):
+        """
+        Compile parsers of given models (opcode classes, all of them by default).
+
+        Parsers are compiled on first use of any opcode of a model, so long running processes may want to
+        pay that cost up front. Trusted parsers are compiled separately, for trusted instances by default.
+        """
+        for opcode_class in self.OPCODES if models is None else models:
+            if self.trusted if trusted is None else trusted:
+                self._compile_trusted(opcode_class)
+            else:
+                self._compile(opcode_class)
+
+    def parse_many(self, iterable, errors=ParseErrorPolicy.RAISE, **contextkw):
+        """
+        Parse a batch of access payloads, yielding messages in the same order.
+
+        All payloads share one top level context, so parse-time context entries (contextkw) should not be
+        modified by parsers.
+
+        Depending on errors policy, a payload that fails to parse either raises, is skipped, or produces
+        a ParseFailure record in place of the message.
+
+        Memoryview payloads (e.g. slices of a receive buffer) are parsed without copying, other buffers are
+        copied like in parse(), and records=True yields typed records instead of Containers.
+
+        One BufferStream is reset over each payload in turn, instead of opening a stream per payload. Byte
+        string fields are copied, or (with memoryview=True) sliced from the payload itself, so they don't
+        depend on the stream. Nested Containers keep it in their internal _io entry, so the stream is detached
+        from each payload once it's parsed, and doesn't keep the buffer alive.
+        """
+        errors = ParseErrorPolicy(errors)
+
+        context = Container(**contextkw)
+        context._parsing = True
+        context._building = False
+        context._sizing = False
+        context._params = context
+
+        views = context.get("memoryview")
+        instrumentation = self.instrumentation
+        stream = BufferStream(memoryview(b""))
+
+        for index, data in enumerate(iterable):
+            try:
+                if views or isinstance(data, memoryview):
+                    payload = self._view(data)
+                else:
+                    payload = data if isinstance(data, bytes) else bytes(data)
+                if instrumentation is None:
+                    yield self._parse_item(payload, stream, context)
+                else:
+                    yield self._measure_parse(self._parse_item, payload, stream, context)
+            except Exception as ex:
+                if errors is ParseErrorPolicy.RAISE:
+                    raise
+
+                if errors is ParseErrorPolicy.RECORD:
+                    yield ParseFailure(index, data, ex)
+
+    def parse_list(self, iterable, errors=ParseErrorPolicy.RAISE, **contextkw):
+        return list(self.parse_many(iterable, errors, **contextkw))
+
+    def parse(self, data, offset=0, length=None, **contextkw):
+        """
+        Parse an access payload.
+
+        Pass trusted=True to skip validation of field values, for payloads already known to be valid (e.g.
+        coming from own firmware), or trusted=False to validate them on a trusted instance. Invalid payloads
+        parsed in trusted mode may produce out of range values instead of raising ValidationError.
+
+        Payload can also be a part of a larger buffer (e.g. a bytearray or memoryview), given by offset and
+        length, which is parsed without copying, as is a memoryview. Other buffers are copied, so the caller is
+        free to resize them afterwards. Pass memoryview=True to get byte string fields (keys, labels, params of
+        unknown opcodes) as memoryview slices of the buffer instead of bytes.
+
+        Pass records=True to get the message as a typed record, which takes less memory than a Container, see
+        records module.
+        """
+        if offset or length is not None or contextkw.get("memoryview") or isinstance(data, memoryview):
+            data = self._view(data, offset, length)
+        elif not isinstance(data, bytes):
+            data = bytes(data)
+
+        if self.instrumentation is not None:
+            return self._measure_parse(self._parse_data, data, contextkw)
+
+        return self._parse_data(data, contextkw)
+
+    def _parse_data(self, data, contextkw):
+        message = self._parse_fast(data)
+        if message is None:
+            if isinstance(data, memoryview):
+                stream = BufferStream(data)
+                try:
+                    message = self.parse_stream(stream, **contextkw)
+                finally:
+                    # nested Containers keep the stream in _io, don't let it pin the buffer
+                    stream.reset(memoryview(b""))
+            else:
+                message = super().parse(data, **contextkw)
+
+        return record(message) if contextkw.get("records") else message
+
+    def _parse_item(self, data, stream, context):
+        message = self._parse_fast(data)
+        if message is None:
+            stream.reset(data if isinstance(data, memoryview) else memoryview(data))
+            try:
+                message = self._parsereport(stream, context, "(parsing)")
+            finally:
+                stream.reset(memoryview(b""))
+
+        return record(message) if context.get("records") else message
+
+    @staticmethod
+    def _view(data, offset=0, length=None):
+        view = memoryview(data).cast("B")
+        if not 0 <= offset <= len(view):
+            raise ValueError("offset %d outside of buffer" % offset)
+
+        if length is not None and not 0 <= length <= len(view) - offset:
+            raise ValueError("length %d outside of buffer" % length)
+
+        return view[offset:] if length is None else view[offset : offset + length]
+
+    def build(self, obj, **contextkw):
+        if self.instrumentation is not None:
+            return self._measure_build(self._build_data, obj, contextkw)
+
+        return self._build_data(obj, contextkw)
+
+    def _build_data(self, obj, contextkw):
+        data = self._build_fast(obj)
+        return super().build(obj, **contextkw) if data is None else data
+
+    def build_into(self, obj, buffer, offset=0, **contextkw):
+        """
+        Build a message into a writable buffer (e.g. a bytearray) at given offset, without allocating the payload
+        as a separate bytes object. Returns the number of bytes written.
+
+        Buffer is never resized: a message that doesn't fit raises StreamError, leaving contents of the buffer
+        past offset unspecified.
+        """
+        with memoryview(buffer) as base, base.cast("B") as view:
+            return self._build_into(obj, view, offset, contextkw)
+
+    def _build_into(self, obj, view, offset, contextkw):
+        if self.instrumentation is not None:
+            return self._measure_build(self._build_view, obj, view, offset, contextkw)
+
+        return self._build_view(obj, view, offset, contextkw)
+
+    def _build_view(self, obj, view, offset, contextkw):
+        if not 0 <= offset <= len(view):
+            raise ValueError("offset %d outside of buffer" % offset)
+
+        length = self._build_fast_into(obj, view, offset)
+        if length is not None:
+            return length
+
+        stream = BufferStream(view, offset)
+        self.build_stream(obj, stream, **contextkw)
+        return stream.position - offset
+
+    def _measure_parse(self, parse, data, *args):
+        start = perf_counter_ns()
+        try:
+            message = parse(data, *args)
+        except Exception:
+            elapsed = perf_counter_ns() - start
+            self.instrumentation.record(PARSE, self._peek_opcode(data), elapsed, 0, failed=True)
+            raise
+
+        elapsed = perf_counter_ns() - start
+        self.instrumentation.record(PARSE, getattr(message, "opcode", None), elapsed, len(data))
+        return message
+
+    def _measure_build(self, build, obj, *args):
+        start = perf_counter_ns()
+        try:
+            data = build(obj, *args)
+        except Exception:
+            elapsed = perf_counter_ns() - start
+            self.instrumentation.record(BUILD, self._opcode_of(obj), elapsed, 0, failed=True)
+            raise
+
+        elapsed = perf_counter_ns() - start
+        self.instrumentation.record(
+            BUILD, self._opcode_of(obj), elapsed, data if isinstance(data, int) else len(data)
+        )
+        return data
+
+    def _peek_opcode(self, data):
+        try:
+            return self.peek(data).opcode
+        except Exception:
+            return None
+
+    def _opcode_of(self, obj):
+        opcode = obj.get("opcode") if isinstance(obj, dict) else None
+        try:
+            return (self._names if isinstance(opcode, str) else self._opcodes)[opcode][0]
+        except (KeyError, TypeError):
+            # unknown or invalid opcode
+            return opcode if isinstance(opcode, int) else None
+
+    def _parse_fast(self, data):
+        if len(data) < 2:
+            return None
+
+        try:
+            opcode, name, parse, _build, _prefix = self._fastpaths[data[0] << 8 | data[1]]
+        except KeyError:
+            return None
+
+        params = parse(data, 2)
+        if params is None:
+            return None
+
+        return Container({"opcode": opcode, name: params})
+
+    def _build_fast(self, obj):
+        try:
+            _opcode, name, _parse, build, prefix = self._fastpaths[obj["opcode"]]
+        except (KeyError, TypeError):
+            return None
+
+        try:
+            params = obj[name] if name in obj else obj["params"]
+            data = build(params)
+        except Exception:
+            # let construct build it, or report what's wrong
+            return None
+
+        return None if data is None else prefix + data
+
+    def _build_fast_into(self, obj, view, offset):
+        try:
+            opcode, name, _parse, build, _prefix = self._fastpaths[obj["opcode"]]
+        except (KeyError, TypeError):
+            return None
+
+        try:
+            params = obj[name] if name in obj else obj["params"]
+            FAST_OPCODE.pack_into(view, offset, opcode)
+            length = build(params, view, offset + FAST_OPCODE.size)
+        except Exception:
+            # let construct build it, or report what's wrong
+            return None
+
+        return None if length is None else FAST_OPCODE.size + length
 
     def _parse(self, stream, context, path):
         opcode = self.OPCODE._parse(stream, context, path)
 
         try:
-            opcode, message = self._opcodes[opcode]
+            opcode, _message, params = self._opcodes[opcode]
         except KeyError:
-            return Container(opcode=opcode, params=stream_read_entire(stream))
+            return Container(opcode=opcode, params=GreedyBytesView._parse(stream, context, path))
+
+        if context._params.get("trusted", self.trusted):
+            params = self._trusted.get(type(opcode)) or self._compile_trusted(type(opcode))
+        elif params is None:
+            params = self._compile(type(opcode))
+
+        return self._parse_params(opcode, params, stream, context, path)
 
-        stream.seek(0)
-        parsed = message._parse(stream, context, path)
-        parsed.opcode = opcode
-        return parsed
+    @staticmethod
+    def _parse_params(opcode, params, stream, context, path):
+        """
+        Decode params of an already decoded opcode, picking up the stream where the opcode ended.
+
+        Emulates the context set up by compiled SwitchStruct, so the result is the same as parsing the
+        whole message from the beginning.
+        """
+        name = opcode.name.lower()
+        this = Container(
+            _=context,
+            _params=context._params,
+            _root=None,
+            _parsing=True,
+            _building=False,
+            _sizing=False,
+            _subcons=None,
+            _io=stream,
+            _index=context.get("_index", None),
+        )
+        this._root = context.get("_root", this)
+
+        result = Container()
+        try:
+            result.opcode = this.opcode = opcode
+            result[name] = this[name] = params._parse(stream, this, path)
+        except StopFieldError:
+            pass
+        return result
 
     def _build(self, obj, stream, context, path):
         opcode = obj["opcode"]
 
         try:
             if isinstance(opcode, str):
-                opcode, message = next(v for k, v in self._opcodes.items() if v[0].name == opcode)
+                opcode, message, _params = self._names[opcode]
                 obj["opcode"] = opcode
             else:
-                opcode, message = self._opcodes[opcode]
-        except KeyError:
+                opcode, message, _params = self._opcodes[opcode]
+        except KeyError as ex:
+            if isinstance(opcode, str):
+                raise ValidationError("object failed validation: unknown opcode '%s'" % opcode) from ex
+
+            params = obj["params"]
             Opcode()._build(opcode, stream, context, path)
-            stream_write(stream, obj["params"])
+            stream_write(stream, params.tobytes() if isinstance(params, memoryview) else params)
             return obj
 
         return message._build(obj, stream, context, path)
@@ -100,5 +499,57 @@ class _AccessMessage(Construct):
     def _sizeof(self, context, path):
         raise SizeofError
 
+    def __reduce__(self):
+        # compiled parsers can't be pickled, so only the module level instance is, by reference
+        if self is not AccessMessage:
+            raise TypeError("only the module level AccessMessage can be pickled")
+
+        return "AccessMessage"
+
 
 AccessMessage = _AccessMessage()
+
+
+class BufferWriter:
+    """
+    Builds access messages back to back into one preallocated buffer, e.g. an arena of outgoing PDUs.
+
+    Writer holds a memoryview of the buffer, so a bytearray can't be resized until the writer is closed.
+    """
+
+    def __init__(self, buffer, offset=0, access_message=AccessMessage):
+        self.view = memoryview(buffer).cast("B")
+        self.start = self.position = offset
+        self.access_message = access_message
+
+    def write(self, obj, **contextkw):
+        """
+        Build a message at current position and move past it. Returns the number of bytes written.
+
+        A message that doesn't fit raises StreamError and leaves the position unchanged.
+        """
+        length = self.access_message._build_into(obj, self.view, self.position, contextkw)
+        self.position += length
+        return length
+
+    @property
+    def remaining(self):
+        return len(self.view) - self.position
+
+    def getbuffer(self):
+        """
+        View of the messages written so far.
+        """
+        return self.view[self.start : self.position]
+
+    def reset(self, offset=None):
+        self.position = self.start if offset is None else offset
+
+    def close(self):
+        self.view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
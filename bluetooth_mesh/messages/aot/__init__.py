@@ -0,0 +1,64 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Struct based codecs for access messages with fixed layout, generated from message definitions.
+
+Codecs are generated and compiled on first call to parse() or build() (or access to SOURCE or CODECS).
+To avoid that, write them into a standalone module ahead of time with
+`python -m bluetooth_mesh.messages.aot > codecs.py` and import it instead; it provides the same parse() and
+build() functions.
+"""
+
+import functools
+import io
+import types
+
+from .generator import generate
+
+
+@functools.lru_cache(maxsize=None)
+def load_codecs():
+    source = io.StringIO()
+    generate(file=source)
+
+    module = types.ModuleType(f"{__name__}.codecs")
+    exec(compile(source.getvalue(), f"<{module.__name__}>", "exec"), module.__dict__)
+
+    return source.getvalue(), module
+
+
+def parse(data):
+    return load_codecs()[1].parse(data)
+
+
+def build(obj):
+    return load_codecs()[1].build(obj)
+
+
+def __getattr__(name):
+    if name == "SOURCE":
+        return load_codecs()[0]
+
+    if name == "CODECS":
+        return load_codecs()[1]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,427 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Generator of a Python module with struct based codecs for access messages with fixed layout.
+
+Walks message definitions reachable from AccessMessage.OPCODES and, for each message which params are a Struct
+of fixed size fields (or a NamedSelect of such Structs), emits parse and build functions that unpack and pack
+the whole layout with a single precomputed struct.Struct. Adapters and validators are not reimplemented:
+generated code calls their _decode() and _encode() on the very same instances, linked from message
+definitions, so constructs remain the source of truth. Messages with any other layout are left to
+AccessMessage.
+
+Usage: python -m bluetooth_mesh.messages.aot > codecs.py
+"""
+
+import sys
+from functools import partial
+from itertools import count
+
+from construct import (
+    Adapter,
+    BitsInteger,
+    Bytes,
+    BytesInteger,
+    Flag,
+    FormatField,
+    Renamed,
+    Struct,
+    Transformed,
+)
+from construct.lib import bytes2bits
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.util import NamedSelect, Opcode
+
+HEADER = '''\
+"""
+Codecs generated by bluetooth_mesh.messages.aot from message definitions. Do not edit.
+"""
+# fmt: off
+# flake8: noqa
+# pylint: skip-file
+
+import struct
+
+from construct import ConstructError, Container, ExplicitError, IntegerError, SelectError, StreamError
+from construct.lib import integer2bytes
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.util import Opcode
+
+
+def _short(expected, data, offset):
+    return StreamError(
+        "stream read less than specified amount, expected %d, found %d" % (expected, len(data) - offset)
+    )
+
+
+def _bytes(value, length):
+    data = integer2bytes(value, length) if isinstance(value, int) else value
+    if len(data) != length:
+        raise StreamError("bytes object of wrong length, expected %d, found %d" % (length, len(data)))
+    return data
+
+
+def _bits(value, length):
+    if not isinstance(value, int):
+        raise IntegerError("value %r is not an integer" % (value,))
+    if value < 0:
+        raise IntegerError("value %r is negative, but field is not signed" % (value,))
+    return value & ((1 << length) - 1)
+
+
+def _select(obj, builders):
+    for name, builder in builders:
+        try:
+            return builder(obj.get(name, obj))
+        except ExplicitError:
+            raise
+        except Exception:
+            pass
+    raise SelectError("no subconstruct matched: %s" % (obj,))
+'''
+
+FOOTER = '''
+
+def parse(data):
+    """
+    Parse an access message, using a generated codec if there is one for its opcode.
+    """
+    opcode, offset = Opcode.unpack(data)
+
+    try:
+        opcode, name, parser = PARSE[opcode]
+    except KeyError:
+        return AccessMessage.parse(data)
+
+    try:
+        return Container({"opcode": opcode, name: parser(data, offset)})
+    except StreamError:
+        # construct checks fields one by one, so let it decide whether short params fail validation first
+        return AccessMessage.parse(data)
+
+
+def build(obj):
+    """
+    Build an access message, using a generated codec if there is one for its opcode.
+    """
+    try:
+        prefix, name, builder = BUILD[obj["opcode"]]
+    except (KeyError, TypeError):
+        return AccessMessage.build(obj)
+
+    try:
+        params = obj[name]
+    except KeyError:
+        params = obj["params"]
+
+    try:
+        return prefix + builder(params)
+    except Exception:
+        # let construct either build it anyway or raise its own error
+        return AccessMessage.build(obj)
+'''
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Field:
+    """
+    Layout of a single field: struct format and expressions converting unpacked value to parsed one, and
+    value to build back into packable one.
+    """
+
+    def __init__(self, fmt, decode="{}", encode="{}"):
+        self.fmt = fmt
+        self.decode = decode
+        self.encode = encode
+
+    def wrap(self, decode, encode):
+        return Field(self.fmt, decode.format(self.decode), self.encode.format(encode))
+
+
+class Generator:
+    def __init__(self):
+        self.ids = count()
+        self.imports = {}
+        self.definitions = []
+        self.functions = {}
+        self.parse = []
+        self.build = []
+
+    def link(self, obj, module):
+        """
+        Import a module-level object, i.e. a message or an opcode class, into generated module.
+        """
+        name = next(name for name, value in vars(sys.modules[module]).items() if value is obj)
+
+        previous, _ = self.imports.setdefault(name, (module, obj))
+        if previous != module:
+            raise ValueError(f"{name} imported from both {previous} and {module}")
+
+        return name
+
+    def define(self, prefix, value):
+        name = f"_{prefix}{next(self.ids)}"
+        self.definitions.append(f"{name} = {value}")
+        return name
+
+    def field(self, con, ref):
+        if isinstance(con, Renamed):
+            return self.field(con.subcon, f"{ref}.subcon")
+
+        if isinstance(con, FormatField):
+            if con.length == 1 or con.fmtstr[0] == "<":
+                return Field(con.fmtstr[1])
+
+            fmt = self.define("F", f"struct.Struct({con.fmtstr!r})")
+            return Field(f"{con.length}s", f"{fmt}.unpack({{}})[0]", f"{fmt}.pack({{}})")
+
+        if isinstance(con, BytesInteger) and isinstance(con.length, int) and isinstance(con.swapped, bool):
+            byteorder = "little" if con.swapped else "big"
+            return Field(
+                f"{con.length}s",
+                f"int.from_bytes({{}}, {byteorder!r}, signed={con.signed})",
+                f"{{}}.to_bytes({con.length}, {byteorder!r}, signed={con.signed})",
+            )
+
+        if isinstance(con, Bytes) and isinstance(con.length, int):
+            return Field(f"{con.length}s", "{}", f"_bytes({{}}, {con.length})")
+
+        if isinstance(con, Transformed) and con.decodefunc is bytes2bits and isinstance(con.subcon, Struct):
+            return self.bit_struct(con.subcon, con.decodeamount)
+
+        if (
+            isinstance(con, Adapter)
+            and type(con)._parse is Adapter._parse
+            and type(con)._build is Adapter._build
+            and type(con)._decode is not Adapter._decode
+        ):
+            adapter = self.define("A", ref)
+            return self.field(con.subcon, f"{ref}.subcon").wrap(
+                f"{adapter}._decode({{}}, None, None)",
+                f"{adapter}._encode({{}}, None, None)",
+            )
+
+        raise Unsupported(con)
+
+    def bit_struct(self, struct, length):
+        fields = []
+        shift = length * 8
+
+        for subcon in struct.subcons:
+            if not isinstance(subcon, Renamed):
+                raise Unsupported(subcon)
+
+            bits = subcon.subcon
+            if bits is Flag:
+                width, flag = 1, True
+            elif (
+                isinstance(bits, BitsInteger)
+                and isinstance(bits.length, int)
+                and not (bits.signed or bits.swapped)
+            ):
+                width, flag = bits.length, False
+            else:
+                raise Unsupported(bits)
+
+            shift -= width
+            fields.append((subcon.name, shift, width, flag))
+
+        if shift:
+            raise Unsupported(struct)
+
+        decode = ", ".join(
+            f"{name!r}: "
+            + (f"({{0}} >> {shift})" if shift else "{0}")
+            + (" & 1 == 1" if flag else f" & {(1 << width) - 1:#x}")
+            for name, shift, width, flag in fields
+        )
+        encode = " | ".join(
+            (f"(1 if {{0}}[{name!r}] else 0)" if flag else f"_bits({{0}}[{name!r}], {width})")
+            + (f" << {shift}" if shift else "")
+            for name, shift, width, flag in fields
+        )
+
+        pack = self.function(
+            f"_build_bits_{next(self.ids)}",
+            ["value"],
+            [f"return {encode.format('value')}"],
+        )
+
+        if length == 1:
+            return Field("B", f"Container({{{{{decode}}}}})", f"{pack}({{}})")
+
+        return Field(
+            f"{length}s",
+            f"Container({{{{{decode}}}}})".replace("{0}", "int.from_bytes({0}, 'big')"),
+            f"{pack}({{}}).to_bytes({length}, 'big')",
+        )
+
+    def function(self, name, args, body):
+        self.functions[name] = [f"def {name}({', '.join(args)}):", *(f"    {line}" for line in body)]
+        return name
+
+    def struct(self, con, ref, name=None):
+        fields = []
+        for index, subcon in enumerate(con.subcons):
+            if not isinstance(subcon, Renamed) or not subcon.name:
+                raise Unsupported(subcon)
+
+            fields.append((subcon.name, self.field(subcon.subcon, f"{ref}.subcons[{index}].subcon")))
+
+        fmt = "<" + "".join(field.fmt for _, field in fields)
+
+        uid = next(self.ids)
+        values = [f"f{index}" for index in range(len(fields))]
+        items = [
+            f"{field_name!r}: {field.decode.format(value)}"
+            for (field_name, field), value in zip(fields, values, strict=True)
+        ]
+        if name is not None:
+            items.append(f"'_name': {name!r}")
+
+        if not fields:
+            parse_body = [f"return Container({{{', '.join(items)}}})"]
+            build_body = ["return b''"]
+            return self._struct_functions(uid, 0, parse_body, build_body)
+
+        layout = self.define("S", f"struct.Struct({fmt!r})")
+        parse_body = [
+            f"if len(data) - offset < {layout}.size:",
+            f"    raise _short({layout}.size, data, offset)",
+            f"{', '.join(values)}, = {layout}.unpack_from(data, offset)",
+            f"return Container({{{', '.join(items)}}})",
+        ]
+        build_body = [
+            f"return {layout}.pack({', '.join(field.encode.format(f'obj[{n!r}]') for n, field in fields)})",
+        ]
+        return self._struct_functions(uid, f"{layout}.size", parse_body, build_body)
+
+    def _struct_functions(self, uid, size, parse_body, build_body):
+        parse = self.function(f"_parse_{uid}", ["data", "offset"], parse_body)
+        build = self.function(f"_build_{uid}", ["obj"], build_body)
+        return parse, build, size
+
+    def params(self, con, ref):
+        if isinstance(con, Struct):
+            parse, build, _ = self.struct(con, ref)
+            return parse, build
+
+        if isinstance(con, NamedSelect):
+            variants = [
+                (
+                    variant.name,
+                    *self.struct(variant.subcon, f"{ref}._subcon.subcons[{index}].subcon", variant.name),
+                )
+                for index, variant in enumerate(con._subcon.subcons)
+                if isinstance(variant, Renamed) and isinstance(variant.subcon, Struct)
+            ]
+            if len(variants) != len(con._subcon.subcons):
+                raise Unsupported(con)
+
+            uid = next(self.ids)
+            parse_body = ["remaining = len(data) - offset"]
+            for _, parse, _, size in variants:
+                parse_body += [
+                    f"if remaining >= {size}:",
+                    "    try:",
+                    f"        return {parse}(data, offset)",
+                    "    except ExplicitError:",
+                    "        raise",
+                    "    except ConstructError:",
+                    "        pass",
+                ]
+            parse_body.append('raise SelectError("no subconstruct matched")')
+
+            builders = ", ".join(f"({name!r}, {build})" for name, _, build, _ in variants)
+            return (
+                self.function(f"_parse_{uid}", ["data", "offset"], parse_body),
+                self.function(f"_build_{uid}", ["obj"], [f"return _select(obj, ({builders},))"]),
+            )
+
+        raise Unsupported(con)
+
+    def generate(self):
+        codecs = {}
+
+        for opcode_class, message in AccessMessage.OPCODES.items():
+            message_name = self.link(message, opcode_class.__module__)
+            opcode_class_name = self.link(opcode_class, opcode_class.__module__)
+
+            for opcode, params in message.switch.subcon.cases.items():
+                if id(params) not in codecs:
+                    ref = f"{message_name}.switch.subcon.cases[{opcode_class_name}.{opcode.name}]"
+                    try:
+                        codecs[id(params)] = self.params(params, ref)
+                    except Unsupported:
+                        codecs[id(params)] = None
+
+                if codecs[id(params)] is None:
+                    continue
+
+                parse, build = codecs[id(params)]
+                member = f"{opcode_class_name}.{opcode.name}"
+                self.parse.append(f"    {int(opcode):#x}: ({member}, {opcode.name.lower()!r}, {parse}),")
+                self.build.append(
+                    f"    {int(opcode):#x}: ({Opcode().build(opcode)!r}, {opcode.name.lower()!r}, {build}),"
+                )
+
+    def lines(self):
+        yield HEADER
+
+        modules = {}
+        for name, (module, _) in sorted(self.imports.items()):
+            modules.setdefault(module, []).append(name)
+
+        for module, names in sorted(modules.items()):
+            yield f"from {module} import {', '.join(names)}"
+
+        yield ""
+        yield from self.definitions
+
+        for function in self.functions.values():
+            yield "\n"
+            yield from function
+
+        yield "\n"
+        yield "PARSE = {"
+        yield from self.parse
+        yield "}"
+        yield ""
+        yield "BUILD = {"
+        yield from self.build
+        yield "}"
+        yield FOOTER.rstrip("\n")
+
+
+def generate(file=sys.stdout):
+    _print = partial(print, file=file)
+
+    generator = Generator()
+    generator.generate()
+
+    for line in generator.lines():
+        _print(line)
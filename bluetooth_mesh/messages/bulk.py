@@ -0,0 +1,150 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Decoding of large batches of access payloads, e.g. capture archives, in a pool of worker processes.
+
+Payloads are split into shards of consecutive messages, each shard is parsed by a worker with
+AccessMessage.parse_list() and results are returned in order of payloads. Parse results have to travel back
+through pickle, which for small messages costs about as much as parsing them, so decode() can also return
+results in columnar form: opcodes and indices as arrays, params as one list per shard.
+"""
+
+import enum
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from bluetooth_mesh.messages import AccessMessage, ParseErrorPolicy, ParseFailure
+
+Columns = namedtuple("Columns", ["index", "opcode", "params", "failures"])
+
+SHARD_SIZE = 4096
+
+
+def read_payloads(path):
+    """
+    Read access payloads from a text file with one hex-encoded payload per line. Empty lines and lines
+    starting with '#' are skipped.
+    """
+    with open(path) as capture:
+        for line in capture:
+            payload = line.strip()
+            if payload and not payload.startswith("#"):
+                yield bytes.fromhex(payload)
+
+
+def _shards(payloads, shard_size):
+    payloads = iter(payloads)
+    start = 0
+
+    while True:
+        shard = list(islice(payloads, shard_size))
+        if not shard:
+            return
+
+        yield start, shard
+        start += len(shard)
+
+
+def _params(message):
+    if isinstance(message.opcode, enum.Enum):
+        return message[message.opcode.name.lower()]
+
+    return message.params
+
+
+def _decode_shard(shard, errors, columnar):
+    start, payloads = shard
+
+    # failures are always recorded, so that skipped payloads don't shift indices of the following ones
+    policy = ParseErrorPolicy.RAISE if errors is ParseErrorPolicy.RAISE else ParseErrorPolicy.RECORD
+
+    messages = []
+    for index, message in enumerate(AccessMessage.parse_many(payloads, errors=policy), start):
+        if not isinstance(message, ParseFailure):
+            messages.append((index, message))
+        elif errors is ParseErrorPolicy.RECORD:
+            messages.append((index, message._replace(index=index)))
+
+    if not columnar:
+        return [message for _, message in messages]
+
+    columns = Columns(array("L"), array("L"), [], [])
+    for index, message in messages:
+        if isinstance(message, ParseFailure):
+            columns.failures.append(message)
+            continue
+
+        columns.index.append(index)
+        columns.opcode.append(message.opcode)
+        columns.params.append(_params(message))
+
+    return columns
+
+
+def decode(
+    payloads,
+    workers=None,
+    errors=ParseErrorPolicy.RAISE,
+    columnar=False,
+    shard_size=SHARD_SIZE,
+    executor=None,
+):
+    """
+    Parse an iterable of access payloads in worker processes.
+
+    By default returns a list of parsed messages (or ParseFailure records, depending on errors policy) in the
+    same order as payloads, as AccessMessage.parse_list() would. ParseFailure indices refer to positions in
+    payloads.
+
+    With columnar=True, returns a single Columns tuple instead: positions of successfully parsed payloads,
+    their integer opcodes and their params, plus a list of ParseFailure records.
+
+    Work is distributed to a new ProcessPoolExecutor with given number of workers (CPU count by default), or
+    to an existing executor.
+    """
+    errors = ParseErrorPolicy(errors)
+
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            return decode(
+                payloads, errors=errors, columnar=columnar, shard_size=shard_size, executor=executor
+            )
+
+    results = executor.map(
+        partial(_decode_shard, errors=errors, columnar=columnar), _shards(payloads, shard_size)
+    )
+    return _merge(results, columnar)
+
+
+def _merge(results, columnar):
+    if not columnar:
+        return [message for shard in results for message in shard]
+
+    columns = Columns(array("L"), array("L"), [], [])
+    for shard in results:
+        for column, values in zip(columns, shard, strict=True):
+            column.extend(values)
+
+    return columns
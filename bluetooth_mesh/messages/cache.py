@@ -0,0 +1,180 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+On-disk cache of code objects produced by compiling constructs.
+
+Construct.compile() generates Python source for a construct and compiles it into bytecode. Generating the
+source is cheap, compiling it is not, so the bytecode is marshalled into a cache directory and loaded by later
+processes.
+
+Parts of a construct that cannot be compiled are linked into the generated source by their id(), which is
+different in each process. Before compilation these ids are replaced with sequence numbers, so the source only
+depends on message definitions and its hash is used as the cache key. Cache directory is versioned by package,
+construct and Python versions, so upgrading any of them starts with an empty cache.
+
+Set BLUETOOTH_MESH_MESSAGES_CACHE_DIR to change cache location, or BLUETOOTH_MESH_MESSAGES_NO_CACHE to disable it.
+"""
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import marshal
+import os
+import re
+import sys
+import tempfile
+import types
+
+from construct.core import CodeGen
+from construct.version import version_string as construct_version
+
+
+def _package_version():
+    try:
+        return importlib.metadata.version("bluetooth-mesh-messages")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+CACHE_DIR = os.environ.get(
+    "BLUETOOTH_MESH_MESSAGES_CACHE_DIR",
+    os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "bluetooth-mesh-messages"),
+)
+
+ENABLED = not os.environ.get("BLUETOOTH_MESH_MESSAGES_NO_CACHE")
+
+VERSION = "%s-construct-%s-%s-%s" % (
+    _package_version(),
+    construct_version,
+    sys.implementation.cache_tag,
+    importlib.util.MAGIC_NUMBER.hex(),
+)
+
+# same prelude as in Construct.compile()
+HEADER = """
+    from construct import *
+    from construct.lib import *
+    from io import BytesIO
+    import struct
+    import collections
+    import itertools
+
+    def read_bytes(io, count):
+        if not count >= 0: raise StreamError
+        data = io.read(count)
+        if not len(data) == count: raise StreamError
+        return data
+    def restream(data, func):
+        return func(BytesIO(data))
+    def reuse(obj, func):
+        return func(obj)
+
+    linkedinstances = {}
+    linkedparsers = {}
+
+    len_ = len
+    sum_ = sum
+    min_ = min
+    max_ = max
+    abs_ = abs
+"""
+
+LINKED = re.compile(r"(linkedinstances|linkedparsers)\[(\d+)\]")
+
+
+def generate(construct):
+    """
+    Generate parser source for a construct, with linked instances numbered in order of appearance.
+
+    Returns the source along with linked instances and their parse methods, keyed by these numbers.
+    """
+    code = CodeGen()
+    code.append(HEADER)
+    code.append("""
+        def parseall(io, this):
+            return %s
+        compiled = Compiled(None, None, parseall)
+    """ % construct._compileparse(code))
+
+    numbers = {key: number for number, key in enumerate(code.linkedinstances)}
+    source = LINKED.sub(lambda match: "%s[%d]" % (match[1], numbers[int(match[2])]), code.toString())
+
+    linkedinstances = {numbers[key]: value for key, value in code.linkedinstances.items()}
+    linkedparsers = {numbers[key]: value for key, value in code.linkedparsers.items()}
+
+    return source, linkedinstances, linkedparsers
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, VERSION, key)
+
+
+def _load(key):
+    try:
+        with open(_path(key), "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _store(key, code):
+    directory = os.path.dirname(_path(key))
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        # write to a temporary file first, so concurrent processes never load a partially written one
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+            marshal.dump(code, f)
+
+        os.replace(f.name, _path(key))
+    except OSError:
+        pass
+
+
+def compile_cached(construct):
+    """
+    Equivalent of Construct.compile(), which loads bytecode from the cache when possible.
+    """
+    source, linkedinstances, linkedparsers = generate(construct)
+    key = hashlib.sha256(source.encode()).hexdigest()
+
+    code = _load(key) if ENABLED else None
+
+    if code is None:
+        code = compile(source, "", "exec")
+
+        if ENABLED:
+            _store(key, code)
+
+    module = types.ModuleType(key)
+    exec(code, module.__dict__)
+
+    module.linkedinstances = linkedinstances
+    module.linkedparsers = linkedparsers
+
+    compiled = module.compiled
+    compiled.source = source
+    compiled.module = module
+    compiled.modulename = key
+    compiled.defersubcon = construct
+    return compiled
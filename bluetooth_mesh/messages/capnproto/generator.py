@@ -227,7 +227,7 @@ class Visitor:
         if isinstance(con, StringEncoded):
             return "Text"
 
-        elif isinstance(con, Bytes) or con is GreedyBytes:
+        elif isinstance(con, (Bytes, type(GreedyBytes))):
             return "Data"
 
         elif isinstance(con, FormatField):
@@ -21,44 +21,53 @@
 #
 # pylint: disable=W0223
 import enum
+import io
+import sys
+from array import array
 from datetime import timedelta
+from functools import lru_cache
+from itertools import compress
 
 from construct import (
     Adapter,
     BitsInteger,
     BitStruct,
-    Bytes,
     Bytewise,
+    Construct,
     Embedded,
     ExprValidator,
     Flag,
-    GreedyBytes,
     GreedyRange,
     Int8sl,
     Int8ul,
     Int16ul,
     Int24ul,
+    IntegerError,
     Padding,
     Rebuild,
-    Select,
+    SelectError,
     Struct,
     len_,
     obj_,
+    stream_read_entire,
+    stream_seek,
+    stream_write,
     this,
 )
 
 from bluetooth_mesh.messages.util import (
     BitList,
+    BytesView,
     EmbeddedBitStruct,
     EnumAdapter,
     EnumSwitch as Switch,
     EnumSwitchStruct,
+    GreedyBytesView,
     IfThenElseDefault,
     LogAdapter,
     NamedSelect,
     Opcode,
     RangeValidator,
-    Reversed,
     SwitchStruct,
     enum_switch_struct_len_,
 )
@@ -453,7 +462,7 @@ class AddressType(enum.Enum):
     ALL_NODES = 8
 
 
-def get_address_type(address):
+def _address_type_arithmetic(address):
     # pylint: disable=R0911
 
     if address == 0x0000:
@@ -483,6 +492,196 @@ def get_address_type(address):
     return AddressType.UNICAST
 
 
+def _address_type_table():
+    table = bytearray([AddressType.UNICAST.value]) * 0x10000
+
+    for first, last, address_type in [
+        (0x0000, 0x0000, AddressType.UNASSIGNED),
+        (0x8000, 0xBFFF, AddressType.VIRTUAL),
+        (0xC000, 0xFEFF, AddressType.GROUP),
+        (0xFF00, 0xFFFB, AddressType.RFU),
+        (0xFFFC, 0xFFFC, AddressType.ALL_PROXIES),
+        (0xFFFD, 0xFFFD, AddressType.ALL_FRIENDS),
+        (0xFFFE, 0xFFFE, AddressType.ALL_RELAYS),
+        (0xFFFF, 0xFFFF, AddressType.ALL_NODES),
+    ]:
+        table[first : last + 1] = bytes([address_type.value]) * (last + 1 - first)
+
+    return bytes(table)
+
+
+# AddressType values of all 16-bit addresses
+ADDRESS_TYPES = _address_type_table()
+
+_ADDRESS_TYPE_MEMBERS = tuple(map(AddressType, range(len(AddressType))))
+
+
+def get_address_type(address):
+    try:
+        if address >= 0:
+            return _ADDRESS_TYPE_MEMBERS[ADDRESS_TYPES[address]]
+    except (IndexError, TypeError):
+        pass
+
+    return _address_type_arithmetic(address)
+
+
+def classify_addresses(addresses):
+    """
+    Get AddressType values of many addresses at once, as bytes.
+
+    NumPy arrays of addresses are classified with a single lookup and produce an uint8 array instead. NumPy
+    is not a dependency, arrays are recognized only when the caller has already imported it.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(addresses, numpy.ndarray):
+        if addresses.size and (addresses.min() < 0 or addresses.max() > 0xFFFF):
+            raise ValueError("addresses do not fit in 16 bits")
+
+        return numpy.frombuffer(ADDRESS_TYPES, dtype=numpy.uint8)[addresses]
+
+    if not isinstance(addresses, array) or addresses.typecode != "H":
+        addresses = array("H", addresses)
+
+    return bytes(map(ADDRESS_TYPES.__getitem__, addresses))
+
+
+class AddressSet:
+    """
+    Compact sequence of 16-bit addresses, backed by array('H').
+
+    Address lists decode into AddressSet when parsed with address_set=True context entry. Order and
+    duplicates are kept as received, so the list builds back into the same octets.
+    """
+
+    __slots__ = ("addresses",)
+
+    def __init__(self, addresses=()):
+        self.addresses = array("H", addresses)
+
+    @classmethod
+    def frombytes(cls, data):
+        addresses = cls()
+        addresses.addresses.frombytes(data)
+        if sys.byteorder == "big":
+            addresses.addresses.byteswap()
+        return addresses
+
+    def tobytes(self):
+        if sys.byteorder == "big":
+            addresses = array("H", self.addresses)
+            addresses.byteswap()
+            return addresses.tobytes()
+        return self.addresses.tobytes()
+
+    def types(self):
+        return classify_addresses(self.addresses)
+
+    def select(self, *address_types):
+        """
+        Get addresses of given types, in their original order.
+        """
+        selectors = self.types().translate(_address_type_selectors(*address_types))
+        return AddressSet(compress(self.addresses, selectors))
+
+    def partition(self):
+        """
+        Split addresses by their type. Types not present in the set are omitted.
+        """
+        types = self.types()
+        return {
+            address_type: AddressSet(
+                compress(self.addresses, types.translate(_address_type_selectors(address_type)))
+            )
+            for address_type in AddressType
+            if address_type.value in types
+        }
+
+    @property
+    def unicast(self):
+        return self.select(AddressType.UNICAST)
+
+    @property
+    def group(self):
+        return self.select(AddressType.GROUP)
+
+    @property
+    def virtual(self):
+        return self.select(AddressType.VIRTUAL)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def __iter__(self):
+        return iter(self.addresses)
+
+    def __contains__(self, address):
+        return address in self.addresses
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return AddressSet(self.addresses[index])
+        return self.addresses[index]
+
+    def __eq__(self, other):
+        if isinstance(other, AddressSet):
+            return self.addresses == other.addresses
+        if isinstance(other, (list, tuple, array)):
+            return list(self.addresses) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"AddressSet({self.addresses.tolist()!r})"
+
+
+@lru_cache
+def _address_type_selectors(*address_types):
+    """
+    Translation table mapping AddressType values to 1 for given types, 0 otherwise.
+    """
+    values = {address_type.value for address_type in address_types}
+    return bytes(value in values for value in range(256))
+
+
+class AddressList(Construct):
+    """
+    List of 16-bit addresses, little endian.
+
+    Decodes into a list, or into AddressSet when parsed with address_set=True context entry.
+    """
+
+    _subcon = GreedyRange(Int16ul)
+
+    def _parse(self, stream, context, path):
+        data = stream_read_entire(stream)
+
+        if len(data) % 2:
+            # leave a trailing octet for the following fields, like GreedyRange would
+            stream_seek(stream, -1, io.SEEK_CUR)
+            data = data[:-1]
+
+        addresses = AddressSet.frombytes(data)
+        return addresses if context._params.get("address_set") else addresses.addresses.tolist()
+
+    def _build(self, obj, stream, context, path):
+        addresses = obj
+        if not isinstance(addresses, AddressSet):
+            try:
+                addresses = AddressSet(list(obj))
+            except (TypeError, OverflowError) as ex:
+                raise IntegerError("invalid address list %r: %s" % (obj, ex)) from ex
+
+        data = addresses.tobytes()
+        stream_write(stream, data, len(data))
+        return obj
+
+
+Addresses = AddressList()
+Addresses.__construct_doc__ = Addresses._subcon
+
+
 def AddressTypeValidator(subcons, *allowed_types):
     return ExprValidator(subcons, lambda obj, ctx: get_address_type(obj) in allowed_types)
 
@@ -677,59 +876,54 @@ AppKeyIndex = SingleKeyIndex("app_key_index")
 NetKeyIndex = SingleKeyIndex("net_key_index")
 
 
-class KeyIndicesAdapter(Adapter):
+class PackedKeyIndices(Construct):
+    """
+    Sorted list of 12-bit key indices, packed in pairs into 3 octets, with the last odd index (if any) in
+    2 octets, all little endian:
+        [1, 2, 3] -> 02 10 00 03 00
+    """
+
     _subcon = GreedyRange(BitsInteger(12))
 
-    def _decode(self, obj, context, path):
-        """
-        Flatten a list dictionaries into list of items:
-            [{first=1, second=2}, {last=3}] -> [1, 2, 3]
-        """
-        ret = []
-        for item in obj:
-            if "last" in item:
-                ret += [item["last"]]
-            else:
-                ret += [item["first"], item["second"]]
-        return sorted(ret)
+    def _parse(self, stream, context, path):
+        data = stream_read_entire(stream)
+        pairs = len(data) // 3 * 3
+        indices = []
 
-    def _encode(self, obj, context, path):
-        """
-        Expand a list into list of dictionaries:
-            [1, 2, 3] -> [{first=1, second=2}, {last=3}]
-        """
-        ret = []
-        obj.sort()
-        while len(obj) > 1:
-            ret += [dict(first=obj.pop(0), second=obj.pop(0))]
+        octets = iter(data[:pairs])
+        for low, middle, high in zip(octets, octets, octets, strict=True):
+            indices.append(high << 4 | middle >> 4)
+            indices.append((middle & 0x0F) << 8 | low)
 
-        if obj:
-            ret += [dict(last=obj.pop())]
+        if len(data) - pairs == 2:
+            indices.append((data[-1] & 0x0F) << 8 | data[-2])
+        elif len(data) - pairs == 1:
+            # leave a trailing octet for the following fields, like GreedyRange would
+            stream_seek(stream, -1, io.SEEK_CUR)
 
-        return ret
+        return sorted(indices)
 
+    def _build(self, obj, stream, context, path):
+        indices = sorted(obj)
 
-# fmt: off
-KeyIndices = KeyIndicesAdapter(
-    GreedyRange(
-        Select(
-            Reversed(
-                BitStruct(
-                    "first" / BitsInteger(12),
-                    "second" / BitsInteger(12),
-                )
-            ),
-            Reversed(
-                BitStruct(
-                    Padding(4),
-                    "last" / BitsInteger(12),
-                )
-            )
-        )
-    )
-)
-KeyIndices.__construct_doc__ = GreedyRange(BitsInteger(12))
-# fmt: on
+        for index in indices:
+            if not isinstance(index, int) or index < 0:
+                # same error as the Select of packed pairs this construct replaced
+                raise SelectError("no subconstruct matched: key index %r" % (index,))
+
+        data = bytearray()
+        for first, second in zip(indices[0::2], indices[1::2], strict=False):
+            data += ((first & 0xFFF) << 12 | (second & 0xFFF)).to_bytes(3, "little")
+
+        if len(indices) % 2:
+            data += (indices[-1] & 0xFFF).to_bytes(2, "little")
+
+        stream_write(stream, bytes(data), len(data))
+        return obj
+
+
+KeyIndices = PackedKeyIndices()
+KeyIndices.__construct_doc__ = KeyIndices._subcon
 
 
 class PublishPeriodStepResolution(enum.IntEnum):
@@ -792,7 +986,7 @@ ConfigCompositionData = Switch(
         CompositionDataPage.ZERO: CompositionDataPage0,
         CompositionDataPage.FIRST: CompositionDataPage1,
         CompositionDataPage.SECOND: CompositionDataPage2,
-        CompositionDataPage.TWO_HUNDRED_AND_FIFTY_FIFTH: GreedyBytes,
+        CompositionDataPage.TWO_HUNDRED_AND_FIFTY_FIFTH: GreedyBytesView,
     },
 )
 
@@ -854,7 +1048,7 @@ ConfigModelPublicationStatus = Struct(
 
 ConfigModelPublicationVASet = Struct(
     "element_address" / UnicastAddress,
-    "publish_address" / Bytes(16),
+    "publish_address" / BytesView(16),
     *EmbeddedBitStruct(
         "_",
         "rfu" / BitsInteger(3),
@@ -879,7 +1073,7 @@ ConfigModelSubscriptionOverwrite = ConfigModelSubscriptionAdd
 
 ConfigModelSubscriptionVAAdd = Struct(
     "element_address" / UnicastAddress,
-    "label" / Bytes(16),
+    "label" / BytesView(16),
     "model" / ModelId,
 )
 
@@ -907,7 +1101,7 @@ ConfigSIGModelSubscriptionList = Struct(
     "status" / StatusCodeAdapter,
     "element_address" / UnicastAddress,
     "model" / SIGModelId,
-    "addresses" / GreedyRange(Int16ul),
+    "addresses" / Addresses,
 )
 
 ConfigVendorModelSubscriptionGet = Struct(
@@ -919,12 +1113,12 @@ ConfigVendorModelSubscriptionList = Struct(
     "status" / StatusCodeAdapter,
     "element_address" / UnicastAddress,
     "model" / VendorModelId,
-    "addresses" / GreedyRange(Int16ul),
+    "addresses" / Addresses,
 )
 
 ConfigNetKeyAdd = Struct(
     *NetKeyIndex,
-    "net_key" / Bytes(16),
+    "net_key" / BytesView(16),
 )
 
 ConfigNetKeyUpdate = ConfigNetKeyAdd
@@ -946,7 +1140,7 @@ ConfigNetKeyList = Struct(
 
 ConfigAppKeyAdd = Struct(
     *NetAndAppKeyIndex,
-    "app_key" / Bytes(16),
+    "app_key" / BytesView(16),
 )
 
 ConfigAppKeyUpdate = ConfigAppKeyAdd
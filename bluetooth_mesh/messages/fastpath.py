@@ -0,0 +1,373 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Hand written codecs of the most frequent lighting messages.
+
+AccessMessage looks opcodes up in FASTPATHS before parsing or building a message with construct. Each entry
+is a pair of functions:
+
+- parse(data, offset) decodes params starting at given offset of the payload, or returns None if they don't
+  fit any of the layouts it knows
+- build(params) encodes params, or returns None (or raises) if it can't do that exactly like construct would;
+  build(params, buffer, offset) writes them into a buffer instead, and returns the number of bytes written
+
+In both cases AccessMessage falls back to construct, which also takes care of reporting errors.
+
+Transition time and delay fields are decoded and encoded using tables precomputed from adapters of message
+definitions, so results are the same as produced by construct.
+"""
+
+import functools
+import struct
+
+from construct import Container
+
+from bluetooth_mesh.messages.generic.level import GenericLevelOpcode
+from bluetooth_mesh.messages.generic.onoff import (
+    GenericOnOffOpcode,
+    GenericOnOffSetOptional,
+    GenericOnOffStatusOptional,
+)
+from bluetooth_mesh.messages.generics import OptionalSetParameters
+from bluetooth_mesh.messages.light.ctl import LightCTLOpcode
+from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
+
+
+class FieldTable:
+    """
+    Precomputed codec of a single byte adapter field, e.g. transition time.
+
+    Tables are computed on first use, values that the adapter refuses to encode are left out of the encoding
+    table.
+    """
+
+    def __init__(self, field):
+        self.adapter = field.subcon
+
+    @functools.cached_property
+    def decode(self):
+        adapter = self.adapter
+        return tuple(adapter._decode(adapter.subcon.parse(bytes([i])), None, None) for i in range(256))
+
+    @functools.cached_property
+    def encode(self):
+        adapter = self.adapter
+        encode = {}
+
+        for value in self.decode:
+            try:
+                encode[value] = adapter.subcon.build(adapter._encode(value, None, None))[0]
+            except Exception:
+                pass
+
+        return encode
+
+
+# all transition time fields share the same adapter configuration: set messages don't allow unknown
+# transition time, status messages do
+TRANSITION_TIME = FieldTable(GenericOnOffSetOptional.transition_time)
+REMAINING_TIME = FieldTable(GenericOnOffStatusOptional.remaining_time)
+DELAY = FieldTable(OptionalSetParameters.delay)
+
+ONOFF_SET = struct.Struct("<BBBB")
+ONOFF_SET_MINIMAL = struct.Struct("<BB")
+ONOFF_STATUS = struct.Struct("<BBB")
+ONOFF_STATUS_MINIMAL = struct.Struct("<B")
+LEVEL_STATUS = struct.Struct("<hhB")
+LEVEL_STATUS_MINIMAL = struct.Struct("<h")
+LIGHTNESS_SET = struct.Struct("<HBBB")
+LIGHTNESS_SET_MINIMAL = struct.Struct("<HB")
+LIGHTNESS_STATUS = struct.Struct("<HHB")
+LIGHTNESS_STATUS_MINIMAL = struct.Struct("<H")
+CTL_STATUS = struct.Struct("<HHHHB")
+CTL_STATUS_MINIMAL = struct.Struct("<HH")
+
+
+def _pack(layout, buffer, offset, *values):
+    if buffer is None:
+        return layout.pack(*values)
+
+    layout.pack_into(buffer, offset, *values)
+    return layout.size
+
+
+def _named(params):
+    # params nested under a variant name are resolved by NameAdapter, leave them to construct
+    return "optional" in params or "minimal" in params
+
+
+def parse_generic_onoff_set(data, offset):
+    length = len(data) - offset
+
+    if length >= ONOFF_SET.size:
+        onoff, tid, transition_time, delay = ONOFF_SET.unpack_from(data, offset)
+        return Container(
+            onoff=onoff,
+            tid=tid,
+            transition_time=TRANSITION_TIME.decode[transition_time],
+            delay=DELAY.decode[delay],
+            _name="optional",
+        )
+
+    if length >= ONOFF_SET_MINIMAL.size:
+        onoff, tid = ONOFF_SET_MINIMAL.unpack_from(data, offset)
+        return Container(onoff=onoff, tid=tid, _name="minimal")
+
+    return None
+
+
+def build_generic_onoff_set(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "transition_time" in params and "delay" in params:
+        return _pack(
+            ONOFF_SET,
+            buffer,
+            offset,
+            params["onoff"],
+            params["tid"],
+            TRANSITION_TIME.encode[params["transition_time"]],
+            DELAY.encode[params["delay"]],
+        )
+
+    return _pack(ONOFF_SET_MINIMAL, buffer, offset, params["onoff"], params["tid"])
+
+
+def parse_generic_onoff_status(data, offset):
+    length = len(data) - offset
+
+    if length >= ONOFF_STATUS.size:
+        present_onoff, target_onoff, remaining_time = ONOFF_STATUS.unpack_from(data, offset)
+        return Container(
+            present_onoff=present_onoff,
+            target_onoff=target_onoff,
+            remaining_time=REMAINING_TIME.decode[remaining_time],
+            _name="optional",
+        )
+
+    if length >= ONOFF_STATUS_MINIMAL.size:
+        (present_onoff,) = ONOFF_STATUS_MINIMAL.unpack_from(data, offset)
+        return Container(present_onoff=present_onoff, _name="minimal")
+
+    return None
+
+
+def build_generic_onoff_status(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "target_onoff" in params and "remaining_time" in params:
+        return _pack(
+            ONOFF_STATUS,
+            buffer,
+            offset,
+            params["present_onoff"],
+            params["target_onoff"],
+            REMAINING_TIME.encode[params["remaining_time"]],
+        )
+
+    return _pack(ONOFF_STATUS_MINIMAL, buffer, offset, params["present_onoff"])
+
+
+def parse_generic_level_status(data, offset):
+    length = len(data) - offset
+
+    if length >= LEVEL_STATUS.size:
+        present_level, target_level, remaining_time = LEVEL_STATUS.unpack_from(data, offset)
+        return Container(
+            present_level=present_level,
+            target_level=target_level,
+            remaining_time=REMAINING_TIME.decode[remaining_time],
+            _name="optional",
+        )
+
+    if length >= LEVEL_STATUS_MINIMAL.size:
+        (present_level,) = LEVEL_STATUS_MINIMAL.unpack_from(data, offset)
+        return Container(present_level=present_level, _name="minimal")
+
+    return None
+
+
+def build_generic_level_status(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "target_level" in params and "remaining_time" in params:
+        return _pack(
+            LEVEL_STATUS,
+            buffer,
+            offset,
+            params["present_level"],
+            params["target_level"],
+            REMAINING_TIME.encode[params["remaining_time"]],
+        )
+
+    return _pack(LEVEL_STATUS_MINIMAL, buffer, offset, params["present_level"])
+
+
+def parse_light_lightness_set(data, offset):
+    length = len(data) - offset
+
+    if length >= LIGHTNESS_SET.size:
+        lightness, tid, transition_time, delay = LIGHTNESS_SET.unpack_from(data, offset)
+        return Container(
+            lightness=lightness,
+            tid=tid,
+            transition_time=TRANSITION_TIME.decode[transition_time],
+            delay=DELAY.decode[delay],
+            _name="optional",
+        )
+
+    if length >= LIGHTNESS_SET_MINIMAL.size:
+        lightness, tid = LIGHTNESS_SET_MINIMAL.unpack_from(data, offset)
+        return Container(lightness=lightness, tid=tid, _name="minimal")
+
+    return None
+
+
+def build_light_lightness_set(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "transition_time" in params and "delay" in params:
+        return _pack(
+            LIGHTNESS_SET,
+            buffer,
+            offset,
+            params["lightness"],
+            params["tid"],
+            TRANSITION_TIME.encode[params["transition_time"]],
+            DELAY.encode[params["delay"]],
+        )
+
+    return _pack(LIGHTNESS_SET_MINIMAL, buffer, offset, params["lightness"], params["tid"])
+
+
+def parse_light_lightness_status(data, offset):
+    length = len(data) - offset
+
+    if length >= LIGHTNESS_STATUS.size:
+        present_lightness, target_lightness, remaining_time = LIGHTNESS_STATUS.unpack_from(data, offset)
+        return Container(
+            present_lightness=present_lightness,
+            target_lightness=target_lightness,
+            remaining_time=REMAINING_TIME.decode[remaining_time],
+            _name="optional",
+        )
+
+    if length >= LIGHTNESS_STATUS_MINIMAL.size:
+        (present_lightness,) = LIGHTNESS_STATUS_MINIMAL.unpack_from(data, offset)
+        return Container(present_lightness=present_lightness, _name="minimal")
+
+    return None
+
+
+def build_light_lightness_status(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "target_lightness" in params and "remaining_time" in params:
+        return _pack(
+            LIGHTNESS_STATUS,
+            buffer,
+            offset,
+            params["present_lightness"],
+            params["target_lightness"],
+            REMAINING_TIME.encode[params["remaining_time"]],
+        )
+
+    return _pack(LIGHTNESS_STATUS_MINIMAL, buffer, offset, params["present_lightness"])
+
+
+def parse_light_ctl_status(data, offset):
+    length = len(data) - offset
+
+    if length >= CTL_STATUS.size:
+        (
+            present_ctl_lightness,
+            present_ctl_temperature,
+            target_ctl_lightness,
+            target_ctl_temperature,
+            remaining_time,
+        ) = CTL_STATUS.unpack_from(data, offset)
+        return Container(
+            present_ctl_lightness=present_ctl_lightness,
+            present_ctl_temperature=present_ctl_temperature,
+            target_ctl_lightness=target_ctl_lightness,
+            target_ctl_temperature=target_ctl_temperature,
+            remaining_time=REMAINING_TIME.decode[remaining_time],
+            _name="optional",
+        )
+
+    if length >= CTL_STATUS_MINIMAL.size:
+        present_ctl_lightness, present_ctl_temperature = CTL_STATUS_MINIMAL.unpack_from(data, offset)
+        return Container(
+            present_ctl_lightness=present_ctl_lightness,
+            present_ctl_temperature=present_ctl_temperature,
+            _name="minimal",
+        )
+
+    return None
+
+
+def build_light_ctl_status(params, buffer=None, offset=0):
+    if _named(params):
+        return None
+
+    if "target_ctl_lightness" in params and "target_ctl_temperature" in params and "remaining_time" in params:
+        return _pack(
+            CTL_STATUS,
+            buffer,
+            offset,
+            params["present_ctl_lightness"],
+            params["present_ctl_temperature"],
+            params["target_ctl_lightness"],
+            params["target_ctl_temperature"],
+            REMAINING_TIME.encode[params["remaining_time"]],
+        )
+
+    return _pack(
+        CTL_STATUS_MINIMAL, buffer, offset, params["present_ctl_lightness"], params["present_ctl_temperature"]
+    )
+
+
+GENERIC_ONOFF_SET = parse_generic_onoff_set, build_generic_onoff_set
+GENERIC_ONOFF_STATUS = parse_generic_onoff_status, build_generic_onoff_status
+GENERIC_LEVEL_STATUS = parse_generic_level_status, build_generic_level_status
+LIGHT_LIGHTNESS_SET = parse_light_lightness_set, build_light_lightness_set
+LIGHT_LIGHTNESS_STATUS = parse_light_lightness_status, build_light_lightness_status
+LIGHT_CTL_STATUS = parse_light_ctl_status, build_light_ctl_status
+
+FASTPATHS = {
+    GenericOnOffOpcode.GENERIC_ONOFF_SET: GENERIC_ONOFF_SET,
+    GenericOnOffOpcode.GENERIC_ONOFF_SET_UNACKNOWLEDGED: GENERIC_ONOFF_SET,
+    GenericOnOffOpcode.GENERIC_ONOFF_STATUS: GENERIC_ONOFF_STATUS,
+    GenericLevelOpcode.GENERIC_LEVEL_STATUS: GENERIC_LEVEL_STATUS,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_SET: LIGHT_LIGHTNESS_SET,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_SET_UNACKNOWLEDGED: LIGHT_LIGHTNESS_SET,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS: LIGHT_LIGHTNESS_STATUS,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_LINEAR_SET: LIGHT_LIGHTNESS_SET,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_LINEAR_SET_UNACKNOWLEDGED: LIGHT_LIGHTNESS_SET,
+    LightLightnessOpcode.LIGHT_LIGHTNESS_LINEAR_STATUS: LIGHT_LIGHTNESS_STATUS,
+    LightCTLOpcode.LIGHT_CTL_STATUS: LIGHT_CTL_STATUS,
+}
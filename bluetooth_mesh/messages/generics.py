@@ -22,40 +22,106 @@
 # pylint: disable=W0223
 
 
+import bisect
+import functools
+import math
+
 from construct import Adapter, BitsInteger, BitStruct, Float32b, Int8ul, Struct
 
+from bluetooth_mesh.messages.util import float_threshold
+
 
 class TransitionTimeAdapter(Adapter):
+    """
+    Transition time is a number of steps in one of four resolutions.
+
+    Decoding looks durations up in a table of all 256 encodings. Encoding bisects a sorted list of durations
+    at which the encoding changes, computed by evaluating the arithmetic encoding around each step of each
+    resolution, so results (including rounding and rejected values) are exactly the same. Values outside
+    of the table are encoded arithmetically.
+    """
+
     _subcon = Float32b
     RESOLUTION = {0b00: 0.1, 0b01: 1, 0b10: 10, 0b11: 10 * 60}  # noqa: RUF012
 
     def __init__(self, subcon, allow_unknown=False):
         self.max_steps = 0x3F if allow_unknown else 0x3E
+        self.durations, self.bounds, self.encodings = self._tables(self.max_steps)
         super().__init__(subcon)
 
-    def _decode(self, obj, context, path):
-        return obj["steps"] * self.RESOLUTION[obj["resolution"]]
-
-    def _encode(self, obj, context, path):
+    @classmethod
+    def _encode_arithmetic(cls, obj, max_steps):
         resolution = None
         steps = None
-        for range_index, range_value in self.RESOLUTION.items():
+        for range_index, range_value in cls.RESOLUTION.items():
             if obj <= range_value * 0x3F:
                 resolution = range_index
                 steps = obj / range_value
-                assert round(steps, 0) <= self.max_steps, "Unknown not allowed"
+                assert round(steps, 0) <= max_steps, "Unknown not allowed"
                 break
 
         assert resolution is not None
 
         return dict(steps=int(steps), resolution=resolution)
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _tables(cls, max_steps):
+        def encoding(obj):
+            try:
+                encoded = cls._encode_arithmetic(obj, max_steps)
+            except AssertionError:
+                return None
+            return encoded["steps"], encoded["resolution"]
+
+        durations = tuple(
+            steps * range_value for range_value in cls.RESOLUTION.values() for steps in range(0x40)
+        )
+
+        bounds = []
+        lower = 0.0
+        for range_value in cls.RESOLUTION.values():
+            upper = range_value * 0x3F
+            candidates = [lower]
+
+            # steps are truncated, and rejected once they round above max_steps
+            for steps in range(int(lower / range_value) + 1, 0x40):
+                candidates.append(
+                    float_threshold(lambda x, s=steps, r=range_value: int(x / r) >= s, steps * range_value)
+                )
+
+            candidates.append(
+                float_threshold(
+                    lambda x, r=range_value: round(x / r, 0) > max_steps, (max_steps + 0.5) * range_value
+                )
+            )
+
+            bounds.extend(bound for bound in candidates if lower <= bound <= upper)
+            lower = math.nextafter(upper, math.inf)
+
+        bounds = [*sorted(set(bounds)), lower]
+        return durations, bounds, [encoding(bound) for bound in bounds]
+
+    def _decode(self, obj, context, path):
+        return self.durations[obj["resolution"] << 6 | obj["steps"]]
+
+    def _encode(self, obj, context, path):
+        if isinstance(obj, (int, float)) and 0 <= obj < self.bounds[-1]:
+            encoding = self.encodings[bisect.bisect_right(self.bounds, obj) - 1]
+
+            if encoding is not None:
+                steps, resolution = encoding
+                return dict(steps=steps, resolution=resolution)
+
+        return self._encode_arithmetic(obj, self.max_steps)
+
 
 class Delay(Adapter):
     _subcon = Float32b
+    DELAYS = tuple(i / 200 for i in range(0x100))
 
     def _decode(self, obj, context, path):
-        return obj / 200
+        return self.DELAYS[obj]
 
     def _encode(self, obj, context, path):
         return int(obj * 200)
@@ -0,0 +1,136 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Per-opcode counters of access messages parsed and built, to find out which of them cost the most.
+
+Instrumentation is off by default. Once enabled with:
+
+    AccessMessage.instrumentation = Instrumentation()
+
+every parse(), parse_many() item, build() and build_into() call is counted and timed with
+time.perf_counter_ns(), fast path messages included. Counters are updated without locking, so calls made
+concurrently from several threads may occasionally be lost.
+"""
+
+import enum
+
+PARSE = "parse"
+BUILD = "build"
+
+
+class OpcodeStats:
+    """
+    Counters of a single operation on a single opcode. Calls that failed count into both count and errors, and
+    into latency, but not into bytes.
+    """
+
+    FIELDS = ("count", "errors", "bytes", "total_ns", "max_ns")
+    __slots__ = FIELDS
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def asdict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        return "OpcodeStats(%s)" % ", ".join("%s=%d" % item for item in self.asdict().items())
+
+
+class Instrumentation:
+    METRICS = (
+        # attribute, metric suffix, type, scale, help
+        ("count", "total", "counter", 1, "Access messages processed"),
+        ("errors", "errors_total", "counter", 1, "Access messages that failed to process"),
+        ("bytes", "bytes_total", "counter", 1, "Bytes of access payloads processed"),
+        ("total_ns", "seconds_total", "counter", 10**9, "Time spent processing access messages"),
+        ("max_ns", "seconds_max", "gauge", 10**9, "Longest time spent processing a single access message"),
+    )
+
+    def __init__(self):
+        self.stats = {PARSE: {}, BUILD: {}}
+
+    def record(self, operation, opcode, elapsed, size, failed=False):
+        """
+        Account a call that took elapsed nanoseconds and processed size bytes.
+        """
+        operation_stats = self.stats[operation]
+
+        stats = operation_stats.get(opcode)
+        if stats is None:
+            stats = operation_stats[opcode] = OpcodeStats()
+
+        stats.count += 1
+        stats.errors += failed
+        stats.bytes += size
+        stats.total_ns += elapsed
+        if elapsed > stats.max_ns:
+            stats.max_ns = elapsed
+
+    def reset(self):
+        for operation_stats in self.stats.values():
+            operation_stats.clear()
+
+    def snapshot(self):
+        """
+        Return a copy of counters, as {operation: {opcode: {counter: value}}}. Opcodes are enum members, integers
+        for opcodes not known to AccessMessage, or None for payloads too short to carry an opcode.
+        """
+        return {
+            operation: {opcode: stats.asdict() for opcode, stats in operation_stats.items()}
+            for operation, operation_stats in self.stats.items()
+        }
+
+    @staticmethod
+    def label(opcode):
+        if opcode is None:
+            return "invalid"
+
+        if isinstance(opcode, enum.Enum):
+            return opcode.name
+
+        return "0x%x" % opcode
+
+    def prometheus(self, prefix="bluetooth_mesh_messages"):
+        """
+        Render counters in Prometheus text exposition format, with operation and opcode labels.
+        """
+        lines = []
+
+        for attribute, suffix, metric_type, scale, description in self.METRICS:
+            name = "%s_%s" % (prefix, suffix)
+            lines.append("# HELP %s %s." % (name, description))
+            lines.append("# TYPE %s %s" % (name, metric_type))
+
+            for operation, operation_stats in self.stats.items():
+                for opcode, stats in operation_stats.items():
+                    value = getattr(stats, attribute)
+                    lines.append(
+                        '%s{operation="%s",opcode="%s"} %s'
+                        % (name, operation, self.label(opcode), value / scale if scale != 1 else value)
+                    )
+
+        return "\n".join(lines) + "\n"
@@ -29,6 +29,7 @@
 #   "GATT Specification Supplement v6"
 #   https://www.bluetooth.org/docman/handlers/DownloadDoc.ashx?doc_id=539729
 
+import bisect
 from datetime import date, timedelta
 from enum import IntEnum
 from math import log, pow
@@ -53,7 +54,7 @@ from construct import (
 )
 
 from bluetooth_mesh.messages.config import EmbeddedBitStruct
-from bluetooth_mesh.messages.util import AliasedContainer, DefaultCountValidator, EnumAdapter
+from bluetooth_mesh.messages.util import AliasedContainer, DefaultCountValidator, EnumAdapter, float_threshold
 
 
 class PropertyID(IntEnum):
@@ -218,13 +219,34 @@ class PropertyID(IntEnum):
 
 
 class TimeExponential8Validator(Adapter):
+    """
+    Decodes from a table of all 256 encodings, and encodes by bisecting durations at which the encoding
+    changes. Durations outside of the table are encoded arithmetically.
+    """
+
     _subcon = Float32b
+    SECONDS = tuple(round(pow(1.1, obj - 64), 4) if obj else 0 for obj in range(0x100))
+
+    # rounded logarithm grows by one at each bound
+    BOUNDS = tuple(
+        float_threshold(lambda x, obj=obj: round(log(x, 1.1)) + 64 >= obj, pow(1.1, obj - 64.5))
+        for obj in range(1, 0x101)
+    )
+
+    @staticmethod
+    def _encode_arithmetic(obj):
+        return round(log(obj, 1.1)) + 64 if obj else 0
 
     def _decode(self, obj, content, path):
-        return round(pow(1.1, obj - 64), 4) if obj else 0
+        return self.SECONDS[obj]
 
     def _encode(self, obj, content, path):
-        return round(log(obj, 1.1)) + 64 if obj else 0
+        bounds = self.BOUNDS
+
+        if isinstance(obj, (int, float)) and bounds[0] <= obj < bounds[-1]:
+            return bisect.bisect_right(bounds, obj)
+
+        return self._encode_arithmetic(obj)
 
 
 class DateAdapter(Adapter):
@@ -783,9 +805,7 @@ class PropertyMixin:
         property_name = property_id.name.lower()
         property_value = self.DICT[property_id]._parse(stream, context, path)
 
-        class _Container(AliasedContainer):
-            ALIAS = property_name
-            ORIGINAL = self.VALUE_FIELD
+        _Container = AliasedContainer.aliased(self.VALUE_FIELD, property_name)
 
         return _Container({**obj, self.ID_FIELD: property_id, property_name: property_value})
 
@@ -0,0 +1,255 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Typed records, a compact alternative to Containers for messages kept in memory, e.g. state tables.
+
+Parse with records=True:
+
+    >>> message = AccessMessage.parse(bytes.fromhex("8204000000"), records=True)
+    >>> message
+    GenericOnOffStatus(present_onoff=0, target_onoff=0, remaining_time=0.0)
+    >>> message.present_onoff
+    0
+
+and each message is decoded into an instance of a class generated for its opcode, with __slots__ named after
+params fields. Nested structures become records as well, lists stay lists, and internal entries of Containers
+(those starting with an underscore) are dropped. Fields missing from a message (e.g. optional transition of
+a set message) are left unset, so accessing them raises AttributeError.
+
+Records compare equal to records of the same message with the same field values, and asdict() turns them back
+into the shape accepted by build(). They are meant to be read, not modified.
+"""
+
+import functools
+import itertools
+
+from construct import Embedded, Renamed, Select, Struct
+
+from .util import NamedSelect
+
+
+class Record:
+    """
+    Base of generated record classes. FIELDS lists names of slots, in the order of the definition.
+    """
+
+    FIELDS = ()
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def items(self):
+        """
+        Yield (name, value) pairs of fields that are set.
+        """
+        for name in self.FIELDS:
+            try:
+                yield name, getattr(self, name)
+            except AttributeError:
+                pass
+
+    def asdict(self):
+        return {name: _asdict(value) for name, value in self.items()}
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+
+        return type(self).__name__ == type(other).__name__ and self.asdict() == other.asdict()
+
+    # records are mutable, like Containers
+    __hash__ = None
+
+    def __reduce__(self):
+        # generated classes can't be pickled by reference, so recreate them on unpickling
+        return _unpickle, (type(self).__name__, tuple(self.FIELDS), dict(self.items()))
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, ", ".join("%s=%r" % item for item in self.items()))
+
+
+class MessageRecord(Record):
+    """
+    Base of generated message classes. Slots hold params of the message, OPCODE and NAME (key of params in
+    a parsed Container) are class attributes.
+
+    Params which aren't a structure (e.g. a list of sensor descriptors) are kept in a single VALUE field.
+    """
+
+    OPCODE = None
+    NAME = None
+    VALUE = "value"
+    __slots__ = ()
+
+    def asdict(self):
+        if self.FIELDS == (self.VALUE,):
+            return {"opcode": self.OPCODE, self.NAME: _asdict(getattr(self, self.VALUE))}
+
+        return {"opcode": self.OPCODE, self.NAME: super().asdict()}
+
+    def __reduce__(self):
+        return _unpickle_message, (self.OPCODE, tuple(self.FIELDS), dict(self.items()))
+
+
+class UnknownMessage(Record):
+    """
+    Message with an opcode that isn't known, with params as raw bytes.
+    """
+
+    FIELDS = ("opcode", "params")
+    __slots__ = FIELDS
+
+
+def camelcase(name):
+    return "".join(word.capitalize() for word in name.split("_"))
+
+
+@functools.lru_cache(maxsize=None)
+def record_class(name, fields, base=Record):
+    """
+    Return a record class with given name and fields. Classes are created once for each combination and shared
+    between all records.
+    """
+    slots = tuple(field for field in fields if field not in base.FIELDS)
+    return type(name, (base,), dict(FIELDS=fields, __slots__=slots))
+
+
+def field_names(construct):
+    """
+    Names of fields parsed by a construct, in the order of the definition. Variants of a Select contribute
+    all of their fields.
+
+    Returns None for constructs that don't parse into a structure, or when names can't be told without parsing.
+    """
+    while isinstance(construct, Renamed):
+        construct = construct.subcon
+
+    if isinstance(construct, Struct):
+        names = []
+        for subcon in construct.subcons:
+            if isinstance(subcon, Embedded):
+                embedded = field_names(subcon.subcon)
+                if embedded is None:
+                    return None
+                names.extend(embedded)
+            elif subcon.name:
+                names.append(subcon.name)
+    elif isinstance(construct, NamedSelect | Select):
+        variants = (construct._subcon if isinstance(construct, NamedSelect) else construct).subcons
+        names = []
+        for variant in variants:
+            variant_names = field_names(variant)
+            if variant_names is None:
+                return None
+            names.extend(variant_names)
+    else:
+        return None
+
+    return [name for name in dict.fromkeys(names) if not name.startswith("_")]
+
+
+@functools.lru_cache(maxsize=None)
+def message_class(opcode):
+    """
+    Return a record class of messages with given opcode (a member of opcode enum), with fields taken from
+    definition of its params.
+    """
+    # records are imported by the package itself, so look definitions up once it's initialized
+    from . import AccessMessage
+
+    params = AccessMessage.OPCODES[type(opcode)].switch.cases.get(opcode)
+    prefix = type(opcode).__name__.removesuffix("Opcode")
+    name = camelcase(opcode.name.lower())
+    if name.lower().startswith(prefix.lower()):
+        name = prefix + name[len(prefix) :]
+
+    fields = tuple(field_names(params) or ())
+    return type(
+        name, (MessageRecord,), dict(OPCODE=opcode, NAME=opcode.name.lower(), FIELDS=fields, __slots__=fields)
+    )
+
+
+def record(message):
+    """
+    Convert a parsed message into a record.
+    """
+    opcode = message["opcode"]
+    name = getattr(opcode, "name", None)
+    if name is None:
+        return UnknownMessage(opcode=opcode, params=message["params"])
+
+    cls = message_class(opcode)
+    value = message[name.lower()]
+
+    if not isinstance(value, dict):
+        return record_class(cls.__name__, (cls.VALUE,), cls)(**{cls.VALUE: convert(value)})
+
+    fields = _fields(value)
+    if not fields.keys() <= set(cls.FIELDS):
+        # fields not known from the definition, make a variant with what was actually parsed
+        cls = record_class(cls.__name__, tuple(dict.fromkeys(itertools.chain(cls.FIELDS, fields))), cls)
+
+    return cls(**fields)
+
+
+def convert(value, name="record"):
+    """
+    Convert a parsed value into records. Name of the field is used to name the class of a nested structure.
+    """
+    if isinstance(value, Record):
+        return value
+
+    if isinstance(value, dict):
+        fields = _fields(value)
+        return record_class(camelcase(name), tuple(fields))(**fields)
+
+    if isinstance(value, list):
+        return [convert(item, name) for item in value]
+
+    return value
+
+
+def _fields(container):
+    return {key: convert(value, key) for key, value in container.items() if not key.startswith("_")}
+
+
+def _asdict(value):
+    if isinstance(value, Record):
+        return value.asdict()
+
+    if isinstance(value, list):
+        return [_asdict(item) for item in value]
+
+    return value
+
+
+def _unpickle(name, fields, values):
+    return record_class(name, fields)(**values)
+
+
+def _unpickle_message(opcode, fields, values):
+    cls = message_class(opcode)
+    if fields != cls.FIELDS:
+        cls = record_class(cls.__name__, fields, cls)
+    return cls(**values)
@@ -0,0 +1,90 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import enum
+
+from bluetooth_mesh.messages import AccessMessage
+
+
+class Router:
+    """
+    Dispatches access payloads to handlers by opcode, without parsing their params.
+
+    Handlers can be registered for:
+        - a vendor sub-opcode, e.g. DebugSubOpcode.UPTIME_STATUS,
+        - an opcode, e.g. GenericOnOffOpcode.GENERIC_ONOFF_STATUS or an integer for opcodes not known to
+          AccessMessage,
+        - a model, i.e. an opcode class such as SensorOpcode,
+    and are looked up in that order. Payloads that do not match any of them go to the default handler.
+
+    Each handler is called with the payload and its AccessHeader, as returned by AccessMessage.peek().
+    """
+
+    def __init__(self, default=None, access_message=AccessMessage):
+        self.default = default
+        self.access_message = access_message
+        self.vendor_opcodes = {v: k for k, v in access_message._subopcodes.items()}
+
+        self.subopcodes = {}
+        self.opcodes = {}
+        self.models = {}
+
+    def register(self, key, handler):
+        if isinstance(key, type) and key in self.access_message.OPCODES:
+            self.models[key] = handler
+
+        elif isinstance(key, enum.Enum) and type(key) in self.vendor_opcodes:
+            self.subopcodes[self.vendor_opcodes[type(key)], key.value] = handler
+
+        elif isinstance(key, int):
+            self.opcodes[int(key)] = handler
+
+        else:
+            raise TypeError("expected a model, an opcode or a vendor sub-opcode: %r" % (key,))
+
+        return handler
+
+    def route(self, key):
+        """
+        Decorator registering a handler.
+        """
+        return lambda handler: self.register(key, handler)
+
+    def resolve(self, header):
+        if header.subopcode is not None:
+            handler = self.subopcodes.get((header.opcode, header.subopcode))
+            if handler is not None:
+                return handler
+
+        handler = self.opcodes.get(header.opcode)
+        if handler is not None:
+            return handler
+
+        return self.models.get(header.model, self.default)
+
+    def dispatch(self, data):
+        header = self.access_message.peek(data)
+        handler = self.resolve(header)
+
+        if handler is None:
+            return None
+
+        return handler(data, header)
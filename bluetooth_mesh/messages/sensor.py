@@ -150,9 +150,7 @@ class SensorSettingRawMixin:
         except KeyError:
             sensor_setting_raw = list(stream_read_entire(stream))
 
-        class _Container(AliasedContainer):
-            ALIAS = sensor_setting_name
-            ORIGINAL = SENSOR_SETTING_RAW_NAME
+        _Container = AliasedContainer.aliased(SENSOR_SETTING_RAW_NAME, sensor_setting_name)
 
         return _Container({
             **kwargs,
@@ -0,0 +1,210 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Decoding of access payloads read from an asyncio stream, e.g. a socket or a UART bridge, where each payload is
+preceded by its length.
+
+PayloadReader reads frames in a background task into a bounded queue, and decodes them as they are consumed.
+When the consumer falls behind and the queue grows past a threshold, pending payloads are decoded in batches in
+an executor, so that the event loop keeps reading (and doing everything else) in the meantime. Once the queue
+is full, the background task stops reading from the stream, which in turn pauses the underlying transport.
+"""
+
+import asyncio
+import struct
+from collections import deque, namedtuple
+
+from bluetooth_mesh.messages import AccessMessage, ParseErrorPolicy, ParseFailure
+
+Frame = namedtuple("Frame", ["payload", "header", "message"])
+
+LENGTH_PREFIX = struct.Struct("<H")
+
+MAX_PENDING = 1024
+OFFLOAD_THRESHOLD = 64
+BATCH_SIZE = 256
+
+
+def _decode(start, payloads, models, access_message, contextkw):
+    frames = []
+
+    for index, payload in enumerate(payloads, start):
+        header = message = None
+
+        try:
+            header = access_message.peek(payload)
+            if models is None or header.model in models:
+                message = access_message.parse(payload, **contextkw)
+        except Exception as ex:
+            message = ParseFailure(index, payload, ex)
+
+        frames.append(Frame(payload, header, message))
+
+    return frames
+
+
+class PayloadReader:
+    """
+    Asynchronous iterator over access payloads read from an asyncio.StreamReader, each one preceded by a length
+    prefix (2 octets, little endian by default).
+
+    Yields Frames with the payload, its AccessHeader (as returned by AccessMessage.peek()) and the parsed
+    message. With models (opcode classes) given, payloads of other models are not parsed, and their message is
+    None. Depending on errors policy, a payload that fails to parse either raises, is skipped, or comes with
+    a ParseFailure record in place of the message. An incomplete frame at the end of the stream raises
+    asyncio.IncompleteReadError.
+
+    At most max_pending payloads are read ahead of the consumer. Once more than offload_threshold of them are
+    waiting, they are decoded in batches of up to batch_size in the executor (default executor of the event
+    loop if not given). Process executors work too, as long as contextkw can be pickled, and with the default
+    access_message only.
+
+    Payloads are decoded with given access_message, e.g. a trusted or instrumented _AccessMessage instance.
+
+    Reading starts on first iteration and stops at the end of the stream, or when the reader is closed with
+    aclose() (or by leaving an "async with" block).
+    """
+
+    def __init__(
+        self,
+        reader,
+        *,
+        prefix=LENGTH_PREFIX,
+        errors=ParseErrorPolicy.RAISE,
+        models=None,
+        access_message=AccessMessage,
+        executor=None,
+        max_pending=MAX_PENDING,
+        offload_threshold=OFFLOAD_THRESHOLD,
+        batch_size=BATCH_SIZE,
+        **contextkw,
+    ):
+        self.reader = reader
+        self.prefix = prefix
+        self.errors = ParseErrorPolicy(errors)
+        self.models = None if models is None else frozenset(models)
+        self.access_message = access_message
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.batch_size = batch_size
+        self.contextkw = contextkw
+
+        # number of payloads read so far, and how many of them were decoded in the executor
+        self.received = 0
+        self.offloaded = 0
+
+        self._pending = asyncio.Queue(max_pending)
+        self._decoded = deque()
+        self._task = None
+        self._done = False
+        self._error = None
+
+    async def _read(self):
+        try:
+            while True:
+                try:
+                    prefix = await self.reader.readexactly(self.prefix.size)
+                except asyncio.IncompleteReadError as ex:
+                    if ex.partial:
+                        raise
+                    break
+
+                (length,) = self.prefix.unpack(prefix)
+                await self._pending.put(await self.reader.readexactly(length))
+        except Exception as ex:
+            await self._pending.put(ex)
+        else:
+            await self._pending.put(None)
+
+    async def _fill(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._read())
+
+        payloads = []
+        if not self._done:
+            item = await self._pending.get()
+            offload = self._pending.qsize() >= self.offload_threshold
+            limit = self.batch_size if offload else 1
+
+            while True:
+                if not isinstance(item, bytes):
+                    self._done, self._error = True, item
+                    break
+
+                payloads.append(item)
+                if len(payloads) >= limit or self._pending.empty():
+                    break
+
+                item = self._pending.get_nowait()
+
+        if not payloads:
+            if self._error is not None:
+                raise self._error
+
+            raise StopAsyncIteration
+
+        start = self.received
+        self.received += len(payloads)
+
+        if offload:
+            self.offloaded += len(payloads)
+            frames = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _decode, start, payloads, self.models, self.access_message, self.contextkw
+            )
+        else:
+            frames = _decode(start, payloads, self.models, self.access_message, self.contextkw)
+
+        self._decoded.extend(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            while not self._decoded:
+                await self._fill()
+
+            frame = self._decoded.popleft()
+            if not isinstance(frame.message, ParseFailure):
+                return frame
+
+            if self.errors is ParseErrorPolicy.RAISE:
+                raise frame.message.error
+
+            if self.errors is ParseErrorPolicy.RECORD:
+                return frame
+
+    async def aclose(self):
+        self._done = True
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -21,8 +21,13 @@
 #
 # pylint: disable=W0223
 
+import bisect
+import copy
 import enum
+import functools
+import io
 import math
+import operator
 import re
 import sys
 from datetime import date, datetime, timedelta
@@ -31,31 +36,48 @@ from ipaddress import IPv4Address
 from construct import (
     Adapter,
     Bit,
+    BitsInteger,
     BitStruct,
     Bitwise,
+    Bytes,
+    Compiled,
     Computed,
     Construct,
+    ConstructError,
     Container,
     Embedded,
     Enum,
+    ExplicitError,
     ExprValidator,
+    Flag,
     Float64b,
     FuncPath,
+    GreedyBytes,
     IfThenElse,
     Int32ub,
+    IntegerError,
+    Padded,
     Pass,
     Rebuild,
+    Renamed,
     Restreamed,
     Select,
+    SelectError,
     SizeofError,
+    StreamError,
     Struct,
     Switch,
     ValidationError,
+    Validator,
     stream_read,
+    stream_seek,
+    stream_tell,
     stream_write,
     this,
 )
 
+from bluetooth_mesh.messages.cache import compile_cached
+
 
 def identity(x):
     return x
@@ -133,12 +155,64 @@ def EnumAdapter(subcon, enum):
     return _EnumAdapter(subcon)
 
 
+def float_threshold(predicate, guess):
+    """
+    Find the smallest float satisfying a monotonic predicate, starting from a guess a few ulps away from it.
+
+    Used to tabulate arithmetic encoders, so lookups give exactly the same results.
+    """
+    while predicate(math.nextafter(guess, -math.inf)):
+        guess = math.nextafter(guess, -math.inf)
+
+    while not predicate(guess):
+        guess = math.nextafter(guess, math.inf)
+
+    return guess
+
+
 def LogAdapter(subcon, *, max_value=None, infinity=False):
     class _LogAdapter(Adapter):
+        """
+        Decodes from a table of all encodings, and encodes by bisecting values at which the encoding changes.
+        Values outside of the tables (including the ones rejected by validation) are handled arithmetically.
+        """
+
         MAX_TYPE_VALUE = int(math.pow(2, subcon.length * 8) - 1)
         _subcon = subcon
 
-        def _decode(self, obj, context, path):
+        def __init__(self, subcon):
+            super().__init__(subcon)
+            self.values = [self._value(obj) for obj in range(min(self.MAX_TYPE_VALUE, 0xFF) + 1)]
+
+            # encoding is truncated logarithm, which is rejected once it exceeds max_value; table ends at 2**52,
+            # beyond which not all integers convert to floats exactly
+            self.bounds = [1.0]
+            for obj in range(2, min(self.MAX_TYPE_VALUE, 53) + 1):
+                self.bounds.append(
+                    float_threshold(lambda x, obj=obj: math.log(x, 2) + 1 >= obj, 2.0 ** (obj - 1))
+                )
+
+            if max_value is not None:
+                self.bounds.append(
+                    float_threshold(lambda x: math.log(x, 2) + 1 > max_value, 2.0 ** (max_value - 1))
+                )
+                self.bounds = sorted(bound for bound in self.bounds if bound <= self.bounds[-1])
+
+            self.encodings = [self._encoding(bound) for bound in self.bounds]
+
+        def _value(self, obj):
+            try:
+                return self._decode_arithmetic(obj)
+            except (ValidationError, OverflowError):
+                return None
+
+        def _encoding(self, obj):
+            try:
+                return self._encode_arithmetic(obj)
+            except ValidationError:
+                return None
+
+        def _decode_arithmetic(self, obj):
             if obj == 0:
                 return 0
 
@@ -151,7 +225,7 @@ def LogAdapter(subcon, *, max_value=None, infinity=False):
 
             return int(math.pow(2, obj - 1))
 
-        def _encode(self, obj, context, path):
+        def _encode_arithmetic(self, obj):
             if obj == 0:
                 return 0
 
@@ -168,6 +242,25 @@ def LogAdapter(subcon, *, max_value=None, infinity=False):
 
             return int(value)
 
+        def _decode(self, obj, context, path):
+            try:
+                value = self.values[obj]
+            except IndexError:
+                value = None
+
+            return self._decode_arithmetic(obj) if value is None else value
+
+        def _encode(self, obj, context, path):
+            bounds = self.bounds
+
+            if isinstance(obj, (int, float)) and bounds[0] <= obj < bounds[-1]:
+                encoding = self.encodings[bisect.bisect_right(bounds, obj) - 1]
+
+                if encoding is not None:
+                    return encoding
+
+            return self._encode_arithmetic(obj)
+
     return _LogAdapter(subcon)
 
 
@@ -184,6 +277,66 @@ def RangeValidator(subcon, *, min_value=None, max_value=None):
     return ExprValidator(subcon, validate_range)
 
 
+def strip_validators(construct):
+    """
+    Copy a construct with validators replaced by their subcons, for parsing payloads known to be valid.
+
+    Selects are kept as they are, since a failed validation is what makes them try the next alternative. The
+    exception are NamedSelects of fixed size variants, ordered from the longest one: these pick the longest
+    variant that fits, which for a valid payload is the one that parses. Parts without any validators to
+    strip are shared with the original.
+    """
+    stripped = {}
+
+    def strip(value):
+        if isinstance(value, Validator):
+            return strip(value.subcon)
+
+        if isinstance(value, NamedSelect):
+            if None in value.sizes or value.sizes != sorted(set(value.sizes), reverse=True):
+                return value
+
+            if id(value) not in stripped:
+                variants = {variant.name: strip(variant.subcon) for variant in value._subcon.subcons}
+                unchanged = all(variants[variant.name] is variant.subcon for variant in value._subcon.subcons)
+                stripped[id(value)] = value if unchanged else NamedSelect(**variants)
+
+            return stripped[id(value)]
+
+        if isinstance(value, (Select, Compiled)):
+            return value
+
+        if isinstance(value, Construct):
+            if id(value) not in stripped:
+                # a construct referring back to itself keeps referring to the original
+                stripped[id(value)] = value
+                attributes = {name: strip(attribute) for name, attribute in vars(value).items()}
+
+                if any(attribute is not getattr(value, name) for name, attribute in attributes.items()):
+                    # Construct.__copy__ is broken in construct 2.9
+                    stripped[id(value)] = object.__new__(type(value))
+                    vars(stripped[id(value)]).update(attributes)
+
+            return stripped[id(value)]
+
+        if type(value) in (list, tuple):
+            items = [strip(item) for item in value]
+            return value if all(map(operator.is_, items, value)) else type(value)(items)
+
+        if isinstance(value, dict):
+            items = {key: strip(item) for key, item in value.items()}
+            if all(item is value[key] for key, item in items.items()):
+                return value
+
+            value = copy.copy(value)
+            value.update(items)
+            return value
+
+        return value
+
+    return strip(construct)
+
+
 class FieldAdapter(Adapter):
     def __init__(self, subcon, field):
         self._subcon = field
@@ -196,6 +349,118 @@ class FieldAdapter(Adapter):
         return obj
 
 
+class BitFields(Construct):
+    """
+    Equivalent of BitStruct made of BitsInteger, Flag and Padding fields, possibly wrapped in adapters.
+
+    Instead of converting bytes into a string of bits, reads the whole (big endian, or little endian if
+    reversed, like Reversed(BitStruct(...))) integer at once and extracts fields by shifting and masking.
+    """
+
+    def __init__(self, *fields, reversed=False):
+        assert self.supports(fields), "Unsupported bit struct fields"
+        super().__init__()
+        self.fields = fields
+        self.byteorder = "little" if reversed else "big"
+        self.layout = []
+
+        shift = sum(self._width(base) for _name, _adapters, base in map(self._unwrap, fields))
+        self.length = shift // 8
+
+        for name, adapters, base in map(self._unwrap, fields):
+            shift -= self._width(base)
+
+            if name is not None:
+                mask = (1 << self._width(base)) - 1
+                sign = 1 << (base.length - 1) if base is not Flag and base.signed else None
+                self.layout.append((name, shift, mask, sign, base is Flag, adapters))
+
+    @staticmethod
+    def _unwrap(field):
+        """
+        Split a field into its name, adapters (innermost first) and the construct they wrap.
+        """
+        name = None
+        adapters = []
+
+        while isinstance(field, (Renamed, Adapter)):
+            if isinstance(field, Renamed):
+                name = field.name if name is None else name
+            else:
+                adapters.insert(0, field)
+            field = field.subcon
+
+        return name, adapters, field
+
+    @staticmethod
+    def _width(base):
+        return 1 if base is Flag else base.length
+
+    @classmethod
+    def supports(cls, fields):
+        width = 0
+
+        for name, _adapters, base in map(cls._unwrap, fields):
+            if base is Flag and name is not None:
+                pass
+            elif isinstance(base, BitsInteger) and name is not None:
+                if not isinstance(base.length, int) or base.length <= 0 or base.swapped:
+                    return False
+            elif isinstance(base, Padded) and name is None:
+                if base.subcon is not Pass or not isinstance(base.length, int) or base.pattern != b"\x00":
+                    return False
+            else:
+                return False
+
+            width += cls._width(base)
+
+        return width > 0 and width % 8 == 0
+
+    def _parse(self, stream, context, path):
+        value = int.from_bytes(stream_read(stream, self.length), self.byteorder)
+        obj = Container()
+
+        for name, shift, mask, sign, flag, adapters in self.layout:
+            field = (value >> shift) & mask
+
+            if flag:
+                field = field != 0
+            elif sign is not None and field & sign:
+                field -= mask + 1
+
+            for adapter in adapters:
+                field = adapter._decode(field, context, path)
+
+            obj[name] = field
+
+        return obj
+
+    def _build(self, obj, stream, context, path):
+        value = 0
+        built = Container()
+
+        for name, shift, mask, sign, flag, adapters in self.layout:
+            field = built[name] = obj[name]
+
+            for adapter in reversed(adapters):
+                field = adapter._encode(field, context, path)
+
+            if flag:
+                field = 1 if field else 0
+            elif not isinstance(field, int):
+                raise IntegerError("value %r is not an integer" % (field,))
+            elif field < 0 and sign is None:
+                raise IntegerError("value %r is negative, but field is not signed" % (field,))
+
+            value |= (field & mask) << shift
+
+        stream_write(stream, value.to_bytes(self.length, self.byteorder), self.length)
+        return built
+
+    def _sizeof(self, context, path):
+        return self.length
+
+
 def EmbeddedBitStruct(name, *fields, reversed=False):
     """
     Emulates BitStruct embedding:
@@ -204,10 +469,13 @@ def EmbeddedBitStruct(name, *fields, reversed=False):
 
     NOTE: This is a hack. Do not use unless you absolutely have to.
     """
-    bit_struct = BitStruct(*fields)
+    if BitFields.supports(fields):
+        bit_struct = BitFields(*fields, reversed=reversed)
+    else:
+        bit_struct = BitStruct(*fields)
 
-    if reversed:
-        bit_struct = Reversed(bit_struct)
+        if reversed:
+            bit_struct = Reversed(bit_struct)
 
     bit_struct.__construct_doc__ = Embedded(Struct(*fields))
 
@@ -257,6 +525,30 @@ class Opcode(Construct):
         except ValueError as ex:
             raise ValidationError from ex
 
+    @staticmethod
+    def unpack(data, offset=0):
+        """
+        Decode opcode from a buffer without going through a stream.
+
+        Returns opcode value and its length in bytes.
+        """
+        try:
+            opcode = data[offset]
+        except IndexError as ex:
+            raise StreamError("stream read less than specified amount, expected 1, found 0") from ex
+
+        if opcode == 0x7F:
+            raise ValidationError
+
+        length = 1 if not opcode >> 7 else opcode >> 6
+
+        if len(data) < offset + length:
+            raise StreamError(
+                "stream read less than specified amount, expected %d, found %d" % (length, len(data) - offset)
+            )
+
+        return int.from_bytes(data[offset : offset + length], byteorder="big"), length
+
     def _build(self, obj, stream, context, path):
         if obj > 0xFFFF:
             stream_write(stream, obj.to_bytes(3, byteorder="big"))
@@ -313,6 +605,29 @@ class AliasedContainer(Container):
     ALIAS = None
     ORIGINAL = None
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def aliased(cls, original, alias):
+        """
+        Return a subclass which resolves ORIGINAL to ALIAS. Subclasses are created once for each pair and
+        shared between all parsed objects.
+        """
+        return type(cls.__name__, (cls,), dict(ORIGINAL=original, ALIAS=alias))
+
+    @classmethod
+    def _unpickle(cls, original, alias):
+        return cls.aliased(original, alias)()
+
+    def __reduce__(self):
+        # subclasses returned by aliased() can't be pickled by reference, so recreate them on unpickling
+        return (
+            AliasedContainer._unpickle,
+            (self.ORIGINAL, self.ALIAS),
+            self.__getstate__(),
+            None,
+            iter(self.items()),
+        )
+
     def __getattr__(self, name):
         if name == self.ORIGINAL:
             name = self.ALIAS
@@ -396,9 +711,7 @@ class SwitchStruct(Adapter):
         except KeyError:
             value = obj[key.name.lower()]
 
-        class _Container(AliasedContainer):
-            ORIGINAL = self.switch.name
-            ALIAS = key.name.lower()
+        _Container = AliasedContainer.aliased(self.switch.name, key.name.lower())
 
         return _Container({self.key.name: key, key.name.lower(): value})
 
@@ -447,11 +760,168 @@ class NameAdapter(Adapter):
         return obj.get(self.subcon.name, obj)
 
 
+def stream_remaining(stream):
+    try:
+        position = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    return end - position
+
+
+class BufferStream:
+    """
+    Stream over a memoryview, for building messages in place and parsing them without copying. Positions are
+    offsets within the whole buffer, and writing past its end fails instead of growing it.
+
+    Reads return bytes, like io.BytesIO does, except for readview(), which returns a slice of the buffer.
+    """
+
+    __slots__ = ("buffer", "position")
+
+    def __init__(self, buffer, offset=0):
+        self.buffer = buffer
+        self.position = offset
+
+    def reset(self, buffer, offset=0):
+        """
+        Point the stream at another buffer, so one stream can be reused for a batch of payloads.
+        """
+        self.buffer = buffer
+        self.position = offset
+
+    def write(self, data):
+        end = self.position + len(data)
+        if end > len(self.buffer):
+            raise StreamError("buffer too small, %d bytes needed, %d available" % (end, len(self.buffer)))
+
+        self.buffer[self.position : end] = data
+        self.position = end
+        return len(data)
+
+    def read(self, count=-1):
+        start = self.position
+        data = self.buffer[start:] if count is None or count < 0 else self.buffer[start : start + count]
+        self.position = start + len(data)
+        return data.tobytes()
+
+    def readview(self, count=-1):
+        start = self.position
+        data = self.buffer[start:] if count is None or count < 0 else self.buffer[start : start + count]
+        self.position = start + len(data)
+        return data
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+
+        if not 0 <= offset <= len(self.buffer):
+            raise StreamError("seek to %d outside of buffer" % offset)
+
+        self.position = offset
+        return offset
+
+    def __reduce__(self):
+        # streams end up in _io entries of parsed Containers, and memoryviews can't be pickled
+        return _unpickle_stream, (self.buffer.tobytes(), self.position)
+
+
+def _unpickle_stream(data, position):
+    return BufferStream(memoryview(data), position)
+
+
+class BytesView(Bytes):
+    """
+    Bytes, which decode into a memoryview slice of the payload instead of a copy, when parsed from a memoryview
+    with memoryview=True context entry. Slices are valid as long as the underlying buffer is not modified.
+    """
+
+    def _parse(self, stream, context, path):
+        if not (context._params.get("memoryview") and isinstance(stream, BufferStream)):
+            return super()._parse(stream, context, path)
+
+        length = self.length(context) if callable(self.length) else self.length
+        if length < 0:
+            raise StreamError("length must be non-negative, found %s" % length)
+
+        data = stream.readview(length)
+        if len(data) != length:
+            raise StreamError(
+                "stream read less than specified amount, expected %d, found %d" % (length, len(data))
+            )
+
+        return data
+
+    def _build(self, obj, stream, context, path):
+        return super()._build(obj.tobytes() if isinstance(obj, memoryview) else obj, stream, context, path)
+
+    def _emitparse(self, code):
+        raise NotImplementedError
+
+
+class GreedyBytesViewConstruct(type(GreedyBytes)):
+    """
+    GreedyBytes, which decode into a memoryview slice of the payload, see BytesView.
+    """
+
+    def _parse(self, stream, context, path):
+        if not (context._params.get("memoryview") and isinstance(stream, BufferStream)):
+            return super()._parse(stream, context, path)
+
+        return stream.readview()
+
+    def _emitparse(self, code):
+        raise NotImplementedError
+
+
+GreedyBytesView = GreedyBytesViewConstruct()
+
+
 class NamedSelect(Adapter):
+    """
+    Select, which tags parsed objects with the name of a matching variant.
+
+    Variants usually differ only in length, so sizes of fixed length variants are calculated up front, and
+    variants that cannot fit in what is left of the stream are skipped instead of failing to parse. Variants of
+    variable length are tried as usual.
+    """
+
     def __init__(self, **subconskw):
-        subcons = list(NameAdapter(k / v.compile()) for k, v in subconskw.items())
+        subcons = list(NameAdapter(k / compile_cached(v)) for k, v in subconskw.items())
         super().__init__(Select(*subcons))
         self.__construct_doc__ = self._subcon = Select(**subconskw)
+        self.sizes = [self._sizeof_variant(subcon) for subcon in subcons]
+
+    @staticmethod
+    def _sizeof_variant(subcon):
+        try:
+            return subcon.sizeof()
+        except SizeofError:
+            return None
+
+    def _parse(self, stream, context, path):
+        fallback = stream_tell(stream)
+        remaining = stream_remaining(stream)
+
+        for subcon, size in zip(self.subcon.subcons, self.sizes, strict=True):
+            if size is not None and remaining is not None and size > remaining:
+                continue
+
+            try:
+                return subcon._parsereport(stream, context, path)
+            except ExplicitError:
+                raise
+            except ConstructError:
+                stream_seek(stream, fallback)
+
+        raise SelectError("no subconstruct matched")
 
     def _decode(self, obj, context, path):
         return obj
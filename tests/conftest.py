@@ -0,0 +1,235 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+"""
+Corpus of access payloads, collected from expected data of the test suite, for tests (and benchmarks) that
+should hold for every known message.
+
+Collecting the corpus uses only APIs of the library that predate it, so benchmarks can run it against older
+versions.
+"""
+
+import enum
+import importlib.util
+from collections import defaultdict
+from itertools import chain
+from pathlib import Path
+
+import pytest
+from construct import Construct, ConstructError, Struct
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.util import Opcode, SwitchStruct
+
+TESTS = Path(__file__).parent
+
+# test cases only checked for parsing, some of which don't build back into the same payload
+PARSE_ONLY = {
+    ("test_debug", "valid_parse"),
+    ("test_gateway_config_server", "valid"),
+}
+
+# payloads that parse, but build into a different form, e.g. legacy ARAP list size status with one octet fields
+PARSE_ONLY_PAYLOADS = {
+    bytes.fromhex("f53601220000"),
+    bytes.fromhex("f53601221234"),
+    bytes.fromhex("f5360122ffff"),
+}
+
+_CORPUS = {}
+
+
+def _subopcode_class(params):
+    """
+    Vendor model params start with a sub-opcode, find its enum.
+    """
+    if isinstance(params, SwitchStruct):
+        field = params.key
+    elif isinstance(params, Struct) and params.subcons:
+        field = params.subcons[0]
+    else:
+        return None
+
+    return getattr(field.subcon, "type", None) if field.name == "subopcode" else None
+
+
+def _load_module(path):
+    spec = importlib.util.spec_from_file_location(f"_corpus_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cases(path, module):
+    """
+    Yield values of valid test cases, i.e. items of module level lists named valid or valid_*.
+    """
+    for name, value in vars(module).items():
+        if not isinstance(value, list) or (path.stem, name) in PARSE_ONLY:
+            continue
+
+        if name != "valid" and not name.startswith("valid_"):
+            continue
+
+        for item in value:
+            # pytest.param() is a named tuple, look into its values instead
+            if isinstance(item, type(pytest.param())):
+                yield item.values
+            elif isinstance(item, tuple | list):
+                yield item
+            elif isinstance(item, bytes):
+                yield (item,)
+
+
+class _Definitions:
+    """
+    Opcodes of messages, looked up by what test cases identify them with.
+    """
+
+    def __init__(self):
+        self.opcodes = {}
+        self.names = {}
+        self.params = defaultdict(list)
+        self.subopcodes = defaultdict(list)
+
+        for opcode_class, message in AccessMessage.OPCODES.items():
+            for opcode in opcode_class:
+                self.opcodes[opcode] = self.names[opcode.name] = self.names[opcode.name.lower()] = opcode
+
+            for opcode, params in message.switch.cases.items():
+                # params constructs by identity
+                self.params[id(params)].append(opcode)
+
+                subopcode_class = _subopcode_class(params)
+                if subopcode_class is not None:
+                    self.subopcodes[subopcode_class].append(opcode)
+
+    def opcode(self, value):
+        if isinstance(value, str):
+            return self.names.get(value)
+
+        if isinstance(value, enum.Enum) and type(value) not in AccessMessage.OPCODES:
+            return None
+
+        if isinstance(value, int) and not isinstance(value, bool):
+            return self.opcodes.get(value)
+
+        return None
+
+    def leading_opcode(self, payload):
+        try:
+            return self.opcode(Opcode().parse(payload))
+        except ConstructError:
+            return None
+
+    def messages(self, payload, values, opcode_classes):
+        """
+        Yield access payloads made of encoded bytes of a test case, prefixed with an opcode if the case gives
+        params only.
+        """
+        for value in values:
+            if isinstance(value, dict) and self.opcode(value.get("opcode")) is not None:
+                yield payload
+                return
+
+            if isinstance(value, enum.Enum) and self.opcode(value) is not None:
+                yield payload
+                return
+
+            if isinstance(value, enum.Enum) and type(value) in self.subopcodes:
+                yield from (Opcode().build(opcode) + payload for opcode in self.subopcodes[type(value)])
+                return
+
+            if id(value) in self.params:
+                yield from (Opcode().build(opcode) + payload for opcode in self.params[id(value)])
+                return
+
+        opcode = self.leading_opcode(payload)
+        if opcode is None:
+            return
+
+        # a full message on its own, or with expected params of a model under test (which may give its opcode
+        # as a plain integer), but not params of a construct other than a message
+        if any(isinstance(value, Construct) for value in values):
+            return
+
+        if len(values) == 1:
+            yield payload
+        elif type(opcode) in opcode_classes and any(isinstance(value, dict) for value in values):
+            yield payload
+
+
+def _module_opcode_classes(path):
+    """
+    Opcode classes of models defined in the module under test, e.g. tests/test_sensor.py -> sensor.py
+    """
+    module_name = path.stem[len("test_") :]
+    return {
+        opcode_class
+        for opcode_class in AccessMessage.OPCODES
+        if opcode_class.__module__.rsplit(".", 1)[-1] == module_name
+    }
+
+
+def load_corpus(tests=TESTS):
+    """
+    Collect access payloads from valid test cases in tests/test_*.py.
+
+    Payloads are taken from expected data of each case: encoded bytes, prefixed with an opcode if the case
+    gives params only. The message is told by the case itself, i.e. by an opcode, a vendor sub-opcode (of
+    which the model is known) or a params construct, or by an opcode of a model under test the bytes start
+    with. Payloads are not parsed, so a message that the library gets wrong still lands in the corpus.
+
+    Returns a dict mapping opcode class (i.e. model) to a list of unique payloads. The result is cached, so
+    callers should not modify it.
+    """
+    if tests in _CORPUS:
+        return _CORPUS[tests]
+
+    corpus = defaultdict(dict)
+    definitions = _Definitions()
+
+    for path in sorted(tests.glob("test_*.py")):
+        try:
+            module = _load_module(path)
+        except (Exception, pytest.skip.Exception):
+            continue
+
+        opcode_classes = _module_opcode_classes(path)
+
+        for values in _cases(path, module):
+            for payload in (value for value in values if isinstance(value, bytes)):
+                for message in definitions.messages(payload, values, opcode_classes):
+                    if message in PARSE_ONLY_PAYLOADS:
+                        continue
+
+                    corpus[type(definitions.leading_opcode(message))][message] = None
+
+    _CORPUS[tests] = corpus = {opcode_class: list(payloads) for opcode_class, payloads in corpus.items()}
+    return corpus
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """
+    Payloads of the corpus, see load_corpus().
+    """
+    return list(chain(*load_corpus().values()))
@@ -19,9 +19,24 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 #
 #
+
 import pytest
+from construct import StreamError, ValidationError
 
-from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages import (
+    AccessHeader,
+    AccessMessage,
+    BufferWriter,
+    ParseErrorPolicy,
+    ParseFailure,
+    _AccessMessage,
+)
+from bluetooth_mesh.messages.config import ConfigOpcode
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.health import HealthOpcode
+from bluetooth_mesh.messages.sensor import SensorOpcode
+from bluetooth_mesh.messages.silvair.debug import DebugOpcode, DebugSubOpcode
+from bluetooth_mesh.messages.silvair.rrule_scheduler import RRuleSchedulerOpcode, RRuleSchedulerSubOpcode
 
 valid = [
     # fmt: off
@@ -81,3 +96,313 @@ def test_parse(encoded, decoded):
     result = AccessMessage.parse(data=encoded)
     # print(result)
     assert result == decoded
+
+
+# fmt: off
+single_pass = [
+    pytest.param(bytes.fromhex("04003601030405"), HealthOpcode, id="HealthCurrentStatus"),
+    pytest.param(bytes.fromhex("82020031323c"), GenericOnOffOpcode, id="GenericOnOffSet"),
+    pytest.param(bytes.fromhex("820400"), GenericOnOffOpcode, id="GenericOnOffStatus"),
+    pytest.param(bytes.fromhex("8003000102110000"), ConfigOpcode, id="ConfigAppKeyStatus"),
+    pytest.param(bytes.fromhex("5222004c2c00"), SensorOpcode, id="SensorStatus"),
+    pytest.param(bytes.fromhex("f536010b01020304"), DebugOpcode, id="DebugUptimeStatus"),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize("encoded,opcode_class", single_pass)
+def test_parse_same_as_message(encoded, opcode_class):
+    expected = AccessMessage.OPCODES[opcode_class].compile().parse(encoded)
+    result = AccessMessage.parse(data=encoded)
+
+    assert result == expected
+    assert list(result.keys()) == list(expected.keys())
+
+
+@pytest.mark.parametrize("name", ["HEALTH_FAULT_TEST", "health_fault_test"])
+def test_build_opcode_name(name):
+    decoded = {"opcode": name, "params": {"test_id": 1, "company_id": 0x0136}}
+
+    assert AccessMessage.build(obj=decoded) == bytes.fromhex("8032013601")
+    assert decoded["opcode"] is HealthOpcode.HEALTH_FAULT_TEST
+
+
+def test_build_unknown_opcode_name():
+    with pytest.raises(ValidationError):
+        AccessMessage.build(obj={"opcode": "HEALTH_FAULT_TEST_FOO", "params": {}})
+
+
+def test_parse_many():
+    encoded = [param.values[0] for param in valid + single_pass]
+
+    assert list(AccessMessage.parse_many(encoded)) == [AccessMessage.parse(i) for i in encoded]
+    assert AccessMessage.parse_list(encoded) == [AccessMessage.parse(i) for i in encoded]
+
+
+def test_parse_many_views():
+    encoded = [bytes.fromhex("00563412") + bytes([i]) * 16 for i in range(3)]
+    messages = _AccessMessage(fastpaths={}).parse_list(encoded, memoryview=True)
+
+    assert [message.config_appkey_add.app_key for message in messages] == [bytes([i]) * 16 for i in range(3)]
+    assert [message.config_appkey_add.app_key.obj for message in messages] == encoded
+
+
+def test_parse_many_raise():
+    with pytest.raises(StreamError):
+        AccessMessage.parse_list([bytes.fromhex("820400"), bytes.fromhex("8032")])
+
+
+@pytest.mark.parametrize("errors", [ParseErrorPolicy.SKIP, "skip"])
+def test_parse_many_skip(errors):
+    result = AccessMessage.parse_list([bytes.fromhex("8032"), bytes.fromhex("820400")], errors=errors)
+
+    assert result == [AccessMessage.parse(bytes.fromhex("820400"))]
+
+
+def test_parse_many_record():
+    failure, message = AccessMessage.parse_list(
+        [bytes.fromhex("8032"), bytes.fromhex("820400")], errors=ParseErrorPolicy.RECORD
+    )
+
+    assert isinstance(failure, ParseFailure)
+    assert failure.index == 0
+    assert failure.data == bytes.fromhex("8032")
+    assert isinstance(failure.error, StreamError)
+    assert message == AccessMessage.parse(bytes.fromhex("820400"))
+
+
+def test_compile_on_first_use():
+    access_message = _AccessMessage(fastpaths={})
+    assert all(params is None for _, _, params in access_message._opcodes.values())
+
+    assert access_message.parse(bytes.fromhex("820400")) == AccessMessage.parse(bytes.fromhex("820400"))
+
+    for opcode, (_, _, params) in access_message._opcodes.items():
+        assert (params is not None) == (opcode in GenericOnOffOpcode._value2member_map_)
+
+
+def test_warmup():
+    access_message = _AccessMessage()
+    access_message.warmup(models=[HealthOpcode, DebugOpcode])
+
+    for opcode, (_, _, params) in access_message._opcodes.items():
+        assert (params is not None) == isinstance(opcode, (HealthOpcode, DebugOpcode))
+
+    access_message.warmup()
+    assert all(params is not None for _, _, params in access_message._opcodes.values())
+
+    access_message.warmup(models=[HealthOpcode], trusted=True)
+    assert list(access_message._trusted) == [HealthOpcode]
+
+
+def test_build_into_corpus(corpus):
+    messages = [AccessMessage.parse(payload) for payload in corpus]
+    buffer = bytearray(sum(len(AccessMessage.build(message)) for message in messages) + 1)
+
+    offset = 1
+    for message in messages:
+        encoded = AccessMessage.build(message)
+        assert AccessMessage.build_into(message, buffer, offset) == len(encoded)
+        assert buffer[offset : offset + len(encoded)] == encoded
+        offset += len(encoded)
+
+    assert offset == len(buffer)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(bytes.fromhex("8204000102"), id="fast path"),
+        pytest.param(bytes.fromhex("8039010203040506070809"), id="construct"),
+    ],
+)
+def test_build_into_too_small(payload):
+    buffer = bytearray(len(payload) - 1)
+
+    with pytest.raises(StreamError):
+        AccessMessage.build_into(AccessMessage.parse(payload), buffer)
+
+    with pytest.raises(StreamError):
+        AccessMessage.build_into(AccessMessage.parse(payload), bytearray(len(payload) + 1), 2)
+
+    assert len(buffer) == len(payload) - 1
+
+
+def test_buffer_writer():
+    payloads = [bytes.fromhex("8204000102"), bytes.fromhex("8039010203040506070809"), bytes.fromhex("820400")]
+    buffer = bytearray(30)
+
+    with BufferWriter(buffer, offset=2) as writer:
+        for payload in payloads:
+            assert writer.write(AccessMessage.parse(payload)) == len(payload)
+
+        with pytest.raises(StreamError):
+            writer.write(AccessMessage.parse(payloads[1]))
+
+        assert writer.position == 2 + sum(map(len, payloads))
+        assert writer.remaining == len(buffer) - writer.position
+        assert writer.getbuffer() == b"".join(payloads)
+
+        writer.reset()
+        assert writer.write(AccessMessage.parse(payloads[2])) == 3
+        assert writer.getbuffer() == payloads[2]
+
+    # buffer can be resized again once the writer is closed
+    buffer.extend(bytes(8))
+
+
+def test_trusted_corpus(corpus):
+    for payload in corpus:
+        assert AccessMessage.parse(payload, trusted=True) == AccessMessage.parse(payload)
+
+
+def test_trusted_skips_validation():
+    # TTL above 0x7F
+    payload = bytes.fromhex("80390102030480060708f9")
+
+    with pytest.raises(ValidationError):
+        AccessMessage.parse(payload)
+
+    assert AccessMessage.parse(payload, trusted=True).config_hearbeat_publication_set.ttl == 0x80
+
+    access_message = _AccessMessage(trusted=True)
+    assert access_message.parse(payload).config_hearbeat_publication_set.ttl == 0x80
+    assert list(access_message.parse_many([payload])) == [access_message.parse(payload)]
+
+    with pytest.raises(ValidationError):
+        access_message.parse(payload, trusted=False)
+
+
+def test_parse_view_corpus(corpus):
+    buffer = bytearray(b"\xff") + b"".join(corpus) + b"\xff"
+
+    offset = 1
+    for payload in corpus:
+        message = AccessMessage.parse(payload)
+        assert AccessMessage.parse(buffer, offset, len(payload)) == message
+        assert (
+            AccessMessage.parse(memoryview(buffer)[offset : offset + len(payload)], memoryview=True)
+            == message
+        )
+        offset += len(payload)
+
+    views = [memoryview(buffer)[1 : 1 + len(corpus[0])], corpus[0]]
+    assert list(AccessMessage.parse_many(views)) == [AccessMessage.parse(corpus[0])] * 2
+
+
+def test_parse_view_fields():
+    # app key add, followed by another message in the same buffer
+    buffer = bytearray.fromhex("0001020300112233445566778899aabbccddeeff 8204")
+    app_key = bytes.fromhex("00112233445566778899aabbccddeeff")
+
+    message = AccessMessage.parse(buffer, 0, 20)
+    assert type(message.config_appkey_add.app_key) is bytes
+
+    message = AccessMessage.parse(buffer, 0, 20, memoryview=True)
+    assert isinstance(message.config_appkey_add.app_key, memoryview)
+    assert message.config_appkey_add.app_key == app_key
+    assert AccessMessage.build(message) == buffer[:20]
+
+    # unknown opcode
+    message = AccessMessage.parse(bytes.fromhex("f0010203"), memoryview=True)
+    assert isinstance(message.params, memoryview)
+    assert message.params == bytes.fromhex("03")
+    assert AccessMessage.build(message) == bytes.fromhex("f0010203")
+
+    # slices point into the buffer
+    buffer[4] = 0xFF
+    assert message.params == bytes.fromhex("03")
+    assert AccessMessage.parse(buffer, 0, 20, memoryview=True).config_appkey_add.app_key[0] == 0xFF
+
+    with pytest.raises(StreamError):
+        AccessMessage.parse(buffer, 0, 19, memoryview=True)
+
+    with pytest.raises(ValueError):
+        AccessMessage.parse(buffer, len(buffer) + 1)
+
+    with pytest.raises(ValueError):
+        AccessMessage.parse(buffer, 0, len(buffer) + 1)
+
+    with pytest.raises(ValueError):
+        AccessMessage.parse(buffer, 0, -1)
+
+
+def test_parse_buffer_released():
+    # battery status, with flags in a nested Container
+    payload = bytes.fromhex("822450ffffff0000001b")
+    access_message = _AccessMessage(fastpaths={})
+
+    for args in [(), (0, len(payload))]:
+        buffer = bytearray(payload)
+        message = access_message.parse(buffer, *args)
+        buffer.extend(b"\xff")
+        assert message == access_message.parse(payload)
+
+    # composition data page 1, with elements in nested Containers
+    payload = bytes.fromhex("0201010000")
+    buffer = bytearray(payload)
+    messages = access_message.parse_list([payload, buffer, memoryview(buffer)])
+    buffer.extend(b"\xff")
+    assert messages == [access_message.parse(payload)] * 3
+
+    # no message sees a payload of another one through the shared stream
+    assert all(
+        message.config_composition_data_status.first.element[0]._io.read() == b"" for message in messages
+    )
+
+
+# fmt: off
+peek = [
+    pytest.param(
+        bytes.fromhex("04003601030405"),
+        AccessHeader(HealthOpcode.HEALTH_CURRENT_STATUS, HealthOpcode, None, 1),
+        id="1 byte opcode"
+    ),
+    pytest.param(
+        bytes.fromhex("820400"),
+        AccessHeader(GenericOnOffOpcode.GENERIC_ONOFF_STATUS, GenericOnOffOpcode, None, 2),
+        id="2 byte opcode"
+    ),
+    pytest.param(
+        bytes.fromhex("f536010b01020304"),
+        AccessHeader(DebugOpcode.SILVAIR_DEBUG, DebugOpcode, DebugSubOpcode.UPTIME_STATUS, 3),
+        id="vendor opcode"
+    ),
+    pytest.param(
+        bytes.fromhex("e8360100"),
+        AccessHeader(
+            RRuleSchedulerOpcode.SILVAIR_RRULE_SCHEDULER,
+            RRuleSchedulerOpcode,
+            RRuleSchedulerSubOpcode.RULES_LIST_GET,
+            3
+        ),
+        id="vendor opcode with sub-opcode struct"
+    ),
+    pytest.param(
+        bytes.fromhex("f53601ff"),
+        AccessHeader(DebugOpcode.SILVAIR_DEBUG, DebugOpcode, 0xff, 3),
+        id="unknown sub-opcode"
+    ),
+    pytest.param(
+        bytes.fromhex("f53601"),
+        AccessHeader(DebugOpcode.SILVAIR_DEBUG, DebugOpcode, None, 3),
+        id="missing sub-opcode"
+    ),
+    pytest.param(
+        bytes.fromhex("c0112233"),
+        AccessHeader(0xc01122, None, None, 3),
+        id="unknown opcode"
+    ),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize("encoded,header", peek)
+def test_peek(encoded, header):
+    assert AccessMessage.peek(encoded) == header
+
+
+@pytest.mark.parametrize("encoded", [b"", bytes.fromhex("82"), bytes.fromhex("f536")])
+def test_peek_truncated(encoded):
+    with pytest.raises(StreamError):
+        AccessMessage.peek(encoded)
@@ -0,0 +1,98 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import runpy
+import subprocess
+import sys
+
+import pytest
+from construct import SelectError
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.aot import CODECS, SOURCE, build, parse
+from bluetooth_mesh.messages.aot.generator import generate
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.util import Opcode
+
+
+@pytest.fixture(scope="module")
+def valid(corpus):
+    return [payload for payload in corpus if Opcode.unpack(payload)[0] in CODECS.PARSE]
+
+
+@pytest.fixture(scope="module")
+def fallback(corpus):
+    return [payload for payload in corpus if Opcode.unpack(payload)[0] not in CODECS.PARSE]
+
+
+def test_parse_valid(valid):
+    for encoded in valid:
+        decoded = AccessMessage.parse(encoded)
+        assert parse(encoded) == decoded, encoded.hex()
+        assert decoded == parse(encoded), encoded.hex()
+        assert repr(parse(encoded)) == repr(decoded), encoded.hex()
+
+
+def test_build_valid(valid):
+    for encoded in valid:
+        assert build(parse(encoded)) == encoded, encoded.hex()
+        assert build(AccessMessage.parse(encoded)) == encoded, encoded.hex()
+
+
+def test_parse_fallback(fallback):
+    for encoded in fallback:
+        assert parse(encoded) == AccessMessage.parse(encoded), encoded.hex()
+
+
+def test_parse_short():
+    with pytest.raises(SelectError):
+        parse(bytes.fromhex("8202"))
+
+
+def test_build_by_name():
+    obj = dict(opcode="generic_onoff_set", params=dict(onoff=1, tid=0x22))
+    assert build(obj) == AccessMessage.build(obj)
+
+
+def test_build_invalid():
+    obj = dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET, params=dict(onoff=0x100, tid=0x22))
+    with pytest.raises(SelectError):
+        build(obj)
+
+
+def test_generated_module(tmp_path):
+    module = tmp_path / "codecs.py"
+    with open(module, "w") as file:
+        generate(file=file)
+
+    assert module.read_text() == SOURCE
+    assert runpy.run_path(module)["parse"](bytes.fromhex("8202012200")) == parse(bytes.fromhex("8202012200"))
+
+
+def test_import():
+    # e.g. capnproto generator imports every module of the package, __main__ included
+    script = """
+import bluetooth_mesh.messages.aot.__main__
+from bluetooth_mesh.messages import aot
+assert aot.load_codecs.cache_info().currsize == 0
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout == ""
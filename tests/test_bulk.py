@@ -0,0 +1,96 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+import pytest
+from construct import SelectError
+
+from bluetooth_mesh.messages import AccessMessage, ParseErrorPolicy
+from bluetooth_mesh.messages.bulk import decode, read_payloads
+
+invalid = [
+    bytes.fromhex("8204"),
+    bytes.fromhex("8202"),
+    bytes.fromhex("ff"),
+]
+
+
+def test_decode(corpus):
+    assert decode(corpus, workers=2, shard_size=64) == AccessMessage.parse_list(corpus)
+
+
+def test_decode_executor(corpus):
+    with ThreadPoolExecutor(2) as executor:
+        assert decode(corpus, shard_size=7, executor=executor) == AccessMessage.parse_list(corpus)
+
+
+def test_decode_columnar(corpus):
+    columns = decode(invalid + corpus, workers=2, errors=ParseErrorPolicy.SKIP, columnar=True, shard_size=64)
+    messages = AccessMessage.parse_list(corpus)
+
+    assert list(columns.index) == list(range(len(invalid), len(invalid) + len(corpus)))
+    assert list(columns.opcode) == [message.opcode for message in messages]
+    assert columns.params == [message[message.opcode.name.lower()] for message in messages]
+    assert columns.failures == []
+
+
+@pytest.mark.parametrize("shard_size", [1, 2, 64])
+def test_decode_record(corpus, shard_size):
+    payloads = list(chain(*zip(corpus, invalid * 2, strict=False)))
+
+    with ThreadPoolExecutor(2) as executor:
+        decoded = decode(payloads, errors=ParseErrorPolicy.RECORD, shard_size=shard_size, executor=executor)
+
+    assert decoded[0::2] == AccessMessage.parse_list(corpus[: len(invalid) * 2])
+    assert [(failure.index, failure.data) for failure in decoded[1::2]] == [
+        (index, data) for index, data in enumerate(payloads) if index % 2
+    ]
+
+
+def test_decode_columnar_record(corpus):
+    columns = decode(
+        corpus[:2] + invalid, workers=2, errors=ParseErrorPolicy.RECORD, columnar=True, shard_size=2
+    )
+
+    assert list(columns.index) == [0, 1]
+    assert [(failure.index, failure.data) for failure in columns.failures] == [
+        (2, invalid[0]),
+        (3, invalid[1]),
+        (4, invalid[2]),
+    ]
+
+
+def test_decode_raise(corpus):
+    with pytest.raises(SelectError):
+        decode(corpus + invalid, workers=2, shard_size=64)
+
+
+def test_read_payloads(tmp_path):
+    capture = tmp_path / "capture.txt"
+    capture.write_text("# capture\n8201\n\n820400\n  8202 0122\n")
+
+    assert list(read_payloads(capture)) == [
+        bytes.fromhex("8201"),
+        bytes.fromhex("820400"),
+        bytes.fromhex("82020122"),
+    ]
@@ -0,0 +1,80 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import os
+
+import pytest
+
+from bluetooth_mesh.messages import cache
+from bluetooth_mesh.messages.generic.level import GenericLevelMessage
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffMessage
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(cache, "ENABLED", True)
+    return tmp_path / cache.VERSION
+
+
+def test_compile_cached(cache_dir):
+    compiled = cache.compile_cached(GenericOnOffMessage)
+
+    assert compiled.parse(bytes.fromhex("82020031323c")) == GenericOnOffMessage.parse(
+        bytes.fromhex("82020031323c")
+    )
+    assert os.listdir(cache_dir) == [compiled.modulename]
+
+
+def test_compile_cached_load(cache_dir, monkeypatch):
+    cache.compile_cached(GenericOnOffMessage)
+
+    def fail(*args):
+        raise AssertionError("should have been loaded from cache")
+
+    monkeypatch.setattr(cache, "compile", fail, raising=False)
+    compiled = cache.compile_cached(GenericOnOffMessage)
+
+    assert compiled.parse(bytes.fromhex("820400")) == GenericOnOffMessage.parse(bytes.fromhex("820400"))
+
+
+def test_compile_cached_key(cache_dir):
+    onoff = cache.compile_cached(GenericOnOffMessage)
+    level = cache.compile_cached(GenericLevelMessage)
+
+    assert onoff.modulename != level.modulename
+    assert sorted(os.listdir(cache_dir)) == sorted([onoff.modulename, level.modulename])
+
+
+def test_compile_cached_corrupted(cache_dir):
+    compiled = cache.compile_cached(GenericOnOffMessage)
+    (cache_dir / compiled.modulename).write_bytes(b"garbage")
+
+    compiled = cache.compile_cached(GenericOnOffMessage)
+    assert compiled.parse(bytes.fromhex("820400")) == GenericOnOffMessage.parse(bytes.fromhex("820400"))
+
+
+def test_compile_cached_disabled(cache_dir, monkeypatch):
+    monkeypatch.setattr(cache, "ENABLED", False)
+    compiled = cache.compile_cached(GenericOnOffMessage)
+
+    assert compiled.parse(bytes.fromhex("820400")) == GenericOnOffMessage.parse(bytes.fromhex("820400"))
+    assert not cache_dir.exists()
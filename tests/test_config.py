@@ -22,7 +22,7 @@
 from copy import deepcopy
 
 import pytest
-from construct import ValidationError
+from construct import Int8ul, IntegerError, SelectError, Struct, ValidationError
 
 from bluetooth_mesh.messages.config import *
 
@@ -1463,3 +1463,111 @@ def test_invalid_retransmit(message, encoded, decoded):
     _decoded = deepcopy(decoded)
     with pytest.raises(AttributeError):
         message.build(obj=_decoded)
+
+
+def test_key_indices_not_mutated():
+    indices = [0x789, 0x123, 0x456]
+    assert KeyIndices.build(indices) == bytes.fromhex("563412 8907")
+    assert indices == [0x789, 0x123, 0x456]
+
+
+def test_key_indices_trailing_octet():
+    message = Struct("app_key_indices" / KeyIndices, "trailer" / Int8ul)
+    assert message.parse(bytes.fromhex("563412 89")) == dict(app_key_indices=[0x123, 0x456], trailer=0x89)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 1000, 1001])
+def test_key_indices_round_trip(count):
+    indices = [(index * 7) % 0x1000 for index in range(count)]
+    encoded = KeyIndices.build(indices)
+    assert len(encoded) == count // 2 * 3 + count % 2 * 2
+    assert KeyIndices.parse(encoded) == sorted(indices)
+
+
+@pytest.mark.parametrize("indices", [[-1], [1, -1], [1, 1.5], ["a"]])
+def test_key_indices_invalid(indices):
+    with pytest.raises(SelectError):
+        KeyIndices.build(indices)
+
+
+def test_address_types():
+    assert ADDRESS_TYPES[0x0000] == AddressType.UNASSIGNED.value
+    assert ADDRESS_TYPES[0xFFFF] == AddressType.ALL_NODES.value
+    assert all(get_address_type(address).value == ADDRESS_TYPES[address] for address in range(0x10000))
+    assert classify_addresses(range(0x10000)) == ADDRESS_TYPES
+
+
+@pytest.mark.parametrize(
+    "address,address_type",
+    [
+        (0x0001, AddressType.UNICAST),
+        (0x7FFF, AddressType.UNICAST),
+        (0x8000, AddressType.VIRTUAL),
+        (0xBFFF, AddressType.VIRTUAL),
+        (0xC000, AddressType.GROUP),
+        (0xFEFF, AddressType.GROUP),
+        (0xFF00, AddressType.RFU),
+        (0xFFFB, AddressType.RFU),
+        (0xFFFC, AddressType.ALL_PROXIES),
+        (0xFFFD, AddressType.ALL_FRIENDS),
+        (0xFFFE, AddressType.ALL_RELAYS),
+        # outside of the table
+        (-1, AddressType.GROUP),
+        (0x10000, AddressType.UNICAST),
+    ],
+)
+def test_get_address_type(address, address_type):
+    assert get_address_type(address) is address_type
+
+
+def test_classify_addresses_out_of_range():
+    with pytest.raises(OverflowError):
+        classify_addresses([0x10000])
+
+
+def test_classify_addresses_numpy():
+    numpy = pytest.importorskip("numpy")
+    addresses = numpy.arange(0x10000, dtype=numpy.uint16)
+    assert classify_addresses(addresses).tobytes() == ADDRESS_TYPES
+
+    with pytest.raises(ValueError):
+        classify_addresses(numpy.array([-1]))
+
+
+def test_address_set_partition():
+    addresses = AddressSet([0xC001, 0x0001, 0x8000, 0xC000, 0x0002, 0xFFFF])
+    assert addresses.partition() == {
+        AddressType.UNICAST: [0x0001, 0x0002],
+        AddressType.GROUP: [0xC001, 0xC000],
+        AddressType.VIRTUAL: [0x8000],
+        AddressType.ALL_NODES: [0xFFFF],
+    }
+    assert addresses.unicast == [0x0001, 0x0002]
+    assert addresses.group == [0xC001, 0xC000]
+    assert addresses.virtual == [0x8000]
+    assert addresses.select(AddressType.GROUP, AddressType.ALL_NODES) == [0xC001, 0xC000, 0xFFFF]
+    assert addresses[1:3] == AddressSet([0x0001, 0x8000])
+
+
+def test_address_list_address_set():
+    message = ConfigSIGModelSubscriptionList
+    encoded = bytes.fromhex("00 0100 0010 01c0 02c0 0180")
+    decoded = message.parse(encoded)
+    assert decoded.addresses == [0xC001, 0xC002, 0x8001]
+    assert type(decoded.addresses) is list
+
+    decoded = message.parse(encoded, address_set=True)
+    assert isinstance(decoded.addresses, AddressSet)
+    assert decoded.addresses.group == [0xC001, 0xC002]
+    assert message.build(decoded) == encoded
+
+
+def test_address_list_trailing_octet():
+    message = Struct("addresses" / Addresses, "trailer" / Int8ul)
+    assert message.parse(bytes.fromhex("01c0 02c0 ff")) == dict(addresses=[0xC001, 0xC002], trailer=0xFF)
+
+
+@pytest.mark.parametrize("addresses", [[-1], [0x10000], [1, 1.5]])
+def test_address_list_invalid(addresses):
+    with pytest.raises(IntegerError):
+        Addresses.build(addresses)
@@ -0,0 +1,157 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import random
+
+import pytest
+
+from bluetooth_mesh.messages import AccessMessage, _AccessMessage
+from bluetooth_mesh.messages.fastpath import DELAY, FASTPATHS, REMAINING_TIME, TRANSITION_TIME
+from bluetooth_mesh.messages.generic.level import GenericLevelOpcode
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.generics import OptionalSetParameters
+from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
+from bluetooth_mesh.messages.util import Opcode
+
+Construct = _AccessMessage(fastpaths={})
+
+
+def _payloads(opcode):
+    rng = random.Random(opcode)
+    prefix = Opcode().build(opcode)
+
+    for length in range(12):
+        yield prefix + rng.randbytes(length)
+
+    # every value of transition time, remaining time and delay fields in each position they can take
+    for size in (3, 4, 5, 9):
+        for value in range(256):
+            yield prefix + rng.randbytes(size - 2) + bytes([value, value])
+
+
+@pytest.fixture(scope="module")
+def fastpath_corpus(corpus):
+    return [payload for payload in corpus if Opcode.unpack(payload)[0] in FASTPATHS]
+
+
+def outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as ex:
+        return type(ex)
+
+
+def build_into(access_message, obj):
+    buffer = bytearray(b"\xff" * 32)
+    length = access_message.build_into(obj, buffer, 1)
+    assert len(buffer) == 32
+    return bytes(buffer[1 : 1 + length])
+
+
+def assert_parse(encoded, build=True):
+    expected = outcome(Construct.parse, encoded)
+    decoded = outcome(AccessMessage.parse, encoded)
+
+    assert decoded == expected
+    assert repr(decoded) == repr(expected)
+
+    if isinstance(expected, dict):
+        _opcode, name = expected
+        assert list(decoded.items()) == list(expected.items())
+        assert list(decoded[name].items()) == list(expected[name].items())
+        if build:
+            assert AccessMessage.build(expected) == Construct.build(expected)
+
+
+def test_fastpath_tables():
+    adapter = OptionalSetParameters.transition_time.subcon
+    assert TRANSITION_TIME.decode == tuple(adapter.parse(bytes([i])) for i in range(256))
+    assert REMAINING_TIME.decode == TRANSITION_TIME.decode
+    assert DELAY.decode == tuple(OptionalSetParameters.delay.parse(bytes([i])) for i in range(256))
+
+    # 0x3F steps is unknown, which is allowed in remaining time only
+    assert 0x3F not in TRANSITION_TIME.encode.values()
+    assert REMAINING_TIME.encode[REMAINING_TIME.decode[0x3F]] == 0x3F
+
+
+def test_fastpath_corpus(fastpath_corpus):
+    assert fastpath_corpus
+
+    for encoded in fastpath_corpus:
+        decoded = AccessMessage.parse(encoded)
+
+        assert AccessMessage._parse_fast(encoded) is not None, encoded.hex()
+        assert AccessMessage._build_fast(decoded) == encoded, encoded.hex()
+        assert AccessMessage._build_fast_into(decoded, bytearray(len(encoded)), 0) == len(
+            encoded
+        ), encoded.hex()
+        assert build_into(AccessMessage, decoded) == encoded, encoded.hex()
+        assert_parse(encoded)
+
+
+@pytest.mark.parametrize("opcode", FASTPATHS)
+def test_fastpath_exhaustive(opcode):
+    for index, encoded in enumerate(_payloads(opcode)):
+        assert_parse(encoded, build=index % 16 == 0)
+
+
+def test_fastpath_parse_many(fastpath_corpus):
+    assert AccessMessage.parse_list(fastpath_corpus) == Construct.parse_list(fastpath_corpus)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET, params=dict(onoff=1, tid=2)),
+        dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET, params=dict(onoff=1, tid=2, transition_time=0.25)),
+        dict(
+            opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET,
+            params=dict(onoff=1, tid=2, transition_time=0.3, delay=0.5),
+        ),
+        dict(
+            opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET,
+            params=dict(onoff=1, tid=2, transition_time=1e6, delay=0),
+        ),
+        dict(
+            opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET,
+            params=dict(onoff=1, tid=2, transition_time=None, delay=0),
+        ),
+        dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET, params=dict(onoff=256, tid=2)),
+        dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_SET, params=dict(optional=dict(onoff=1, tid=2))),
+        dict(opcode="generic_onoff_set", params=dict(onoff=1, tid=2)),
+        dict(opcode=0x8202, generic_onoff_set=dict(onoff=1, tid=2, transition_time=6.3, delay=1.275)),
+        dict(opcode=GenericLevelOpcode.GENERIC_LEVEL_STATUS, params=dict(present_level=-40000)),
+        dict(
+            opcode=GenericLevelOpcode.GENERIC_LEVEL_STATUS, params=dict(present_level=-1, target_level=40000)
+        ),
+        dict(
+            opcode=LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS,
+            params=dict(present_lightness=1, target_lightness=2, remaining_time=37800),
+        ),
+        dict(
+            opcode=LightLightnessOpcode.LIGHT_LIGHTNESS_SET,
+            params=dict(lightness=1, tid=2, transition_time=37800),
+        ),
+    ],
+)
+def test_fastpath_build_params(obj):
+    assert outcome(AccessMessage.build, dict(obj)) == outcome(Construct.build, dict(obj))
+    assert outcome(build_into, AccessMessage, dict(obj)) == outcome(build_into, Construct, dict(obj))
@@ -159,3 +159,11 @@ valid = [
 @pytest.mark.parametrize("encoded,opcode,data", valid)
 def test_parse_valid(encoded, opcode, data):
     assert GenericPropertyMessage.parse(encoded).params == data
+
+
+def test_parse_property_value_alias():
+    first = GenericPropertyMessage.parse(b"\x4c\x8c\x00\x05").params
+    second = GenericPropertyMessage.parse(b"\x4e\x8c\x00\x01\x05").params
+    assert first.property_value == first.light_distribution
+    assert first["property_value"] == first["light_distribution"]
+    assert type(first) is type(second)
@@ -19,6 +19,10 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 #
 #
+import math
+import random
+from functools import partial
+
 import pytest
 
 from bluetooth_mesh.messages.generic.onoff import *
@@ -149,3 +153,46 @@ def test_parse_valid(encoded, opcode, data):
 @pytest.mark.parametrize("encoded,opcode,data", valid)
 def test_build_valid(encoded, opcode, data):
     assert GenericOnOffMessage.build(dict(opcode=opcode, params=data)) == encoded
+
+
+def _encode(encode, value):
+    try:
+        return encode(value)
+    except Exception as ex:
+        return type(ex)
+
+
+@pytest.mark.parametrize("allow_unknown", [False, True])
+def test_transition_time_tables(allow_unknown):
+    adapter = TransitionTimeAdapter(TransitionTime, allow_unknown=allow_unknown)
+
+    for value in range(0x100):
+        resolution, steps = divmod(value, 0x40)
+        assert adapter._decode(dict(resolution=resolution, steps=steps), None, None) == (
+            steps * TransitionTimeAdapter.RESOLUTION[resolution]
+        )
+
+    # durations at which encoding changes, representable durations and a few ulps around each of them
+    values = [-1, -0.05, 0.3, 6.25, 6.26, 6.3, 37800, 37800.5, math.inf, math.nan, True]
+    for duration in adapter.bounds + list(adapter.durations):
+        value = duration
+        for _ in range(3):
+            value = math.nextafter(value, -math.inf)
+        for _ in range(6):
+            values.append(value)
+            value = math.nextafter(value, math.inf)
+
+    rng = random.Random(0)
+    values += [rng.uniform(0, 40000) for _ in range(10000)] + [rng.uniform(0, 7) for _ in range(10000)]
+    values += list(range(0, 38000, 7))
+
+    for value in values:
+        expected = _encode(
+            partial(TransitionTimeAdapter._encode_arithmetic, max_steps=adapter.max_steps), value
+        )
+        assert _encode(partial(adapter._encode, context=None, path=None), value) == expected, value
+
+
+def test_delay_table():
+    for value in range(0x100):
+        assert Delay(Int8ul).parse(bytes([value])) == value / 200
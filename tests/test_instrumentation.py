@@ -0,0 +1,115 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import pytest
+from construct import ConstructError
+
+from bluetooth_mesh.messages import AccessMessage, ParseErrorPolicy, _AccessMessage
+from bluetooth_mesh.messages.config import ConfigOpcode
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.instrumentation import BUILD, PARSE, Instrumentation
+
+onoff_status = bytes.fromhex("8204000102")
+appkey_add = bytes.fromhex("0001020300112233445566778899aabbccddeeff")
+
+
+@pytest.fixture(scope="module")
+def access_message():
+    return _AccessMessage(instrumentation=Instrumentation())
+
+
+@pytest.fixture
+def instrumentation(access_message):
+    access_message.instrumentation.reset()
+    return access_message.instrumentation
+
+
+def test_disabled():
+    assert AccessMessage.instrumentation is None
+
+
+def test_parse(access_message, instrumentation):
+    message = access_message.parse(onoff_status)
+    access_message.parse(bytearray(appkey_add), 0, len(appkey_add))
+    assert list(access_message.parse_many([onoff_status, bytes.fromhex("c0112233")])) == [
+        message,
+        AccessMessage.parse(bytes.fromhex("c0112233")),
+    ]
+
+    stats = instrumentation.snapshot()[PARSE]
+    assert list(stats) == [GenericOnOffOpcode.GENERIC_ONOFF_STATUS, ConfigOpcode.CONFIG_APPKEY_ADD, 0xC01122]
+
+    onoff = stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]
+    assert onoff["count"] == 2
+    assert onoff["errors"] == 0
+    assert onoff["bytes"] == 2 * len(onoff_status)
+    assert 0 < onoff["max_ns"] <= onoff["total_ns"]
+
+    assert stats[ConfigOpcode.CONFIG_APPKEY_ADD]["bytes"] == len(appkey_add)
+
+
+def test_parse_errors(access_message, instrumentation):
+    with pytest.raises(ConstructError):
+        access_message.parse(onoff_status[:2])
+
+    with pytest.raises(ConstructError):
+        access_message.parse(bytes.fromhex("ff"))
+
+    failures = list(access_message.parse_many([onoff_status[:2]], errors=ParseErrorPolicy.RECORD))
+    assert len(failures) == 1
+
+    stats = instrumentation.snapshot()[PARSE]
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["count"] == 2
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["errors"] == 2
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["bytes"] == 0
+    assert stats[None]["errors"] == 1
+
+
+def test_build(access_message, instrumentation):
+    message = AccessMessage.parse(onoff_status)
+    assert access_message.build(message) == onoff_status
+    assert access_message.build(dict(message, opcode="generic_onoff_status")) == onoff_status
+    assert access_message.build_into(AccessMessage.parse(appkey_add), bytearray(32), 1) == len(appkey_add)
+
+    with pytest.raises(KeyError):
+        access_message.build(dict(opcode=GenericOnOffOpcode.GENERIC_ONOFF_STATUS))
+
+    stats = instrumentation.snapshot()[BUILD]
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["count"] == 3
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["errors"] == 1
+    assert stats[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]["bytes"] == 2 * len(onoff_status)
+    assert stats[ConfigOpcode.CONFIG_APPKEY_ADD]["bytes"] == len(appkey_add)
+    assert instrumentation.snapshot()[PARSE] == {}
+
+
+def test_prometheus(access_message, instrumentation):
+    access_message.parse(onoff_status)
+
+    with pytest.raises(ConstructError):
+        access_message.parse(bytes.fromhex("ff"))
+
+    lines = instrumentation.prometheus().splitlines()
+    assert "# TYPE bluetooth_mesh_messages_total counter" in lines
+    assert 'bluetooth_mesh_messages_total{operation="parse",opcode="GENERIC_ONOFF_STATUS"} 1' in lines
+    assert 'bluetooth_mesh_messages_errors_total{operation="parse",opcode="invalid"} 1' in lines
+    assert 'bluetooth_mesh_messages_bytes_total{operation="parse",opcode="GENERIC_ONOFF_STATUS"} 5' in lines
+    assert "# TYPE bluetooth_mesh_messages_seconds_max gauge" in lines
+    assert len([line for line in lines if not line.startswith("#")]) == 5 * 2
@@ -0,0 +1,51 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import pickle
+
+import pytest
+
+from bluetooth_mesh.messages import AccessMessage, _AccessMessage
+
+
+def test_pickle_roundtrip(corpus):
+    for encoded in corpus:
+        decoded = AccessMessage.parse(encoded)
+        unpickled = pickle.loads(pickle.dumps(decoded))
+
+        assert unpickled == decoded, encoded.hex()
+        assert decoded == unpickled, encoded.hex()
+        assert AccessMessage.build(unpickled) == encoded, encoded.hex()
+
+
+def test_pickle_aliased_container():
+    decoded = AccessMessage.parse(b"\x4c\x8c\x00\x05")
+    unpickled = pickle.loads(pickle.dumps(decoded))
+
+    assert type(unpickled.generic_user_property_set) is type(decoded.generic_user_property_set)
+    assert unpickled.generic_user_property_set.property_value == dict(light_distribution=5)
+
+
+def test_pickle_access_message():
+    assert pickle.loads(pickle.dumps(AccessMessage)) is AccessMessage
+
+    with pytest.raises(TypeError):
+        pickle.dumps(_AccessMessage())
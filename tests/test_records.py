@@ -0,0 +1,112 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import pickle
+
+import pytest
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.messages.config import ConfigOpcode
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.records import MessageRecord, Record, UnknownMessage, field_names, message_class
+
+onoff_status = bytes.fromhex("8204000102")
+onoff_status_short = bytes.fromhex("820401")
+
+
+def test_message_class():
+    cls = message_class(GenericOnOffOpcode.GENERIC_ONOFF_STATUS)
+
+    assert cls.__name__ == "GenericOnOffStatus"
+    assert cls.FIELDS == ("present_onoff", "target_onoff", "remaining_time")
+    assert cls.__slots__ == cls.FIELDS
+    assert message_class(GenericOnOffOpcode.GENERIC_ONOFF_STATUS) is cls
+
+
+def test_field_names():
+    params = AccessMessage.OPCODES[ConfigOpcode].switch.cases[ConfigOpcode.CONFIG_APPKEY_ADD]
+    assert field_names(params) == ["app_key_index", "net_key_index", "app_key"]
+
+
+def test_parse():
+    message = AccessMessage.parse(onoff_status, records=True)
+
+    assert isinstance(message, MessageRecord)
+    assert type(message) is message_class(GenericOnOffOpcode.GENERIC_ONOFF_STATUS)
+    assert message.OPCODE == GenericOnOffOpcode.GENERIC_ONOFF_STATUS
+    assert message.present_onoff == 0
+    assert message.target_onoff == 1
+    assert message.remaining_time == 0.2
+    assert not hasattr(message, "__dict__")
+    assert repr(message) == "GenericOnOffStatus(present_onoff=0, target_onoff=1, remaining_time=0.2)"
+
+
+def test_parse_missing_fields():
+    message = AccessMessage.parse(onoff_status_short, records=True)
+
+    assert message.present_onoff == 1
+    with pytest.raises(AttributeError):
+        message.target_onoff  # noqa: B018
+
+    assert message.asdict() == dict(
+        opcode=GenericOnOffOpcode.GENERIC_ONOFF_STATUS, generic_onoff_status=dict(present_onoff=1)
+    )
+
+
+def test_parse_many():
+    assert list(AccessMessage.parse_many([onoff_status, onoff_status_short], records=True)) == [
+        AccessMessage.parse(onoff_status, records=True),
+        AccessMessage.parse(onoff_status_short, records=True),
+    ]
+
+
+def test_nested():
+    message = AccessMessage.parse(bytes.fromhex("f536010b01020304"), records=True)
+
+    assert type(message).__name__ == "SilvairDebug"
+    assert isinstance(message.uptime_status, Record)
+    assert message.asdict() == AccessMessage.parse(bytes.fromhex("f536010b01020304"))
+
+
+def test_unknown_opcode():
+    message = AccessMessage.parse(bytes.fromhex("c0112233"), records=True)
+
+    assert message == UnknownMessage(opcode=0xC01122, params=b"\x33")
+    assert AccessMessage.build(message.asdict()) == bytes.fromhex("c0112233")
+
+
+def test_equality():
+    message = AccessMessage.parse(onoff_status, records=True)
+
+    assert message == AccessMessage.parse(onoff_status, records=True)
+    assert message != AccessMessage.parse(onoff_status_short, records=True)
+    assert message != AccessMessage.parse(bytes.fromhex("8204010102"), records=True)
+    assert message != AccessMessage.parse(onoff_status)
+
+
+def test_corpus(corpus):
+    for payload in corpus:
+        message = AccessMessage.parse(payload, records=True)
+
+        assert isinstance(message, Record), payload.hex()
+        assert message.asdict() == AccessMessage.parse(payload), payload.hex()
+        assert AccessMessage.build(message.asdict()) == payload, payload.hex()
+        assert pickle.loads(pickle.dumps(message)) == message, payload.hex()
@@ -0,0 +1,73 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import pytest
+
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.router import Router
+from bluetooth_mesh.messages.sensor import SensorOpcode
+from bluetooth_mesh.messages.silvair.debug import DebugOpcode, DebugSubOpcode
+
+
+@pytest.fixture
+def router():
+    router = Router(default=lambda data, header: "default")
+    router.register(GenericOnOffOpcode.GENERIC_ONOFF_STATUS, lambda data, header: "onoff status")
+    router.register(GenericOnOffOpcode, lambda data, header: "onoff")
+    router.register(SensorOpcode, lambda data, header: "sensor")
+    router.register(DebugSubOpcode.UPTIME_STATUS, lambda data, header: "uptime status")
+    router.register(0xC01122, lambda data, header: "unknown")
+    return router
+
+
+@pytest.mark.parametrize(
+    "encoded,expected",
+    [
+        pytest.param(bytes.fromhex("820400"), "onoff status", id="opcode"),
+        pytest.param(bytes.fromhex("820201"), "onoff", id="model"),
+        pytest.param(bytes.fromhex("8231"), "sensor", id="other model"),
+        pytest.param(bytes.fromhex("f536010b01020304"), "uptime status", id="sub-opcode"),
+        pytest.param(bytes.fromhex("f536010a"), "default", id="other sub-opcode"),
+        pytest.param(bytes.fromhex("c0112233"), "unknown", id="unknown opcode"),
+        pytest.param(bytes.fromhex("8003000102110000"), "default", id="default"),
+    ],
+)
+def test_dispatch(router, encoded, expected):
+    assert router.dispatch(encoded) == expected
+
+
+def test_dispatch_header():
+    router = Router()
+
+    @router.route(DebugOpcode.SILVAIR_DEBUG)
+    def handler(data, header):
+        return data[header.offset :], header.subopcode
+
+    assert router.dispatch(bytes.fromhex("f536010b01020304")) == (
+        bytes.fromhex("0b01020304"),
+        DebugSubOpcode.UPTIME_STATUS,
+    )
+    assert router.dispatch(bytes.fromhex("820400")) is None
+
+
+def test_register_invalid():
+    with pytest.raises(TypeError):
+        Router().register("GENERIC_ONOFF_STATUS", print)
@@ -19,12 +19,14 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 #
 #
+import math
+import random
 import sys
 from datetime import date
 
 import pytest
 
-from bluetooth_mesh.messages.properties import PropertyID
+from bluetooth_mesh.messages.properties import PropertyID, TimeExponential8
 from bluetooth_mesh.messages.sensor import (
     SensorMessage,
     SensorOpcode,
@@ -777,6 +779,13 @@ def test_parse_sensor_setting_raw():
     assert sensor_status.sensor_setting_raw == sensor_status.present_input_current
 
 
+def test_parse_sensor_setting_raw_shared_container():
+    first = SensorMessage.parse(b"\x52\xe2\x0a\xc8\x00").params[0]
+    second = SensorMessage.parse(b"\x52\xe2\x0a\x64\x00").params[0]
+    assert type(first) is type(second)
+    assert second.sensor_setting_raw == dict(current=1.0)
+
+
 def test_build_sensor_setting_raw():
     encoded = SensorMessage.build(
         dict(
@@ -792,3 +801,33 @@ def test_build_sensor_setting_raw():
         )
     )
     assert encoded == b"\x52\xe2\x0a\xc8\x00"
+
+
+def test_time_exponential_8_tables():
+    adapter = TimeExponential8.seconds.subcon
+
+    for encoded in range(0x100):
+        decoded = TimeExponential8.parse(bytes([encoded]))
+        assert decoded.seconds == (round(math.pow(1.1, encoded - 64), 4) if encoded else 0)
+        assert TimeExponential8.build(decoded) == bytes([encoded])
+
+    values = [0, None, *range(0x20000)]
+    for bound in adapter.BOUNDS + adapter.SECONDS:
+        value = bound
+        for _ in range(3):
+            value = math.nextafter(value, -math.inf)
+        for _ in range(6):
+            values.append(value)
+            value = math.nextafter(value, math.inf)
+
+    rng = random.Random(0)
+    values += [1.1 ** rng.uniform(-70, 200) for _ in range(10000)]
+
+    for value in values:
+        try:
+            expected = adapter._encode_arithmetic(value)
+        except ValueError:
+            with pytest.raises(ValueError):
+                adapter._encode(value, None, None)
+        else:
+            assert adapter._encode(value, None, None) == expected, value
@@ -0,0 +1,196 @@
+#
+# python-bluetooth-mesh - Bluetooth Mesh for Python
+#
+# Copyright (C) 2026  SILVAIR sp. z o.o.
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+#
+import asyncio
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from construct import ConstructError
+
+from bluetooth_mesh.messages import AccessMessage, ParseErrorPolicy, ParseFailure, _AccessMessage
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.instrumentation import PARSE, Instrumentation
+from bluetooth_mesh.messages.stream import PayloadReader
+
+invalid = [
+    bytes.fromhex("8204"),
+    bytes.fromhex("ff"),
+]
+
+
+class Transport(asyncio.ReadTransport):
+    """
+    Stand-in for a socket transport, recording whether StreamReader asked it to stop reading.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.paused = False
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+
+def frames(payloads):
+    return b"".join(struct.pack("<H", len(payload)) + payload for payload in payloads)
+
+
+def stream(data, limit=2**16):
+    reader = asyncio.StreamReader(limit)
+    reader.set_transport(Transport())
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def collect(payload_reader):
+    async with payload_reader:
+        return [frame async for frame in payload_reader]
+
+
+def read(data, **kwargs):
+    async def run():
+        payload_reader = PayloadReader(stream(data), **kwargs)
+        return payload_reader, await collect(payload_reader)
+
+    return asyncio.run(run())
+
+
+def test_reader(corpus):
+    async def feed(reader, data):
+        for start in range(0, len(data), 7):
+            reader.feed_data(data[start : start + 7])
+            await asyncio.sleep(0)
+
+        reader.feed_eof()
+
+    async def run():
+        reader = asyncio.StreamReader()
+        feeder = asyncio.create_task(feed(reader, frames(corpus)))
+        payload_reader = PayloadReader(reader, offload_threshold=len(corpus))
+        result = await collect(payload_reader)
+        await feeder
+        return payload_reader, result
+
+    payload_reader, result = asyncio.run(run())
+
+    assert [frame.payload for frame in result] == corpus
+    assert [frame.header for frame in result] == [AccessMessage.peek(payload) for payload in corpus]
+    assert [frame.message for frame in result] == AccessMessage.parse_list(corpus)
+    assert payload_reader.received == len(corpus)
+    assert payload_reader.offloaded == 0
+
+
+def test_reader_offload(corpus):
+    with ThreadPoolExecutor(2) as executor:
+        payload_reader, result = read(frames(corpus), executor=executor, offload_threshold=0, batch_size=16)
+
+    assert [frame.message for frame in result] == AccessMessage.parse_list(corpus)
+    assert payload_reader.offloaded == len(corpus)
+
+
+def test_reader_backpressure():
+    payloads = [bytes.fromhex("8204000102")] * 200
+
+    async def run():
+        reader = stream(frames(payloads), limit=64)
+        assert reader._transport.paused
+
+        payload_reader = PayloadReader(reader, max_pending=8)
+        async with payload_reader:
+            await anext(payload_reader)
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            # reading stops until the consumer catches up
+            assert payload_reader.received + payload_reader._pending.qsize() <= 10
+            assert reader._transport.paused
+
+            assert len([frame async for frame in payload_reader]) == len(payloads) - 1
+            assert not reader._transport.paused
+
+    asyncio.run(run())
+
+
+def test_reader_models():
+    payloads = [bytes.fromhex("8204000102"), bytes.fromhex("8231")]
+    _, result = read(frames(payloads), models=[GenericOnOffOpcode])
+
+    assert result[0].message == AccessMessage.parse(payloads[0])
+    assert result[1].header == AccessMessage.peek(payloads[1])
+    assert result[1].message is None
+
+
+@pytest.mark.parametrize("offload_threshold", [0, 1024])
+def test_reader_access_message(offload_threshold):
+    payloads = [bytes.fromhex("8204000102"), bytes.fromhex("82310200")]
+    access_message = _AccessMessage(instrumentation=Instrumentation())
+    _, result = read(frames(payloads), access_message=access_message, offload_threshold=offload_threshold)
+
+    assert [frame.message for frame in result] == AccessMessage.parse_list(payloads)
+    assert sum(stats["count"] for stats in access_message.instrumentation.snapshot()[PARSE].values()) == 2
+
+
+def test_reader_process_executor():
+    payloads = [bytes.fromhex("8204000102"), bytes.fromhex("82310200")]
+    with ProcessPoolExecutor(1) as executor:
+        payload_reader, result = read(frames(payloads), executor=executor, offload_threshold=0)
+
+    assert [frame.message for frame in result] == AccessMessage.parse_list(payloads)
+    assert payload_reader.offloaded == len(payloads)
+
+
+@pytest.mark.parametrize("offload_threshold", [0, 1024])
+def test_reader_errors(offload_threshold):
+    payloads = [bytes.fromhex("8204000102"), *invalid, bytes.fromhex("820400")]
+
+    def run(errors):
+        _, result = read(frames(payloads), errors=errors, offload_threshold=offload_threshold)
+        return result
+
+    with pytest.raises(ConstructError):
+        run(ParseErrorPolicy.RAISE)
+
+    assert [frame.payload for frame in run(ParseErrorPolicy.SKIP)] == [payloads[0], payloads[3]]
+
+    result = run(ParseErrorPolicy.RECORD)
+    assert [frame.payload for frame in result] == payloads
+    assert [frame.message.index for frame in result[1:3]] == [1, 2]
+    assert all(isinstance(frame.message, ParseFailure) for frame in result[1:3])
+
+
+def test_reader_incomplete():
+    data = frames([bytes.fromhex("8204000102"), bytes.fromhex("820400")])[:-1]
+
+    async def run():
+        frames = []
+        async with PayloadReader(stream(data)) as payload_reader:
+            with pytest.raises(asyncio.IncompleteReadError):
+                async for frame in payload_reader:
+                    frames.append(frame)
+
+        return frames
+
+    assert len(asyncio.run(run())) == 1
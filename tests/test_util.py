@@ -19,12 +19,42 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 #
 #
+import io
+import math
+import pickle
+import random
 from itertools import chain
 
 import pytest
+from construct import (
+    BitsInteger,
+    BitStruct,
+    GreedyBytes,
+    Int8ul,
+    Padding,
+    Select,
+    SelectError,
+    StreamError,
+    Struct,
+    ValidationError,
+    this,
+)
 
 from bluetooth_mesh.messages import AccessMessage
-from bluetooth_mesh.messages.util import camelcase, snakecase
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffSet
+from bluetooth_mesh.messages.util import (
+    BitFields,
+    BufferStream,
+    BytesView,
+    GreedyBytesView,
+    LogAdapter,
+    NamedSelect,
+    RangeValidator,
+    Reversed,
+    camelcase,
+    snakecase,
+    strip_validators,
+)
 
 valid = [
     # fmt: off
@@ -39,3 +69,219 @@ valid = [
 @pytest.mark.parametrize("opcode", valid)
 def test_opcode_name_same_after_case_conversion(opcode):
     assert opcode == snakecase(camelcase(opcode))
+
+
+class UnseekableStream(io.RawIOBase):
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.data.readinto(buffer)
+
+    def tell(self):
+        return self.data.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("seek")
+        return self.data.seek(offset, whence)
+
+
+# fmt: off
+named_select = [
+    pytest.param(b'\x01\x22', "minimal", dict(onoff=1, tid=0x22), id="minimal"),
+    pytest.param(b'\x00\x31\x32\x3c', "optional", dict(onoff=0, tid=0x31, transition_time=5, delay=0.3), id="optional"),
+    pytest.param(b'\x00\x31\x32\x3c\xff', "optional", dict(onoff=0, tid=0x31, transition_time=5, delay=0.3), id="trailing"),
+]
+# fmt: on
+
+
+def test_named_select_sizes():
+    assert GenericOnOffSet.sizes == [4, 2]
+
+
+@pytest.mark.parametrize("encoded, name, params", named_select)
+def test_named_select_parse(encoded, name, params):
+    decoded = GenericOnOffSet.parse(encoded)
+    assert decoded._name == name
+    assert decoded == params
+
+
+@pytest.mark.parametrize("encoded, name, params", named_select)
+def test_named_select_parse_unknown_length(encoded, name, params):
+    decoded = GenericOnOffSet.parse_stream(UnseekableStream(encoded))
+    assert decoded._name == name
+    assert decoded == params
+
+
+def test_named_select_parse_too_short():
+    with pytest.raises(SelectError):
+        GenericOnOffSet.parse(b"\x01")
+
+
+def test_named_select_variable_length():
+    select = NamedSelect(
+        prefixed=Struct("length" / Int8ul, "data" / GreedyBytes),
+        empty=Struct(),
+    )
+    assert select.sizes == [None, 0]
+    assert select.parse(b"").get("_name") == "empty"
+    assert select.parse(b"\x01\x02")._name == "prefixed"
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as ex:
+        return type(ex)
+
+
+@pytest.mark.parametrize(
+    "max_value, infinity",
+    [
+        (0x10, False),
+        (0x10, True),
+        (0x11, False),
+        (0x11, True),
+        (None, False),
+    ],
+)
+def test_log_adapter_tables(max_value, infinity):
+    adapter = LogAdapter(Int8ul, max_value=max_value, infinity=infinity)
+
+    for encoded in range(0x100):
+        decoded = _outcome(adapter.parse, bytes([encoded]))
+        assert decoded == _outcome(adapter._decode_arithmetic, encoded)
+
+        if not isinstance(decoded, type):
+            assert adapter.build(decoded) == bytes([encoded])
+
+    values = [-1, 0, 0.5, 0.2, math.inf, math.nan, True, *range(0x20000)]
+    for bound in adapter.bounds:
+        value = bound
+        for _ in range(3):
+            value = math.nextafter(value, -math.inf)
+        for _ in range(6):
+            values.append(value)
+            value = math.nextafter(value, math.inf)
+
+    rng = random.Random(0)
+    values += [2 ** rng.uniform(0, 60) for _ in range(10000)]
+
+    for value in values:
+        assert _outcome(adapter._encode, value, None, None) == _outcome(
+            adapter._encode_arithmetic, value
+        ), value
+
+
+def _bit_structs():
+    from bluetooth_mesh.messages.config import AppKeyIndex, ConfigModelPublicationSet, NetAndAppKeyIndex
+    from bluetooth_mesh.messages.properties import Appearance
+    from bluetooth_mesh.messages.time import TAI_UTC_DeltaPaddedField, TimeOptional
+
+    yield from (NetAndAppKeyIndex[0], AppKeyIndex[0], TAI_UTC_DeltaPaddedField("tai_utc_delta")[0])
+
+    for struct in (ConfigModelPublicationSet, TimeOptional, Appearance):
+        yield next(subcon for subcon in struct.subcons if subcon.name == "_")
+
+
+def _fields(obj):
+    return [(key, repr(value)) for key, value in obj.items() if not key.startswith("_")]
+
+
+@pytest.mark.parametrize("rebuild", list(_bit_structs()))
+def test_bit_fields(rebuild):
+    bit_fields = rebuild.subcon.subcon
+    assert isinstance(bit_fields, BitFields)
+
+    bit_struct = Reversed(BitStruct(*bit_fields.fields))
+    assert bit_fields.sizeof() == bit_struct.sizeof()
+
+    rng = random.Random(0)
+    bits = bit_fields.sizeof() * 8
+    values = [
+        0,
+        (1 << bits) - 1,
+        *(1 << bit for bit in range(bits)),
+        *(rng.getrandbits(bits) for _ in range(2000)),
+    ]
+
+    for value in values:
+        data = value.to_bytes(bit_fields.sizeof(), "little")
+        obj = bit_fields.parse(data)
+        assert _fields(obj) == _fields(bit_struct.parse(data))
+        # padding is always built as zeros
+        assert bit_fields.build(obj) == bit_struct.build(obj)
+        assert _fields(bit_fields.parse(bit_fields.build(obj))) == _fields(obj)
+
+    with pytest.raises(StreamError):
+        bit_fields.parse(bytes(bit_fields.sizeof() - 1))
+
+    for name, *_ in bit_fields.layout:
+        for invalid in (-1, "1", None):
+            obj = dict(bit_fields.parse(bytes(bit_fields.sizeof())), **{name: invalid})
+            assert _outcome(bit_fields.build, obj) == _outcome(bit_struct.build, obj)
+
+
+def test_bit_fields_unsupported():
+    assert not BitFields.supports(["a" / BitsInteger(7)])
+    assert not BitFields.supports([BitsInteger(8)])
+    assert not BitFields.supports(["a" / BitsInteger(8, swapped=True)])
+    assert BitFields.supports([Padding(4), "a" / BitsInteger(12)])
+
+
+def test_strip_validators():
+    value = RangeValidator(Int8ul, max_value=0x7F)
+    select = Select(value, Int8ul)
+    named_select = NamedSelect(long=Struct("a" / value, "b" / Int8ul), short=Struct("a" / value))
+    message = Struct("value" / value, "select" / select, "named_select" / named_select, "trailer" / Int8ul)
+
+    stripped = strip_validators(message)
+    assert stripped.subcons[1].subcon is select
+    assert stripped.subcons[3] is message.subcons[3]
+    assert strip_validators(Int8ul) is Int8ul
+
+    with pytest.raises(ValidationError):
+        message.parse(bytes.fromhex("80 01 0203 04"))
+
+    assert stripped.parse(bytes.fromhex("80 01 8003 04")) == dict(
+        value=0x80, select=0x01, named_select=dict(a=0x80, b=0x03), trailer=0x04
+    )
+
+    # validation failures still make Select try the next alternative
+    assert stripped.parse(bytes.fromhex("01 80 0203 04")).select == 0x80
+
+
+def test_bytes_view():
+    message = Struct(
+        "key" / BytesView(2), "length" / Int8ul, "data" / BytesView(this.length), "rest" / GreedyBytesView
+    )
+    compiled = message.compile()
+    buffer = bytearray.fromhex("0102 02 0304 0506")
+
+    for con in (message, compiled):
+        assert con.parse(buffer) == dict(key=b"\x01\x02", length=2, data=b"\x03\x04", rest=b"\x05\x06")
+        assert type(con.parse(buffer).key) is bytes
+
+        parsed = con.parse_stream(BufferStream(memoryview(buffer)), memoryview=True)
+        assert all(isinstance(parsed[name], memoryview) for name in ("key", "data", "rest"))
+        assert parsed == dict(key=b"\x01\x02", length=2, data=b"\x03\x04", rest=b"\x05\x06")
+        assert message.build(parsed) == buffer
+
+        with pytest.raises(StreamError):
+            con.parse_stream(BufferStream(memoryview(buffer)[:4]), memoryview=True)
+
+    stream = BufferStream(memoryview(buffer), 1)
+    assert stream.read(2) == b"\x02\x02"
+    assert stream.readview(1) == b"\x03"
+    assert stream.seek(0, io.SEEK_END) == len(buffer)
+    assert stream.read() == b""
+
+    stream.reset(memoryview(b"\x07\x08"), 1)
+    assert stream.read() == b"\x08"
+
+    stream = pickle.loads(pickle.dumps(BufferStream(memoryview(buffer), 4)))
+    assert stream.read() == b"\x04\x05\x06"